@@ -1,6 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FixedLocator, FuncFormatter
+from visualization.plots import LineDecimator
 # Frecuencia lineal (10 a 1000 Hz)
 f = np.linspace(1, 20000, pow(2, 16))
 w = 2 * np.pi * f
@@ -317,4 +318,9 @@ plt.xlabel("Tiempo (ms)")
 plt.xlim(0, 45)
 plt.grid(True, which='both', linestyle='--')
 plt.tight_layout()
+#Reducción LOD: las curvas de 2^16 puntos y la respuesta al escalón de 2^17 se dibujan con ~2 puntos por píxel
+#y se recalculan al hacer zoom (las referencias deben vivir hasta cerrar las ventanas)
+lods = [LineDecimator(plt.figure(num)) for num in plt.get_fignums()]
+for lod in lods:
+    lod.refresh()
 plt.show()
\ No newline at end of file
@@ -6,6 +6,7 @@
 
 import numpy as np                                                      # Importa numpy para cálculos matemáticos complejos
 import matplotlib.pyplot as plt                                         # Importa matplotlib para visualización de resultados
+from visualization.plots import LineDecimator                           # Importa la reducción LOD de líneas
 
 #====================================================================================================================================
 #====================================================================================================================================
@@ -922,6 +923,8 @@ fig.text(0.5, 0.02, info_text, fontsize=9, ha='center',
 # CONFIGURACIÓN FINAL DE LA VISUALIZACIÓN
 plt.tight_layout()
 plt.subplots_adjust(top=0.90, bottom=0.08)
+lod = LineDecimator(fig)  # 65536 puntos por línea: se dibujan ~2 por píxel y se recalculan al hacer zoom
+lod.refresh()
 plt.show()
 
 #====================================================================================================================================
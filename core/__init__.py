@@ -0,0 +1,36 @@
+# --------------------------------------------
+# core/__init__.py
+# Punto de entrada sin interfaz del modelo. `import core` solo carga numpy: las clases principales se
+# exponen aquí de forma diferida (PEP 562) y cada submódulo se importa la primera vez que se usa.
+# --------------------------------------------
+
+import importlib                                                        # Importa importlib para la carga diferida
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+# Nombre público → submódulo que lo define
+_LAZY = {
+    "Driver": "core.driver",
+    "SealedBox": "core.sealed",
+    "BassReflexBox": "core.bassreflex",
+    "RadiationImpedance": "core.zrad",
+    "System": "core.system",
+    "SimulationCancelled": "core.simulation",
+    "simulate_driver": "core.simulation",
+    "simulate_design": "core.simulation",
+    "simulate_family": "core.simulation",
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module 'core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value                                             # Las siguientes consultas no pasan por aquí
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
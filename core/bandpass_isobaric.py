@@ -140,4 +140,32 @@ class BandpassIsobaricBox:
         Ca = Vab / (ρ0 * c0**2)  # Compliance acústica
         Za = 1 / (1j * w * Ca)   # Impedancia acústica
         
-        return Za
\ No newline at end of file
+        return Za
+
+    def add_to_circuit(self, circuit, node, prefix=""):
+        # Netlist acústico de 4º orden: cámara trasera sellada en serie con la cámara frontal y su puerto.
+        # El caudal del cono entra en la cámara trasera y sale de la frontal, por eso ambas cargas van en serie.
+        p = self.p
+        ρ0 = p['rho0']
+        c0 = p['c0']
+        Sp = np.pi * (p['dp'] / 2)**2                                   # Área del puerto
+        Leff = p['Lp'] + 0.85 * np.sqrt(Sp / np.pi)                     # Longitud efectiva con corrección de terminación
+        circuit.add_capacitor(prefix + "Cab", node, prefix + "front", p['Vab'] / (ρ0 * c0**2))      # Cámara trasera
+        circuit.add_capacitor(prefix + "Caf", prefix + "front", "0", p['Vf'] / (ρ0 * c0**2))       # Cámara frontal
+        circuit.add_resistor(prefix + "Rap", prefix + "front", prefix + "port", ρ0 * c0 * 0.02 / Sp)
+        circuit.add_inductor(prefix + "Map", prefix + "port", "0", ρ0 * Leff / Sp)                  # Masa del puerto
+        return circuit
+
+    def rational_load(self):
+        # Polinomios en s de la carga Za = Na / Da (cámara trasera en serie con frontal || puerto) y numerador
+        # No de la salida radiada. Solo radia el puerto: Q_puerto / Q_cono = 1 / D1 = s·Cab / Da.
+        p = self.p
+        ρ0 = p['rho0']
+        c0 = p['c0']
+        Sp = np.pi * (p['dp'] / 2)**2
+        Leff = p['Lp'] + 0.85 * np.sqrt(Sp / np.pi)
+        Cab, Caf = p['Vab'] / (ρ0 * c0**2), p['Vf'] / (ρ0 * c0**2)
+        Map, Rap = ρ0 * Leff / Sp, ρ0 * c0 * 0.02 / Sp
+        D1 = np.array([Caf * Map, Caf * Rap, 1.0])                      # Denominador de Zaf || Zap
+        num = np.polyadd(D1, Cab * np.array([Map, Rap, 0.0]))           # Za = 1/(s·Cab) + (Map·s + Rap)/D1
+        return num, Cab * np.append(D1, 0.0), np.array([Cab, 0.0])
@@ -1,8 +1,12 @@
 from core.enclosure import Enclosure                                      # Importa clase base Enclosure
+from core import transfer_matrix as tm                                  # Importa matrices de transferencia (modelo distribuido)
 import numpy as np                                                      # Importa numpy para cálculos matemáticos
 
 class BassReflexBox(Enclosure):
-    def __init__(self, Vb_m3, rho0, c, zrad, area_port=None, length_port=None):
+    def __init__(self, Vb_m3, rho0, c, zrad, area_port=None, length_port=None, port_model="lumped"):
+        if port_model not in ("lumped", "distributed"):
+            raise ValueError("port_model debe ser 'lumped' o 'distributed'.")
+        self.port_model = port_model                                    # Masa concentrada o línea de transmisión
         self.Vb_m3 = Vb_m3
         self.rho0 = rho0
         self.c = c
@@ -28,10 +32,47 @@ class BassReflexBox(Enclosure):
         Map = self.rho0 * self.Leff / self.area_port
         self.fp = 1 / (2 * np.pi * np.sqrt(Map * Cab))
 
+    def port_response(self, f):
+        """
+        Modelo distribuido del puerto: tubo uniforme con pérdidas de capa límite (viscosas y térmicas),
+        corrección de extremo interior de core.zrad y radiación exterior de pistón en baffle.
+        Reproduce las resonancias de tubo (≈ n·c / 2·Leff) que el modelo de masa concentrada no tiene.
+
+        Args:
+            f: Frecuencias en Hz (array)
+
+        Returns:
+            (Zap, ratio): impedancia acústica del puerto vista desde la caja y relación U_salida / U_entrada
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        w = 2 * np.pi * f
+        Sp = self.area_port
+        a = np.sqrt(Sp / np.pi)                                         # Radio equivalente (hidráulico)
+
+        # Pérdidas de capa límite (Kirchhoff): ν viscosidad cinemática, Pr número de Prandtl
+        nu, Pr, gamma = 1.5e-5, 0.71, 1.4
+        eps_v = (1 - 1j) * np.sqrt(2 * nu / w) / a                      # Término viscoso (impedancia serie)
+        eps_t = (gamma - 1) * (1 - 1j) * np.sqrt(2 * nu / (Pr * w)) / a # Término térmico (admitancia paralela)
+        k = w / self.c * np.sqrt((1 + eps_v) * (1 + eps_t))
+        Zc = self.rho0 * self.c / Sp * np.sqrt((1 + eps_v) / (1 + eps_t))
+
+        Z_out = self.zrad.baffled_piston(f, Sp) / Sp**2                 # Radiación del extremo exterior
+        Z_in = 1j * w * self.rho0 * self.zrad.end_correction(Sp) / Sp   # Masa del extremo interior
+        A, B, C, D = tm.segment_elements(k, Zc, self.length_port)
+        return Z_in + (A * Z_out + B) / (C * Z_out + D), 1 / (C * Z_out + D)
+
     def acoustic_load(self, f, Sd):
         # Impedancia mecánica trasera del bass-reflex.
         # Modelo correcto que produce comportamiento diferenciado.
         w = 2 * np.pi * f                                               # Frecuencia angular en rad/s
+
+        if self.port_model == "distributed":
+            # Caja y puerto distribuido en paralelo acústico, llevados al diafragma
+            f_was_scalar = np.isscalar(f)
+            Zab = 1 / (1j * w * self.Vb_m3 / (self.rho0 * self.c**2))
+            Zap = self.port_response(f)[0]
+            Zm = Zab * Zap / (Zab + Zap) * Sd**2
+            return Zm[0] if f_was_scalar else Zm
         
         Cmb_base = self.Vb_m3 / (self.rho0 * self.c**2 * Sd**2)        # Compliance base de caja sellada
         
@@ -60,4 +101,34 @@ class BassReflexBox(Enclosure):
         
         Za_mechanical = 1 / (1j * w * Cmb_effective)                    # Impedancia mecánica
         
-        return Za_mechanical                                            # Retorna impedancia mecánica del bass-reflex
\ No newline at end of file
+        return Za_mechanical                                            # Retorna impedancia mecánica del bass-reflex
+
+    def add_to_circuit(self, circuit, node, prefix=""):
+        # Netlist acústico del bass-reflex: compliancia Cab en paralelo con la rama del puerto (Rap + Map).
+        Cab = self.Vb_m3 / (self.rho0 * self.c**2)                      # Compliancia acústica de la caja
+        Map = self.rho0 * self.Leff / self.area_port                    # Masa acústica del puerto
+        Rap = self.rho0 * self.c * 0.02 / self.area_port                # Resistencia acústica del puerto (mismo factor que el SPL)
+        circuit.add_capacitor(prefix + "Cab", node, "0", Cab)
+        if self.port_model == "distributed":
+            circuit.add_impedance(prefix + "Port", node, "0", lambda f: self.port_response(f)[0])
+            return circuit
+        circuit.add_resistor(prefix + "Rap", node, prefix + "port", Rap)
+        circuit.add_inductor(prefix + "Map", prefix + "port", "0", Map) # Su corriente es el caudal del puerto
+        return circuit
+
+    def rational_load(self):
+        """
+        Polinomios en s (mayor potencia primero) de la carga acústica trasera y de la salida radiada.
+
+        Za(s) = Zab || Zap = (Map·s + Rap) / (Cab·Map·s² + Cab·Rap·s + 1) = Na / Da
+        El cono y el puerto radian juntos: Q_radiado / Q_cono = Zap / (Zab + Zap) = s·Cab·(Map·s + Rap) / Da
+
+        Returns:
+            (Na, Da, No) con Q_radiado / Q_cono = No / Da
+        """
+        if self.port_model == "distributed":
+            raise ValueError("El puerto distribuido no es una función racional de s; use port_model='lumped'.")
+        Cab = self.Vb_m3 / (self.rho0 * self.c**2)
+        Map = self.rho0 * self.Leff / self.area_port
+        Rap = self.rho0 * self.c * 0.02 / self.area_port
+        return np.array([Map, Rap]), np.array([Cab * Map, Cab * Rap, 1.0]), np.array([Cab * Map, Cab * Rap, 0.0])
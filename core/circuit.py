@@ -0,0 +1,382 @@
+# --------------------------------------------
+# circuit.py
+# Solver de análisis nodal modificado (MNA) para redes concentradas descritas por netlist.
+# Admite elementos R, L, C, impedancias arbitrarias, fuentes, giradores y transformadores, de modo que
+# los dominios eléctrico, mecánico y acústico (analogía de impedancia) conviven en un mismo circuito.
+# Todas las frecuencias (y lotes de valores de componentes) se resuelven con un único np.linalg.solve.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matriciales
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+GROUND = "0"                                                            # Nombre reservado del nodo de referencia
+
+class Circuit:
+    """
+    Netlist de elementos concentrados resuelto por análisis nodal modificado.
+
+    Convenciones:
+        - Tensión (fuerza, presión) entre nodos ↔ esfuerzo del dominio.
+        - Corriente de rama (velocidad, velocidad de volumen) entra por el primer nodo del elemento.
+        - Los valores de los elementos pueden ser escalares o arrays; los ejes extra se tratan como lote
+          y el resultado tiene forma (*lote, F, ...).
+    """
+
+    def __init__(self):
+        self.nodes = [GROUND]                                           # Lista de nodos (el índice 0 es tierra)
+        self.elements = {}                                              # Elementos por nombre, en orden de inserción
+        self._stamps = None                                             # Patrones MNA ensamblados (se invalida al modificar)
+
+#====================================================================================================================================
+
+    def _node(self, name):                                              # Registra un nodo y retorna su índice
+        name = str(name)
+        if name not in self.nodes:
+            self.nodes.append(name)
+        return self.nodes.index(name)
+
+    def _add(self, name, kind, nodes, value, branch=0):                 # Agrega un elemento genérico al netlist
+        if name in self.elements:
+            raise ValueError(f"Ya existe un elemento llamado '{name}'.")
+        self.elements[name] = {
+            "kind": kind,                                               # Tipo de elemento
+            "nodes": [self._node(n) for n in nodes],                    # Índices de los nodos conectados
+            "value": value,                                             # Valor (escalar, array o función de f)
+            "branch": branch,                                           # Cantidad de corrientes auxiliares MNA
+        }
+        self._stamps = None
+        return self
+
+#====================================================================================================================================
+    # ===============================
+    # 1. Elementos de dos terminales
+    # ===============================
+
+    def add_resistor(self, name, n1, n2, R):
+        return self._add(name, "R", (n1, n2), R)                        # Resistencia (eléctrica, mecánica o acústica)
+
+    def add_branch_resistor(self, name, n1, n2, R):
+        # Resistencia con corriente auxiliar (v1 - v2 = R·i): admite R = 0, un cortocircuito exacto.
+        return self._add(name, "RB", (n1, n2), R, branch=1)
+
+    def add_inductor(self, name, n1, n2, L):
+        return self._add(name, "L", (n1, n2), L)                        # Inductancia (masa en analogía de impedancia)
+
+    def add_capacitor(self, name, n1, n2, C):
+        return self._add(name, "C", (n1, n2), C)                        # Capacitancia (compliancia en analogía de impedancia)
+
+    def add_impedance(self, name, n1, n2, Z):
+        # Z puede ser un array ya evaluado en la grilla de frecuencias o una función Z(f).
+        return self._add(name, "Z", (n1, n2), Z)
+
+    def add_voltage_source(self, name, n1, n2, V):
+        return self._add(name, "V", (n1, n2), V, branch=1)              # Fuente de esfuerzo (n1 positivo)
+
+    def add_current_source(self, name, n1, n2, I):
+        return self._add(name, "I", (n1, n2), I)                        # Fuente de flujo de n1 hacia n2 a través de la fuente
+
+#====================================================================================================================================
+    # ===============================
+    # 2. Elementos de dos puertos (acoplamiento entre dominios)
+    # ===============================
+
+    def add_gyrator(self, name, n1, n2, n3, n4, r):
+        # Girador ideal: v1 = -r·i2, v2 = r·i1. Modela el motor Bl (eléctrico ↔ mecánico).
+        return self._add(name, "GY", (n1, n2, n3, n4), r, branch=2)
+
+    def add_transformer(self, name, n1, n2, n3, n4, n):
+        # Transformador ideal: v1 = n·v2, i2 = -n·i1. Modela el área Sd (mecánico ↔ acústico).
+        return self._add(name, "TF", (n1, n2, n3, n4), n, branch=2)
+
+#====================================================================================================================================
+    # ===============================
+    # 3. Ensamblado de patrones MNA
+    # ===============================
+
+    def _assemble(self):
+        # Construye una sola vez los patrones de estampado: A = A0 + Σ coef_k · P_k, b = Σ fuente_k · q_k.
+        if self._stamps is not None:
+            return self._stamps
+
+        n_nodes = len(self.nodes) - 1                                   # Nodos sin contar tierra
+        offsets = {}
+        n = n_nodes
+        for name, el in self.elements.items():                          # Índices de corrientes auxiliares
+            offsets[name] = n
+            n += el["branch"]
+
+        def idx(node):                                                  # Índice de fila/columna (None para tierra)
+            return None if node == 0 else node - 1
+
+        A0 = np.zeros((n, n))                                           # Parte constante (incidencias ±1)
+        patterns = []                                                   # (nombre, matriz patrón) de coeficientes variables
+        sources = []                                                    # (nombre, vector patrón) de excitaciones
+
+        for name, el in self.elements.items():
+            kind = el["kind"]
+            nodes = [idx(k) for k in el["nodes"]]
+
+            if kind in ("R", "L", "C", "Z"):                            # Estampado de admitancia entre a y b
+                a, b = nodes
+                P = np.zeros((n, n))
+                for i, si in ((a, 1), (b, -1)):
+                    for j, sj in ((a, 1), (b, -1)):
+                        if i is not None and j is not None:
+                            P[i, j] += si * sj
+                patterns.append((name, P))
+
+            elif kind == "I":                                           # Fuente de flujo: sale de a, entra en b
+                a, b = nodes
+                q = np.zeros(n)
+                if a is not None:
+                    q[a] -= 1
+                if b is not None:
+                    q[b] += 1
+                sources.append((name, q))
+
+            elif kind == "V":                                           # Fuente de esfuerzo con corriente auxiliar
+                a, b = nodes
+                k = offsets[name]
+                for node, s in ((a, 1), (b, -1)):
+                    if node is not None:
+                        A0[node, k] += s
+                        A0[k, node] += s
+                q = np.zeros(n)
+                q[k] = 1
+                sources.append((name, q))
+
+            elif kind == "RB":                                          # Resistencia en forma de rama: v_a - v_b - R·i = 0
+                a, b = nodes
+                k = offsets[name]
+                for node, s in ((a, 1), (b, -1)):
+                    if node is not None:
+                        A0[node, k] += s
+                        A0[k, node] += s
+                P = np.zeros((n, n))
+                P[k, k] = -1
+                patterns.append((name, P))
+
+            elif kind in ("GY", "TF"):                                  # Dos puertos con dos corrientes auxiliares
+                a, b, c, d = nodes
+                k1, k2 = offsets[name], offsets[name] + 1
+                for node, s, k in ((a, 1, k1), (b, -1, k1), (c, 1, k2), (d, -1, k2)):
+                    if node is not None:
+                        A0[node, k] += s                                # Corrientes en las ecuaciones KCL
+                P = np.zeros((n, n))
+                if kind == "GY":
+                    for node, s in ((a, 1), (b, -1)):                   # v1 + r·i2 = 0
+                        if node is not None:
+                            A0[k1, node] += s
+                    for node, s in ((c, 1), (d, -1)):                   # v2 - r·i1 = 0
+                        if node is not None:
+                            A0[k2, node] += s
+                    P[k1, k2] = 1
+                    P[k2, k1] = -1
+                else:
+                    for node, s in ((a, 1), (b, -1)):                   # v1 - n·v2 = 0
+                        if node is not None:
+                            A0[k1, node] += s
+                    for node, s in ((c, 1), (d, -1)):
+                        if node is not None:
+                            P[k1, node] -= s
+                    A0[k2, k2] = 1                                      # i2 + n·i1 = 0
+                    P[k2, k1] = 1
+                patterns.append((name, P))
+
+        self._stamps = {
+            "size": n,                                                  # Dimensión del sistema MNA
+            "n_nodes": n_nodes,                                         # Cantidad de tensiones nodales
+            "offsets": offsets,                                         # Posición de las corrientes auxiliares
+            "A0": A0,
+            "names": [name for name, _ in patterns],
+            "P": np.array([P for _, P in patterns]).reshape(-1, n, n),  # (K, n, n)
+            "source_names": [name for name, _ in sources],
+            "q": np.array([q for _, q in sources]).reshape(-1, n),      # (S, n)
+        }
+        return self._stamps
+
+#====================================================================================================================================
+    # ===============================
+    # 4. Evaluación de coeficientes
+    # ===============================
+
+    def _evaluate(self, value, f):                                      # Evalúa un valor fijo o dependiente de f
+        if callable(value):
+            return np.asarray(value(f))
+        return np.asarray(value)
+
+    def _coefficient(self, name, f, w):                                 # Coeficiente del patrón (admitancia, Bl o Sd)
+        el = self.elements[name]
+        kind = el["kind"]
+        if kind == "Z":
+            return 1 / self._evaluate(el["value"], f)                   # Impedancia ya definida sobre la grilla
+        value = np.asarray(el["value"])[..., np.newaxis]                # Valores de lote → agrega eje de frecuencia
+        if kind == "R":
+            return 1 / value * np.ones_like(w)
+        if kind == "L":
+            return 1 / (1j * w * value)
+        if kind == "C":
+            return 1j * w * value
+        return value * np.ones_like(w)                                  # Girador, transformador o resistencia de rama
+
+    def _excitation(self, name, f, w):                                  # Valor de una fuente sobre la grilla
+        value = self.elements[name]["value"]
+        if callable(value):
+            return np.asarray(value(f))
+        return np.asarray(value)[..., np.newaxis] * np.ones_like(w)
+
+#====================================================================================================================================
+    # ===============================
+    # 5. Resolución
+    # ===============================
+
+    def solve(self, f):
+        """
+        Resuelve el circuito en todas las frecuencias a la vez.
+
+        Args:
+            f: Frecuencias en Hz (array 1D)
+
+        Returns:
+            CircuitSolution con tensiones nodales y corrientes de rama de forma (*lote, F, ...)
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        if np.any(f <= 0):
+            raise ValueError("La frecuencia debe ser mayor que cero para resolver el circuito.")
+        w = 2 * np.pi * f                                               # Frecuencia angular
+
+        st = self._assemble()
+        n = st["size"]
+
+        coefs = [self._coefficient(name, f, w) for name in st["names"]]
+        excit = [self._excitation(name, f, w) for name in st["source_names"]]
+        shape = np.broadcast_shapes(w.shape, *[c.shape for c in coefs], *[e.shape for e in excit])
+
+        Y = np.empty(shape + (len(coefs),), dtype=complex)              # (*lote, F, K)
+        for k, c in enumerate(coefs):
+            Y[..., k] = c
+        E = np.empty(shape + (len(excit),), dtype=complex)              # (*lote, F, S)
+        for k, e in enumerate(excit):
+            E[..., k] = e
+
+        A = np.einsum("...k,kij->...ij", Y, st["P"]) + st["A0"]         # Pila de matrices (*lote, F, n, n)
+        b = np.einsum("...k,ki->...i", E, st["q"])                      # Pila de vectores (*lote, F, n)
+
+        x = np.linalg.solve(A, b[..., np.newaxis])[..., 0]              # Solución MNA por lotes
+
+        return CircuitSolution(self, f, x, Y)
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class CircuitSolution:
+    # Resultado de Circuit.solve: tensiones nodales y corrientes de rama como arrays.
+
+    def __init__(self, circuit, f, x, Y):
+        st = circuit._assemble()
+        self.circuit = circuit
+        self.f = f                                                      # Frecuencias resueltas
+        self.x = x                                                      # Vector MNA completo (*lote, F, n)
+        self._Y = Y                                                     # Coeficientes usados (*lote, F, K)
+        self._st = st
+
+        zeros = np.zeros(x.shape[:-1] + (1,), dtype=complex)            # Tensión de tierra
+        self.V = np.concatenate([zeros, x[..., :st["n_nodes"]]], axis=-1)   # Tensiones nodales (*lote, F, N) con tierra en 0
+
+        self.branch_names = list(circuit.elements)                      # Orden de las corrientes de rama
+        self.I = np.stack([self._branch_current(name) for name in self.branch_names], axis=-1) # (*lote, F, E)
+
+    def _branch_current(self, name):                                    # Corriente de rama (entra por el primer nodo)
+        el = self.circuit.elements[name]
+        kind = el["kind"]
+        if kind in ("V", "RB", "GY", "TF"):
+            return self.x[..., self._st["offsets"][name]]               # Corriente auxiliar (puerto 1 en dos puertos)
+        if kind == "I":
+            return np.broadcast_to(self.circuit._excitation(name, self.f, 2 * np.pi * self.f), self.x.shape[:-1])
+        a, b = el["nodes"]
+        k = self._st["names"].index(name)
+        return self._Y[..., k] * (self.V[..., a] - self.V[..., b])      # i = Y·(Va - Vb)
+
+#====================================================================================================================================
+
+    def voltage(self, node):                                            # Tensión (esfuerzo) de un nodo respecto a tierra
+        return self.V[..., self.circuit.nodes.index(str(node))]
+
+    def current(self, name, port=1):                                    # Corriente de rama; port=2 para el secundario de dos puertos
+        if port == 2:
+            return self.x[..., self._st["offsets"][name] + 1]
+        return self.I[..., self.branch_names.index(name)]
+
+    def pressure(self, node):                                           # Alias acústico: presión del nodo
+        return self.voltage(node)
+
+    def volume_velocity(self, name, port=1):                            # Alias acústico: velocidad de volumen de la rama
+        return self.current(name, port)
+
+    def input_impedance(self, source):                                  # Impedancia vista por una fuente de esfuerzo
+        el = self.circuit.elements[source]
+        a, b = el["nodes"]
+        return (self.V[..., a] - self.V[..., b]) / (-self.current(source))
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Netlist del altavoz completo
+# -------------------------------
+
+def driver_netlist(driver, U=2.83, circuit=None, prefix=""):
+    """
+    Construye el circuito equivalente completo Driver + recinto.
+
+    Nodos (con prefijo opcional para varios drivers en un mismo circuito):
+        "in" (fuente), "e1".."e3" (bobina), "m1".."m3" (mecánico), "rear" (acústico trasero).
+    El recinto, si existe, agrega su carga con enclosure.add_to_circuit(circuit, node, prefix).
+
+    Args:
+        driver: objeto Driver (o cualquier objeto con los mismos atributos, escalares o arrays de lote)
+        U: Voltaje RMS aplicado en V (None para no agregar fuente)
+        circuit: Circuit existente al que se agrega el driver
+        prefix: Prefijo de nodos y elementos
+
+    Returns:
+        Circuit listo para resolver
+    """
+    ckt = circuit if circuit is not None else Circuit()
+    p = prefix
+
+    # --- Dominio eléctrico ---
+    if U is not None:
+        ckt.add_voltage_source(p + "Vg", p + "in", GROUND, U)           # Amplificador ideal
+        ckt.add_resistor(p + "Rg", p + "in", p + "e1", driver.Rg)       # Resistencia de la fuente
+    ckt.add_resistor(p + "Re", p + "e1", p + "e2", driver.Re)           # Resistencia DC de la bobina
+    ckt.add_inductor(p + "Le", p + "e2", p + "e3", driver.Le)           # Inductancia de la bobina
+    if np.any(driver.Reh):
+        ckt.add_resistor(p + "Reh", p + "e2", p + "e3", driver.Reh)     # Resistencia paralela a Le (modelo extendido)
+
+    # --- Acoplamiento eléctrico → mecánico ---
+    ckt.add_gyrator(p + "Bl", p + "e3", GROUND, p + "m1", GROUND, driver.Bl)    # Motor: F = Bl·i, e = Bl·u
+
+    # --- Dominio mecánico (analogía de impedancia: masa = L, compliancia = C) ---
+    enclosure = getattr(driver, "enclosure", None)
+    loaded = enclosure is not None and hasattr(enclosure, "add_to_circuit")
+    ckt.add_inductor(p + "Mms", p + "m1", p + "m2", driver.Mms)         # Masa móvil
+    ckt.add_resistor(p + "Rms", p + "m2", p + "m3", driver.Rms)         # Pérdidas mecánicas
+    ckt.add_capacitor(p + "Cms", p + "m3", p + "m4" if loaded else GROUND, driver.Cms)  # Compliancia de la suspensión
+
+    # --- Acoplamiento mecánico → acústico ---
+    if loaded:
+        ckt.add_transformer(p + "Sd", p + "m4", GROUND, p + "rear", GROUND, driver.Sd)  # Caudal del cono hacia la caja
+        enclosure.add_to_circuit(ckt, p + "rear", prefix=p)             # Carga acústica trasera del recinto
+
+    return ckt
+
+#====================================================================================================================================
+
+def cone_velocity(solution, prefix=""):
+    # Velocidad compleja del cono [m/s]: corriente de la malla mecánica.
+    return solution.current(prefix + "Mms")
@@ -0,0 +1,217 @@
+# --------------------------------------------
+# crossover.py
+# Simulación de crossovers pasivos (2º a 4º orden, Zobel, L-pad) entre el amplificador y uno o más drivers.
+# Cada driver carga el filtro con su impedancia real Driver.impedance(f); el conjunto se resuelve con el
+# solver MNA de core.circuit para todas las frecuencias y, si los valores son arrays, para lotes de
+# combinaciones de componentes a la vez.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from core.circuit import Circuit, GROUND                                # Importa el solver MNA por lotes
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Valores normalizados de escalera (fuente de voltaje ideal, carga R = 1, ω = 1)
+# Orden: desde el amplificador hacia el driver (serie, paralelo, serie, ...)
+# -------------------------------
+
+LADDER_G = {
+    ("butterworth", 1): [1.0],
+    ("butterworth", 2): [np.sqrt(2), 1 / np.sqrt(2)],
+    ("butterworth", 3): [1.5, 4 / 3, 0.5],
+    ("butterworth", 4): [1.5307, 1.5772, 1.0824, 0.3827],
+    ("linkwitz-riley", 2): [2.0, 0.5],
+    ("linkwitz-riley", 4): [4 * np.sqrt(2) / 3, 9 / (4 * np.sqrt(2)), 2 * np.sqrt(2) / 3, 1 / (2 * np.sqrt(2))],
+}
+
+#====================================================================================================================================
+# -------------------------------
+# Secciones de filtro
+# Cada sección es una lista de tuplas (topología, tipo, valor):
+#   ("series", "L"|"C"|"R", valor)   elemento en serie hacia el driver
+#   ("shunt",  "L"|"C"|"R", valor)   elemento a tierra en el nodo actual
+#   ("shunt",  "RC", (R, C))         rama R + C en serie a tierra (Zobel)
+# Los valores pueden ser arrays para evaluar lotes de componentes.
+# -------------------------------
+
+def lowpass(order, fc, R=8.0, alignment="butterworth"):
+    # Pasa-bajos en escalera: L en serie, C en paralelo.
+    g = _ladder_values(order, alignment)
+    wc = 2 * np.pi * np.asarray(fc)
+    return [("series", "L", gi * R / wc) if i % 2 == 0 else ("shunt", "C", gi / (R * wc)) for i, gi in enumerate(g)]
+
+def highpass(order, fc, R=8.0, alignment="butterworth"):
+    # Pasa-altos en escalera (transformación s → ωc/s): C en serie, L en paralelo.
+    g = _ladder_values(order, alignment)
+    wc = 2 * np.pi * np.asarray(fc)
+    return [("series", "C", 1 / (gi * R * wc)) if i % 2 == 0 else ("shunt", "L", R / (gi * wc)) for i, gi in enumerate(g)]
+
+def zobel(driver):
+    # Red de compensación de impedancia: Rz = Re, Cz = Le / Re².
+    return [("shunt", "RC", (driver.Re, driver.Le / driver.Re**2))]
+
+def lpad(attenuation_db, R=8.0):
+    # Atenuador L-pad de impedancia constante R. Una atenuación ≤ 0 dB es un puente: sin atenuador si es escalar;
+    # en un lote, Rs = 0 (cortocircuito) y Rp = ∞ (abierto) en esas entradas.
+    attenuation_db = np.asarray(attenuation_db, dtype=float)
+    if attenuation_db.ndim == 0 and attenuation_db <= 0:
+        return []
+    a = 10**(-np.maximum(attenuation_db, 0) / 20)                       # Relación de tensión
+    Rs = R * (1 - a)                                                    # Resistencia en serie
+    with np.errstate(divide="ignore"):
+        Rp = R * a / (1 - a)                                            # Resistencia en paralelo (∞ → admitancia 0)
+    return [("series", "R", Rs), ("shunt", "R", Rp)]
+
+def _ladder_values(order, alignment):                                   # Busca los valores g de la tabla
+    key = (alignment.lower(), int(order))
+    if key not in LADDER_G:
+        raise ValueError(f"Alineación no soportada: {alignment} de orden {order}.")
+    return LADDER_G[key]
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class Crossover:
+    """
+    Red pasiva completa: amplificador → vías (secciones de filtro) → drivers.
+
+    Args:
+        U: Voltaje RMS del amplificador en V
+        Rg: Resistencia de salida del amplificador en Ohm (None → Rg del primer driver agregado)
+    """
+
+    def __init__(self, U=2.83, Rg=None):
+        self.U = U
+        self.Rg = Rg
+        self.ways = []                                                  # Vías agregadas en orden
+
+    def add_way(self, name, drivers, sections=(), wiring="parallel", polarity=1):
+        """
+        Agrega una vía al crossover.
+
+        Args:
+            name: Nombre de la vía (woofer, tweeter, ...)
+            drivers: Driver o lista de drivers de la vía
+            sections: Lista de secciones (lowpass, highpass, zobel, lpad...) desde el amplificador hacia el driver
+            wiring: "parallel" o "series" para varios drivers en la misma vía
+            polarity: +1 o -1 (conexión invertida)
+        """
+        if not isinstance(drivers, (list, tuple)):
+            drivers = [drivers]
+        if wiring not in ("parallel", "series"):
+            raise ValueError("wiring debe ser 'parallel' o 'series'.")
+        if self.Rg is None:
+            self.Rg = drivers[0].Rg                                     # La fuente es la misma que vería el driver solo
+        elements = []
+        for section in sections:
+            elements.extend(section)
+        self.ways.append({
+            "name": name,
+            "drivers": list(drivers),
+            "elements": elements,
+            "wiring": wiring,
+            "polarity": polarity,
+        })
+        return self
+
+#====================================================================================================================================
+
+    def build(self, f):
+        # Construye el netlist con la impedancia de cada driver evaluada en f (sin la Rg propia del driver).
+        ckt = Circuit()
+        if self.Rg:
+            ckt.add_voltage_source("Vg", "amp", GROUND, self.U)
+            ckt.add_resistor("Rg", "amp", "out", self.Rg)               # Resistencia de salida del amplificador
+        else:
+            ckt.add_voltage_source("Vg", "out", GROUND, self.U)         # Amplificador ideal
+
+        loads = []                                                      # (etiqueta, elemento, driver)
+        for way in self.ways:
+            name = way["name"]
+            node = "out"
+            for k, (topology, kind, value) in enumerate(way["elements"]):
+                el = f"{name}.{kind}{k + 1}"
+                if topology == "series":
+                    nxt = f"{name}.n{k + 1}"
+                    self._add_element(ckt, kind, el, node, nxt, value)
+                    node = nxt
+                elif kind == "RC":
+                    mid = f"{name}.z{k + 1}"
+                    ckt.add_resistor(el + ".R", node, mid, value[0])
+                    ckt.add_capacitor(el + ".C", mid, GROUND, value[1])
+                else:
+                    self._add_element(ckt, kind, el, node, GROUND, value)
+
+            drivers = way["drivers"]
+            for i, driver in enumerate(drivers):
+                label = name if len(drivers) == 1 else f"{name}{i + 1}"
+                Zd = driver.impedance(f) - driver.Rg                    # Impedancia en bornes del driver
+                if way["wiring"] == "series" and i < len(drivers) - 1:
+                    nxt = f"{label}.t"
+                    ckt.add_impedance(label, node, nxt, Zd)
+                    node = nxt
+                else:
+                    ckt.add_impedance(label, node, GROUND, Zd)
+                loads.append((label, driver, way["polarity"]))
+        return ckt, loads
+
+    @staticmethod
+    def _add_element(ckt, kind, name, n1, n2, value):                   # Agrega un L, C o R al netlist
+        if kind == "L":
+            ckt.add_inductor(name, n1, n2, value)
+        elif kind == "C":
+            ckt.add_capacitor(name, n1, n2, value)
+        elif kind == "R" and np.any(np.asarray(value) == 0):
+            ckt.add_branch_resistor(name, n1, n2, value)                # R = 0 no tiene admitancia finita
+        elif kind == "R":
+            ckt.add_resistor(name, n1, n2, value)
+        else:
+            raise ValueError(f"Elemento no soportado en crossover: {kind}")
+
+#====================================================================================================================================
+
+    def solve(self, f):
+        """
+        Resuelve el crossover en todas las frecuencias (y lotes de componentes).
+
+        Returns:
+            dict con:
+                "f": frecuencias
+                "Zin": impedancia de entrada del sistema vista por el amplificador (sin Rg)
+                "V", "I": tensión y corriente en bornes de cada driver
+                "p": presión compleja a 1 m de cada driver
+                "p_way": presión compleja sumada de cada vía
+                "p_total": suma compleja de presiones
+                "SPL": nivel total en dB
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        ckt, loads = self.build(f)
+        sol = ckt.solve(f)
+
+        V, I, p = {}, {}, {}
+        for label, driver, polarity in loads:
+            I[label] = sol.current(label)
+            el = ckt.elements[label]
+            V[label] = sol.V[..., el["nodes"][0]] - sol.V[..., el["nodes"][1]]
+            H = driver.pressure(f, 1.0) * driver.impedance(f)          # Presión por ampere de corriente en la bobina
+            p[label] = polarity * H * I[label]
+
+        p_way = {}
+        for way in self.ways:
+            labels = [way["name"]] if len(way["drivers"]) == 1 else [f"{way['name']}{i + 1}" for i in range(len(way["drivers"]))]
+            p_way[way["name"]] = sum(p[label] for label in labels)
+
+        p_total = sum(p.values())
+        return {
+            "f": f,
+            "Zin": sol.voltage("out") / (-sol.current("Vg")),
+            "V": V,
+            "I": I,
+            "p": p,
+            "p_way": p_way,
+            "p_total": p_total,
+            "SPL": 20 * np.log10(np.abs(p_total) / 20e-6),
+        }
@@ -0,0 +1,216 @@
+# --------------------------------------------
+# crossover_optimizer.py
+# Ajuste de valores de componentes de un crossover pasivo a pendientes acústicas objetivo.
+# Evolución diferencial (rand/1/bin) en espacio logarítmico: cada iteración evalúa la población completa
+# como un lote (población × frecuencia) con el solver MNA, repartida en trozos sobre un pool de procesos.
+# Los valores se redondean a las series normalizadas E12/E24.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from concurrent.futures import ProcessPoolExecutor                      # Pool de procesos para repartir la población
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Series normalizadas de componentes (mantisas por década)
+# -------------------------------
+
+E_SERIES = {
+    "E12": np.array([1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2]),
+    "E24": np.array([1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
+                     3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1]),
+}
+
+def snap_to_series(values, series="E24"):
+    """
+    Redondea valores positivos al valor normalizado más cercano (en escala logarítmica).
+
+    Args:
+        values: Escalar o array de valores de componentes
+        series: "E12", "E24" o None (sin redondeo)
+
+    Returns:
+        Array con la misma forma que values
+    """
+    values = np.asarray(values, dtype=float)
+    if series is None:
+        return values
+    if series not in E_SERIES:
+        raise ValueError(f"Serie no soportada: {series}")
+    mantissas = np.append(E_SERIES[series], 10.0)                       # Incluye el 1.0 de la década siguiente
+    decade = np.floor(np.log10(values))
+    m = values / 10**decade
+    k = np.argmin(np.abs(np.log10(m[..., None]) - np.log10(mantissas)), axis=-1)
+    return mantissas[k] * 10**decade
+
+#====================================================================================================================================
+# -------------------------------
+# Respuestas objetivo
+# -------------------------------
+
+def target_slope(f, fc, order=4, kind="lowpass", level_db=90.0):
+    """
+    Respuesta acústica objetivo de Linkwitz-Riley de orden par: |H| = 1 / (1 + (f/fc)^order).
+
+    Args:
+        f: Frecuencias en Hz
+        fc: Frecuencia de cruce en Hz
+        order: Orden acústico (2, 4, ...)
+        kind: "lowpass" o "highpass"
+        level_db: Nivel en banda pasante en dB SPL
+
+    Returns:
+        Array con el SPL objetivo en dB
+    """
+    x = (np.asarray(f, dtype=float) / fc)**order
+    if kind == "highpass":
+        x = 1 / x
+    elif kind != "lowpass":
+        raise ValueError("kind debe ser 'lowpass' o 'highpass'.")
+    return level_db - 20 * np.log10(1 + x)
+
+#====================================================================================================================================
+# -------------------------------
+# Evaluación de un trozo de la población (nivel de módulo para poder enviarse a otros procesos)
+# -------------------------------
+
+def _evaluate_chunk(build, X, f, targets, weights, total_target):
+    res = build(X).solve(f)
+    P = X.shape[0]
+    spl = lambda p: np.broadcast_to(20 * np.log10(np.abs(p) / 20e-6 + 1e-30), (P, len(f)))
+
+    total_err = np.sqrt(np.mean(weights * (spl(res["p_total"]) - total_target)**2, axis=-1))
+    way_err = {name: np.sqrt(np.mean(weights * (spl(res["p_way"][name]) - t)**2, axis=-1)) for name, t in targets.items()}
+    cost = total_err + sum(way_err.values())
+    return cost, total_err, way_err
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class CrossoverOptimizer:
+    """
+    Optimizador de valores de componentes de un crossover.
+
+    Args:
+        build: Función build(X) → Crossover, con X de forma (población, n_componentes). Debe ser una función
+               de nivel de módulo para poder usarse con workers > 1.
+        bounds: Lista de (mínimo, máximo) por componente (valores positivos: H, F, Ohm)
+        f: Frecuencias de evaluación en Hz
+        targets: dict {nombre_vía: SPL objetivo en dB} (pendientes acústicas de cada vía)
+        total_target: SPL objetivo de la suma en eje (escalar o array); None → plano al nivel máximo de las vías
+        weights: Pesos por frecuencia (None → uniforme)
+        series: "E12", "E24" o None para no redondear
+        workers: Número de procesos (1 → evaluación en el proceso actual)
+    """
+
+    def __init__(self, build, bounds, f, targets, total_target=None, weights=None, series="E24", workers=1):
+        self.build = build
+        self.bounds = np.log(np.asarray(bounds, dtype=float))           # Búsqueda en escala logarítmica
+        if np.any(self.bounds[:, 0] >= self.bounds[:, 1]):
+            raise ValueError("Cada límite debe cumplir mínimo < máximo.")
+        self.f = np.asarray(f, dtype=float)
+        self.targets = {name: np.asarray(t, dtype=float) for name, t in targets.items()}
+        if total_target is None:
+            total_target = max(np.max(t) for t in self.targets.values())
+        self.total_target = np.broadcast_to(np.asarray(total_target, dtype=float), self.f.shape)
+        self.weights = np.ones_like(self.f) if weights is None else np.asarray(weights, dtype=float)
+        self.weights = self.weights / np.mean(self.weights)
+        self.series = series
+        self.workers = max(1, int(workers))
+
+    def values(self, u):
+        # Convierte candidatos en escala logarítmica a valores reales redondeados a la serie.
+        return snap_to_series(np.exp(u), self.series)
+
+    def evaluate(self, X, executor=None):
+        """
+        Evalúa un lote de candidatos X (población, n_componentes) ya en unidades reales.
+
+        Returns:
+            (costo, error_en_eje, errores_por_vía), cada uno de forma (población,)
+        """
+        X = np.atleast_2d(X)
+        args = (self.f, self.targets, self.weights, self.total_target)
+        if executor is None or len(X) < 2 * self.workers:
+            return _evaluate_chunk(self.build, X, *args)
+
+        chunks = np.array_split(X, self.workers)
+        futures = [executor.submit(_evaluate_chunk, self.build, c, *args) for c in chunks]
+        parts = [fut.result() for fut in futures]
+        cost = np.concatenate([p[0] for p in parts])
+        total_err = np.concatenate([p[1] for p in parts])
+        way_err = {name: np.concatenate([p[2][name] for p in parts]) for name in self.targets}
+        return cost, total_err, way_err
+
+#====================================================================================================================================
+
+    def optimize(self, popsize=20, maxiter=100, mutation=0.7, recombination=0.9, tol=1e-4, seed=None, x0=None):
+        """
+        Evolución diferencial rand/1/bin con evaluación por lotes.
+
+        Args:
+            popsize: Individuos por componente (población = popsize · n_componentes)
+            maxiter: Número máximo de generaciones
+            mutation: Factor de mutación F
+            recombination: Probabilidad de cruce CR
+            tol: Tolerancia relativa de convergencia sobre el costo de la población
+            seed: Semilla del generador aleatorio
+            x0: Valores iniciales opcionales (se incluyen en la población)
+
+        Returns:
+            dict con:
+                "x": valores óptimos redondeados a la serie
+                "cost": costo total
+                "on_axis_error": error RMS en dB de la respuesta sumada en eje
+                "way_errors": error RMS en dB de cada vía
+                "nit": generaciones ejecutadas
+                "history": mejor costo por generación
+        """
+        rng = np.random.default_rng(seed)
+        lo, hi = self.bounds[:, 0], self.bounds[:, 1]
+        D = len(lo)
+        N = max(5, popsize * D)
+
+        pop = lo + rng.random((N, D)) * (hi - lo)                       # Población inicial uniforme en log
+        if x0 is not None:
+            pop[0] = np.clip(np.log(np.asarray(x0, dtype=float)), lo, hi)
+
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            cost = self.evaluate(self.values(pop), executor)[0]
+            history = [cost.min()]
+            nit = 0
+            for nit in range(1, maxiter + 1):
+                # Índices r1, r2, r3 distintos entre sí y del individuo
+                r = np.argsort(rng.random((N, N - 1)), axis=1)[:, :3]
+                r = r + (r >= np.arange(N)[:, None])
+                mutant = pop[r[:, 0]] + mutation * (pop[r[:, 1]] - pop[r[:, 2]])
+
+                cross = rng.random((N, D)) < recombination
+                cross[np.arange(N), rng.integers(0, D, N)] = True       # Al menos un gen del mutante
+                trial = np.clip(np.where(cross, mutant, pop), lo, hi)
+
+                trial_cost = self.evaluate(self.values(trial), executor)[0]
+                better = trial_cost <= cost
+                pop[better] = trial[better]
+                cost[better] = trial_cost[better]
+                history.append(cost.min())
+
+                if np.std(cost) <= tol * np.abs(np.mean(cost)):
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        best = self.values(pop[np.argmin(cost)])
+        best_cost, total_err, way_err = self.evaluate(best[None, :])
+        return {
+            "x": best,
+            "cost": float(best_cost[0]),
+            "on_axis_error": float(total_err[0]),
+            "way_errors": {name: float(e[0]) for name, e in way_err.items()},
+            "nit": nit,
+            "history": np.array(history),
+        }
@@ -0,0 +1,120 @@
+# --------------------------------------------
+# decay.py
+# Decaimiento espectral acumulado (cascada / waterfall, CSD) y decaimiento de ráfagas (tone-burst)
+# a partir de la respuesta al impulso simulada de cualquier Driver + recinto.
+# Las rebanadas de la cascada son vistas con paso de la respuesta (sliding_window_view, sin copias) y se
+# transforman con una sola rfft por lotes; las ráfagas de todas las frecuencias se convolucionan a la vez.
+# Es la verificación estándar de resonancias de puerto y de línea.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from numpy.lib.stride_tricks import sliding_window_view                 # Vistas deslizantes sin copia
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+def pressure_impulse(driver, fs=8192.0, n=8192, U=2.83):
+    """
+    Respuesta al impulso de la presión en eje a 1 m, por síntesis espectral de Driver.responses.
+
+    Args:
+        driver: Driver con cualquier recinto
+        fs: Frecuencia de muestreo en Hz
+        n: Número de muestras (resolución espectral fs/n)
+        U: Voltaje RMS de referencia
+
+    Returns:
+        (t, h): tiempos en s y respuesta al impulso (rfft(h) reproduce la respuesta en frecuencia)
+    """
+    f = np.fft.rfftfreq(n, 1 / fs)
+    p = np.zeros(f.size, dtype=complex)
+    p[1:] = driver.responses(f[1:], U)["p"]                             # Sin componente de continua
+    if n % 2 == 0:
+        p[-1] = p[-1].real                                              # El bin de Nyquist debe ser real
+    return np.arange(n) / fs, np.fft.irfft(p, n)
+
+def csd(h, fs, window_ms=100.0, duration_ms=100.0, slices=40, taper=0.25, nfft=None):
+    """
+    Decaimiento espectral acumulado (cascada).
+
+    Cada rebanada toma window_ms de la respuesta a partir de un instante que avanza de 0 a duration_ms;
+    el extremo final se suaviza con un coseno (taper = fracción de la ventana).
+
+    Args:
+        h: Respuesta al impulso (N,)
+        fs: Frecuencia de muestreo en Hz
+        window_ms: Longitud de cada rebanada en ms
+        duration_ms: Retardo de la última rebanada en ms
+        slices: Número de rebanadas
+        taper: Fracción final de la ventana con caída en coseno
+        nfft: Longitud de la rfft (None → la de la ventana)
+
+    Returns:
+        dict con "t" (S,) inicio de cada rebanada en s, "f" (F,) en Hz y "level_db" (S, F)
+        relativo al máximo de la primera rebanada
+    """
+    L = int(round(window_ms * 1e-3 * fs))
+    step = max(int(round(duration_ms * 1e-3 * fs / max(slices - 1, 1))), 1)
+    starts = np.arange(slices) * step                                   # Paso constante entre rebanadas
+
+    padded = np.concatenate([h, np.zeros(max(starts[-1] + L - len(h), 0))])
+    view = sliding_window_view(padded, L)[::step][:slices]              # (S, L), vista con paso (sin copiar)
+
+    n_taper = int(taper * L)
+    if n_taper:                                                         # El coseno final obliga a una copia (S, L)
+        window = np.ones(L)
+        window[L - n_taper:] = 0.5 * (1 + np.cos(np.pi * np.arange(1, n_taper + 1) / n_taper))
+        view = view * window
+
+    nfft = nfft or L
+    spectra = np.abs(np.fft.rfft(view, n=nfft, axis=-1))                # Una sola rfft por lotes
+    ref = np.max(spectra[0])
+    with np.errstate(divide="ignore"):
+        level = 20 * np.log10(spectra / ref)
+    return {"t": starts / fs, "f": np.fft.rfftfreq(nfft, 1 / fs), "level_db": level}
+
+#====================================================================================================================================
+
+def burst_decay(h, fs, frequencies, cycles=5, periods=20, threshold_db=-20.0):
+    """
+    Decaimiento después de ráfagas senoidales con envolvente Hann, para todas las frecuencias a la vez.
+
+    Args:
+        h: Respuesta al impulso (N,)
+        fs: Frecuencia de muestreo en Hz
+        frequencies: Frecuencias de las ráfagas en Hz (F,)
+        cycles: Ciclos de cada ráfaga
+        periods: Número de periodos evaluados después del final de la ráfaga
+        threshold_db: Nivel para el tiempo de decaimiento (relativo al pico de la envolvente)
+
+    Returns:
+        dict con "f" (F,), "periods" (K,), "level_db" (F, K) envolvente en cada periodo tras la ráfaga,
+        "time" (F, K) en s y "decay_periods" (F,) periodos hasta caer bajo threshold_db (NaN si no cae)
+    """
+    frequencies = np.atleast_1d(np.asarray(frequencies, dtype=float))
+    lengths = np.round(cycles / frequencies * fs).astype(int)
+    L = int(lengths.max())
+    n = int(2**np.ceil(np.log2(len(h) + L)))
+
+    # Ráfagas (F, L) con envolvente Hann sobre exactamente `cycles` ciclos
+    k = np.arange(L)
+    phase = np.minimum(k[None, :] / lengths[:, None], 1.0)
+    bursts = np.sin(2 * np.pi * frequencies[:, None] * k / fs) * np.sin(np.pi * phase)**2
+
+    # Convolución por lotes y envolvente por señal analítica
+    Y = np.fft.fft(bursts, n, axis=-1) * np.fft.fft(h, n)
+    Y[:, n // 2 + 1:] = 0
+    Y[:, 1:n // 2] *= 2
+    envelope = np.abs(np.fft.ifft(Y, axis=-1))
+
+    K = np.arange(periods + 1)
+    samples = lengths[:, None] + np.round(K[None, :] / frequencies[:, None] * fs).astype(int)
+    samples = np.minimum(samples, n - 1)
+    peak = np.max(envelope, axis=-1, keepdims=True)
+    with np.errstate(divide="ignore"):
+        level = 20 * np.log10(np.take_along_axis(envelope, samples, axis=-1) / peak)
+
+    below = level < threshold_db
+    decay = np.where(below.any(axis=-1), np.argmax(below, axis=-1).astype(float), np.nan)
+    return {"f": frequencies, "periods": K, "level_db": level, "time": samples / fs, "decay_periods": decay}
@@ -4,9 +4,7 @@
 # --------------------------------------------
 
 import numpy as np                          # Importa numpy para cálculos matemáticos complejos
-from scipy.special import j1                # Importa la función Bessel de primer orden para cálculos de SPL - Directividad del pistón
-from scipy.signal import lti, step          # Importa lti y step para simular la respuesta al escalón del sistema
-from scipy.signal import savgol_filter      # Importa savgol_filter para suavizar la respuesta al escalón
+from core.special import j1                 # Bessel de primer orden (scipy se importa en la primera llamada) - Directividad del pistón
 import textwrap
 
 #====================================================================================================================================
@@ -52,6 +50,7 @@ class Driver:
         if self.Sd <= 0:                                # Área del diafragma debe ser mayor que cero
             raise ValueError("El área Sd debe ser mayor que cero para convertir Cms a Vas.")       
         self.Xmax = params.get("Xmax", 0.005)           # Excursión máxima lineal, en m
+        self.Pe = params.get("Pe", None)                # Potencia nominal (térmica), en W (opcional)
 
         self.Rg = params.get("Rg", 0.5)                 # Resistencia de la fuente de voltaje, en Ohm (opcional)
 
@@ -204,16 +203,20 @@ class Driver:
     # 1. Impedancia del driver - Magnitud y Fase
     # ===============================
 
-    def impedance(self, f):
+    def blocked_impedance(self, f):
+        # Impedancia eléctrica con el cono bloqueado: Re + Rg + bobina (sin la parte mecánica reflejada).
         w = 2 * np.pi * f
-
-        # Impedancia eléctrica base
         if self.Reh:
             Z_le = 1 / (1j*w*self.Le + 1/self.Reh)
         else:
             Z_le = 1j*w*self.Le
-        
-        Ze_base = self.Re + self.Rg + Z_le
+        return self.Re + self.Rg + Z_le
+
+    def impedance(self, f):
+        w = 2 * np.pi * f
+
+        # Impedancia eléctrica base
+        Ze_base = self.blocked_impedance(f)
         
         # ===== INFINITE BAFFLE =====
         if self.enclosure is None:
@@ -233,71 +236,21 @@ class Driver:
         
         # ===== BASS-REFLEX =====
         elif hasattr(self.enclosure, '__class__') and 'BassReflex' in self.enclosure.__class__.__name__:
-            # 1. Impedancia mecánica del driver
-            Zm_driver = self.Rms + 1j*w*self.Mms + 1/(1j*w*self.Cms)
-            
-            # 2. Parámetros de la caja
-            Vb = self.enclosure.Vb_m3  # Volumen en m³
-            Cab = Vb / (self.rho0 * self.c**2)  # Compliancia acústica de la caja
-            
-            # 3. Parámetros del puerto/ducto
-            try:
-                if hasattr(self.enclosure, 'area_ducto'):
-                    Sp = self.enclosure.area_ducto
-                elif hasattr(self.enclosure, 'Sp'):
-                    Sp = self.enclosure.Sp
-                elif hasattr(self.enclosure, 'port_area'):
-                    Sp = self.enclosure.port_area
-                else:
-                    Sp = 0.01  # 10 cm² por defecto
-                
-                if hasattr(self.enclosure, 'largo_ducto'):
-                    L = self.enclosure.largo_ducto
-                elif hasattr(self.enclosure, 'L'):
-                    L = self.enclosure.L
-                elif hasattr(self.enclosure, 'port_length'):
-                    L = self.enclosure.port_length
-                else:
-                    L = 0.1  # 10 cm por defecto
-            except:
-                Sp = 0.01
-                L = 0.1
-            
-            # 4. Cálculo correcto de parámetros del puerto
-            delta_L = 0.85 * np.sqrt(Sp/np.pi)  # Corrección de longitud
-            Leff = L + delta_L                   # Longitud efectiva
-            
-            # MODELO CORRECTO: Todo en el lado acústico, luego transformar
-            # Masa acústica del puerto
-            Map = self.rho0 * Leff / Sp  # kg/m⁴
-            
-            # Resistencia acústica del puerto
-            Rap = self.rho0 * self.c * 0.01 / Sp  # Factor de pérdidas pequeño
-            
-            # 5. MODELO BASS-REFLEX CORRECTO
-            # Impedancia acústica de la caja
-            Zab = 1 / (1j*w*Cab)  # Impedancia acústica de la caja
-            
-            # Impedancia acústica del puerto
-            Zap = Rap + 1j*w*Map  # Impedancia acústica del puerto
-            
-            # 6. ACOPLAMIENTO ACÚSTICO CORRECTO
-            # La caja y el puerto están en paralelo acústico
-            Za_paralelo = (Zab * Zap) / (Zab + Zap)
-            
-            # Transformar al lado mecánico (multiplicar por Sd²)
-            Zm_carga_posterior = Za_paralelo * (self.Sd**2)
-            
-            # 7. Impedancia mecánica total
-            Zm_total = Zm_driver + Zm_carga_posterior
-            
-            # 8. Impedancia eléctrica reflejada
-            Ze_base = self.Re + self.Rg + (1j * w * self.Le if not self.Reh else 1 / (1j * w * self.Le + 1 / self.Reh))
+            # Carga de caja + puerto (la misma que usan las presiones del cono y del puerto)
+            Zm_total = self._bassreflex_load(f)[0]
+            Ze_base = self.blocked_impedance(f)
             Ze_mechanical = (self.Bl**2) / Zm_total
             Ze = Ze_base + Ze_mechanical
             
             return Ze
         
+        # ===== CAJAS CON CARGA ACÚSTICA PROPIA (línea de transmisión, bocina, ...) =====
+        elif hasattr(self.enclosure, 'acoustic_load'):
+            Zm_total = self.Rms + 1j*w*self.Mms + 1/(1j*w*self.Cms) + self.enclosure.total_acoustic_load(f, self.Sd)
+            Ze_mechanical = (self.Bl**2) / Zm_total
+            Ze = Ze_base + Ze_mechanical
+            return Ze
+
         # ===== OTROS TIPOS DE CAJA =====
         else:
             Ze_mechanical = (self.Bl**2) / (self.Rms * (1 + 1j*self.Qts*(w/(2*np.pi*self.Fs) - (2*np.pi*self.Fs)/w)))
@@ -313,6 +266,10 @@ class Driver:
         # Para bass-reflex, calculamos contribuciones separadas del cono y puerto
         if hasattr(self.enclosure, '__class__') and 'BassReflex' in self.enclosure.__class__.__name__:
             return self.spl_bassreflex_total(f, U)
+
+        # Cajas con una segunda salida radiante (boca de línea de transmisión, ...): suma compleja
+        if hasattr(self.enclosure, 'secondary_output'):
+            return 20 * np.log10(np.abs(self.pressure(f, U)) / 20e-6)
         
         # ===== SPL PARA INFINITE BAFFLE Y CAJA SELLADA =====
         Z = self.impedance(f)                                           # Impedancia eléctrica del driver a la frecuencia f
@@ -371,11 +328,20 @@ class Driver:
 
         return SPL
 
-    def spl_bassreflex_total(self, f, U=2.83):
-        """SPL bass-reflex total según teoría física correcta"""
-        f_was_scalar = np.isscalar(f)
-        f = np.atleast_1d(f)
-        
+    def _piston_directivity(self, ka):                                  # Directividad en eje de un pistón: 2·J1(ka)/ka
+        D = np.ones_like(ka)
+        mask = ka != 0
+        D[mask] = 2 * j1(ka[mask]) / ka[mask]
+        return D
+
+    def _bassreflex_load(self, f, R_extra=0.0):
+        """
+        Carga acústica del bass-reflex vista desde el cono, a partir de area_port / length_port del recinto.
+
+        Returns:
+            (Zm_total, Zab, Zap, ratio): impedancia mecánica total, impedancias acústicas de la caja y del
+            puerto (con R_extra) y relación caudal de salida / entrada del puerto (1 en el modelo concentrado)
+        """
         # 1. PARÁMETROS DEL SISTEMA
         w = 2 * np.pi * f
         Vb = self.enclosure.Vb_m3
@@ -391,21 +357,36 @@ class Driver:
         # 3. IMPEDANCIAS ACÚSTICAS
         Zab = 1 / (1j*w*Cab)                          # Impedancia de la caja
         Zap = self.rho0 * self.c * 0.02 / Sp + 1j*w*Map  # Impedancia del puerto
+        ratio = 1.0                                   # Caudal de salida / caudal de entrada del puerto
+        if getattr(self.enclosure, 'port_model', 'lumped') == 'distributed':
+            Zap, ratio = self.enclosure.port_response(f)  # Puerto como línea de transmisión
+        Zap = Zap + R_extra                           # Pérdidas no lineales u otras resistencias agregadas
         Za_paralelo = (Zab * Zap) / (Zab + Zap)       # Impedancia paralela
         
         # 4. IMPEDANCIAS MECÁNICAS
         Zm_driver = self.Rms + 1j*w*self.Mms + 1/(1j*w*self.Cms)
         Zm_carga = Za_paralelo * (self.Sd**2)         # Transformación acústica→mecánica
         Zm_total = Zm_driver + Zm_carga               # Impedancia mecánica total
-        
-        # 5. CORRIENTE Y VELOCIDADES
-        Z = np.array([self.impedance(freq) for freq in f])
+        return Zm_total, Zab, Zap, ratio
+
+    def _bassreflex_pressures(self, f, U=2.83, R_extra=0.0, with_velocities=False):
+        """
+        Presiones complejas del cono y del puerto a 1 m (f como array).
+        U y R_extra (resistencia acústica adicional del puerto) pueden ser arrays que se combinan con f
+        por broadcasting; con with_velocities=True se devuelven además las velocidades del cono y del aire en el puerto.
+        """
+        w = 2 * np.pi * f
+        Sp = self.enclosure.area_port
+        Zm_total, Zab, Zap, ratio = self._bassreflex_load(f, R_extra)
+
+        # 5. CORRIENTE Y VELOCIDADES (con la misma carga Zm_total, incluida R_extra)
+        Z = self.blocked_impedance(f) + self.Bl**2 / Zm_total
         I = U / Z
-        v_driver = I * (self.Bl / Zm_total)           # Velocidad del cono
+        v_driver = I * (self.Bl / Zm_total)           # Velocidad del cono: Bl·U / (Ze_b·Zm_total + Bl²)
         
         # 6. CAUDAL ACÚSTICO (CONSERVACIÓN DE MASA)
         Qd = v_driver * self.Sd                       # Caudal del diafragma
-        Qp = -Qd * Zab / (Zab + Zap)                  # Caudal del puerto (negativo)
+        Qp = -Qd * Zab / (Zab + Zap) * ratio          # Caudal radiado por el puerto (negativo)
         v_port = Qp / Sp                              # Velocidad del puerto
         
         # 7. RADIACIÓN ACÚSTICA
@@ -413,27 +394,28 @@ class Driver:
         r = 1.0  # Distancia de 1m
         
         # 7.1 Radiación del cono
-        a_driver = np.sqrt(self.Sd / np.pi)
-        ka_driver = k * a_driver
-        D_driver = np.ones_like(ka_driver)
-        mask = ka_driver != 0
-        D_driver[mask] = 2 * j1(ka_driver[mask]) / ka_driver[mask]
-        
+        D_driver = self._piston_directivity(k * np.sqrt(self.Sd / np.pi))
         p_driver = 1j * w * self.rho0 * v_driver * self.Sd * D_driver / (2 * np.pi * r)
         
         # 7.2 Radiación del puerto
-        a_port = np.sqrt(Sp / np.pi)
-        ka_port = k * a_port
-        D_port = np.ones_like(ka_port)
-        mask = ka_port != 0
-        D_port[mask] = 2 * j1(ka_port[mask]) / ka_port[mask]
-        
+        D_port = self._piston_directivity(k * np.sqrt(Sp / np.pi))
         p_port = 1j * w * self.rho0 * v_port * Sp * D_port / (2 * np.pi * r)
+
+        if with_velocities:
+            return p_driver, p_port, v_driver, v_port
+        return p_driver, p_port
+
+    def spl_bassreflex_total(self, f, U=2.83):
+        """SPL bass-reflex total según teoría física correcta"""
+        f_was_scalar = np.isscalar(f)
+        f = np.atleast_1d(f)
         
-        # 8. SUMA DE PRESIONES (considerando fase)
+        p_driver, p_port = self._bassreflex_pressures(f, U)
+        
+        # SUMA DE PRESIONES (considerando fase)
         p_total = p_driver + p_port
         
-        # 9. CÁLCULO DE SPL
+        # CÁLCULO DE SPL
         p_ref = 20e-6
         SPL_total = 20 * np.log10(np.abs(p_total) / p_ref)
         
@@ -444,46 +426,9 @@ class Driver:
         f_was_scalar = np.isscalar(f)
         f = np.atleast_1d(f)
         
-        # 1. PARÁMETROS DEL SISTEMA
-        w = 2 * np.pi * f
-        Vb = self.enclosure.Vb_m3
-        Cab = Vb / (self.rho0 * self.c**2)
+        p_driver, _ = self._bassreflex_pressures(f, U)
         
-        # 2. PARÁMETROS DEL PUERTO
-        Sp = self.enclosure.area_port
-        L = self.enclosure.length_port
-        delta_L = 0.85 * np.sqrt(Sp/np.pi)
-        Leff = L + delta_L
-        Map = self.rho0 * Leff / Sp
-        
-        # 3. IMPEDANCIAS ACÚSTICAS
-        Zab = 1 / (1j*w*Cab)                          # Impedancia de la caja
-        Zap = self.rho0 * self.c * 0.02 / Sp + 1j*w*Map  # Impedancia del puerto
-        Za_paralelo = (Zab * Zap) / (Zab + Zap)       # Impedancia paralela
-        
-        # 4. IMPEDANCIAS MECÁNICAS
-        Zm_driver = self.Rms + 1j*w*self.Mms + 1/(1j*w*self.Cms)
-        Zm_carga = Za_paralelo * (self.Sd**2)         # Transformación acústica→mecánica
-        Zm_total = Zm_driver + Zm_carga               # Impedancia mecánica total
-        
-        # 5. CORRIENTE Y VELOCIDADES
-        Z = np.array([self.impedance(freq) for freq in f])
-        I = U / Z
-        v_driver = I * (self.Bl / Zm_total)           # Velocidad del cono
-        
-        # 6. RADIACIÓN ACÚSTICA DEL CONO
-        k = w / self.c
-        r = 1.0  # Distancia de 1m
-        
-        a_driver = np.sqrt(self.Sd / np.pi)
-        ka_driver = k * a_driver
-        D_driver = np.ones_like(ka_driver)
-        mask = ka_driver != 0
-        D_driver[mask] = 2 * j1(ka_driver[mask]) / ka_driver[mask]
-        
-        p_driver = 1j * w * self.rho0 * v_driver * self.Sd * D_driver / (2 * np.pi * r)
-        
-        # 7. CÁLCULO DE SPL DEL CONO
+        # CÁLCULO DE SPL DEL CONO
         p_ref = 20e-6
         SPL_cone = 20 * np.log10(np.abs(p_driver) / p_ref)
         
@@ -494,51 +439,9 @@ class Driver:
         f_was_scalar = np.isscalar(f)
         f = np.atleast_1d(f)
         
-        # 1. PARÁMETROS DEL SISTEMA
-        w = 2 * np.pi * f
-        Vb = self.enclosure.Vb_m3
-        Cab = Vb / (self.rho0 * self.c**2)
-        
-        # 2. PARÁMETROS DEL PUERTO
-        Sp = self.enclosure.area_port
-        L = self.enclosure.length_port
-        delta_L = 0.85 * np.sqrt(Sp/np.pi)
-        Leff = L + delta_L
-        Map = self.rho0 * Leff / Sp
-        
-        # 3. IMPEDANCIAS ACÚSTICAS
-        Zab = 1 / (1j*w*Cab)                          # Impedancia de la caja
-        Zap = self.rho0 * self.c * 0.02 / Sp + 1j*w*Map  # Impedancia del puerto
-        Za_paralelo = (Zab * Zap) / (Zab + Zap)       # Impedancia paralela
+        _, p_port = self._bassreflex_pressures(f, U)
         
-        # 4. IMPEDANCIAS MECÁNICAS
-        Zm_driver = self.Rms + 1j*w*self.Mms + 1/(1j*w*self.Cms)
-        Zm_carga = Za_paralelo * (self.Sd**2)         # Transformación acústica→mecánica
-        Zm_total = Zm_driver + Zm_carga               # Impedancia mecánica total
-        
-        # 5. CORRIENTE Y VELOCIDADES
-        Z = np.array([self.impedance(freq) for freq in f])
-        I = U / Z
-        v_driver = I * (self.Bl / Zm_total)           # Velocidad del cono
-        
-        # 6. CAUDAL ACÚSTICO (CONSERVACIÓN DE MASA)
-        Qd = v_driver * self.Sd                       # Caudal del diafragma
-        Qp = -Qd * Zab / (Zab + Zap)                  # Caudal del puerto (negativo)
-        v_port = Qp / Sp                              # Velocidad del puerto
-        
-        # 7. RADIACIÓN ACÚSTICA DEL PUERTO
-        k = w / self.c
-        r = 1.0  # Distancia de 1m
-        
-        a_port = np.sqrt(Sp / np.pi)
-        ka_port = k * a_port
-        D_port = np.ones_like(ka_port)
-        mask = ka_port != 0
-        D_port[mask] = 2 * j1(ka_port[mask]) / ka_port[mask]
-        
-        p_port = 1j * w * self.rho0 * v_port * Sp * D_port / (2 * np.pi * r)
-        
-        # 8. CÁLCULO DE SPL DEL PUERTO
+        # CÁLCULO DE SPL DEL PUERTO
         p_ref = 20e-6
         SPL_port = 20 * np.log10(np.abs(p_port) / p_ref)
         
@@ -692,6 +595,85 @@ class Driver:
         
         return phase_deg
 
+    def pressure(self, f, U=2.83):
+        """
+        Presión acústica compleja en eje a 1 metro.
+
+        Usa la misma física que spl_total(): en bass-reflex suma las presiones del cono y del puerto.
+        Es la respuesta compleja que consumen los crossovers y los sistemas multivía.
+
+        Args:
+            f: Frecuencia en Hz (escalar o array)
+            U: Voltaje RMS aplicado en V
+
+        Returns:
+            Presión compleja en Pa
+        """
+        if np.any(np.asarray(f) <= 0):
+            raise ValueError("La frecuencia debe ser mayor que cero para calcular la presión.")
+
+        f_was_scalar = np.isscalar(f)
+        p = self.responses(np.atleast_1d(np.asarray(f, dtype=float)), U)["p"]
+        return p[0] if f_was_scalar else p
+
+    def responses(self, f, U=1.0):
+        """
+        Respuestas complejas del sistema en todas las frecuencias, con la misma física que pressure().
+
+        Todo el modelo es lineal en U, así que con U = 1 V se obtienen las respuestas por voltio
+        que usan los cálculos de límites (SPL máximo, excursión bajo ruido, ...).
+
+        Args:
+            f: Frecuencias en Hz (array)
+            U: Voltaje RMS aplicado en V
+
+        Returns:
+            dict con arrays complejos (F,): "Z" (impedancia), "I" (corriente), "v" (velocidad del cono),
+            "x" (desplazamiento del cono en m), "p" (presión a 1 m) y "v_port" (velocidad del aire en el
+            puerto; None si el recinto no tiene puerto)
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        w = 2 * np.pi * f
+        Z = self.impedance(f)
+        v_port = None
+
+        if hasattr(self.enclosure, '__class__') and 'BassReflex' in self.enclosure.__class__.__name__:
+            p_driver, p_port, v, v_port = self._bassreflex_pressures(f, U, with_velocities=True)
+            p = p_driver + p_port
+        else:
+            if self.enclosure is not None and 'Sealed' in self.enclosure.__class__.__name__:
+                # CAJA SELLADA: misma velocidad del sistema que en spl_total()
+                alpha = 1 + self.Vas / (self.enclosure.Vb_m3 * 1000)
+                Zm_sistema = self.Rms + 1j*w*self.Mms + 1/(1j*w*self.Cms / alpha)
+                v = (U / Z) * (self.Bl / Zm_sistema)
+            else:
+                v = self.velocity(f, U)
+            D = self._piston_directivity(w / self.c * np.sqrt(self.Sd / np.pi))
+            p = 1j * w * self.rho0 * v * self.Sd * D / (2 * np.pi * 1.0)
+            if not getattr(self.enclosure, 'cone_radiates', True):
+                p = np.zeros_like(p)                                    # El cono radia solo a través del recinto (bocina frontal)
+
+            if hasattr(self.enclosure, 'secondary_output'):
+                # Segunda abertura radiante (boca de la línea, radiador pasivo, ...)
+                Q2, S2 = self.enclosure.secondary_output(f, self.Sd, v)
+                D2 = self._piston_directivity(w / self.c * np.sqrt(S2 / np.pi))
+                p = p + 1j * w * self.rho0 * Q2 * D2 / (2 * np.pi * 1.0)
+
+        return {"Z": Z, "I": U / Z, "v": v, "x": v / (1j * w), "p": p, "v_port": v_port}
+
+    def transfer_function(self, output="pressure"):
+        """
+        Función de transferencia racional en s del sistema (ver core.rational.system_tf).
+
+        Args:
+            output: "velocity", "displacement", "acceleration", "current", "impedance" o "pressure"
+
+        Returns:
+            RationalTF con polos, residuos y respuestas exactas al impulso y al escalón
+        """
+        from core.rational import system_tf                            # Import local: rational no depende de Driver
+        return system_tf(self, output)
+
 #====================================================================================================================================
     # ===============================
     # 3. Desplazamiento de la bobina
@@ -869,7 +851,7 @@ class Driver:
         if len(frequencies) == 0:
             raise ValueError("El array de frecuencias no puede estar vacío.")
 
-        H_array = np.array([self.spl_complex(f, U) for f in frequencies])
+        H_array = self.spl_complex(np.asarray(frequencies, dtype=float), U)   # Vectorizado sobre todas las frecuencias
         phase = np.unwrap(np.angle(H_array))
         dphi_df = np.gradient(phase, frequencies)
         dphi_domega = -dphi_df / (2 * np.pi)
@@ -881,37 +863,29 @@ class Driver:
     # 7. Respuesta al escalón
     # ===============================
     def step_response(self, t, U=2.83):
+        """
+        Respuesta del cono a un escalón de U voltios, con la bobina completa (Re, Le) y la carga del recinto.
+        En recintos de parámetros concentrados es exacta en cada instante (residuos, core.transient).
+
+        Returns:
+            (t, desplazamiento [mm], velocidad [mm/s], aceleración [mm/s²])
+        """
+        return self._transient(t, U, "step")
+
+    def impulse_response(self, t, U=1.0):
+        # Respuesta del cono a un impulso de U V·s: (t, desplazamiento [mm], velocidad [mm/s], aceleración [mm/s²]).
+        return self._transient(t, U, "impulse")
+
+    def _transient(self, t, U, kind):
         if not isinstance(t, (list, np.ndarray)):
             raise ValueError("El tiempo t debe ser un array o lista de valores.")
         if len(t) == 0:
             raise ValueError("El array de tiempo no puede estar vacío.")
-        
-        t = np.asarray(t)
-        t = np.sort(t)  # Asegura orden creciente
-
-        Re = self.Re                                # Resistencia DC de la bobina
-        I = U / Re                                  # Corriente inducida en la bobina a partir del voltaje RMS U
-        Bl = self.Bl                                # Producto flujo-Bobina
-        Mms = self.Mms                              # Masa móvil del driver
-        Rms = self.Rms                              # Resistencia mecánica del driver
-        Cms = self.Cms                              # Compliancia mecánica del driver
-
-        num = [Bl * I / Mms]                        # Numerador de la función de transferencia
-        den = [1, Rms / Mms, 1 / (Mms * Cms)]       # Denominador de la función de transferencia
-        system = lti(num, den)                      # Crea un sistema LTI (Linear Time-Invariant) con el numerador y denominador
-        output = system.step(T=t)  # Simula la respuesta al escalón del sistema LTI
-        t_out, v_out = output            # Simula la respuesta al escalón del sistema LTI
-
-        x_out = np.cumsum(v_out) * (t_out[1] - t_out[0])    # Integra la velocidad para obtener desplazamiento [m]
-        dt = t_out[1] - t_out[0]
-        v_smooth = savgol_filter(v_out, window_length=51, polyorder=3, mode='interp')
-        a_out = np.gradient(v_smooth, dt)              # Deriva la aceleración a partir de la velocidad [m/s²]
-
-        x_out_mm = x_out * 1000                     # Convierte desplazamiento a mm
-        v_out_mm = v_out * 1000                     # Convierte velocidad a mm/s
-        a_out_mm = a_out * 1000                     # Convierte aceleración a mm/s²
 
-        return t_out, x_out_mm, v_out_mm, a_out_mm  # Retorna tiempo, desplazamiento, velocidad y aceleración en mm
+        from core.transient import transient_response                   # Import local: transient depende de rational
+        t_out = np.sort(np.asarray(t, dtype=float))                     # Asegura orden creciente
+        r = transient_response(self, t_out, U, kind)
+        return t_out, r["x"] * 1000, r["v"] * 1000, r["a"] * 1000       # Convierte a mm
 
 #====================================================================================================================================
     # ===============================
@@ -924,8 +898,9 @@ class Driver:
         if len(frequencies) == 0:
             raise ValueError("El array de frecuencias no puede estar vacío.")
 
-        Pac = np.array([self.power_ac(f) for f in frequencies])
-        Pel = np.array([self.power_real(f) for f in frequencies])
+        frequencies = np.asarray(frequencies, dtype=float)
+        Pac = self.power_ac(frequencies)
+        Pel = self.power_real(frequencies)
 
         with np.errstate(divide='ignore', invalid='ignore'):
             eta = np.where(Pel > 0, (Pac / Pel) * 100, 0)  # En porcentaje
@@ -944,16 +919,15 @@ class Driver:
         if len(frequencies) == 0:
             raise ValueError("El array de frecuencias no puede estar vacío.")
 
-        frequencies = np.asarray(frequencies)
-        displacements_m = np.array([self.displacement(f, U) for f in frequencies])
+        frequencies = np.asarray(frequencies, dtype=float)
+        displacements_m = self.displacement(frequencies, U)
         excursion_mm = displacements_m * 1000  # convierte a mm
         excursion_peak = np.max(excursion_mm)
 
         Xmax_mm = self.Xmax
         excursion_ratio = excursion_mm / Xmax_mm
 
-        Z = np.array([self.impedance(f) for f in frequencies])
-        v = np.array([self.velocity(f) for f in frequencies])
+        v = self.velocity(frequencies)
         a = 1j * 2 * np.pi * frequencies * v
         F = self.Mms * a
         force_array = np.abs(F)
@@ -0,0 +1,218 @@
+# --------------------------------------------
+# dsp.py
+# Bloques DSP para sistemas activos: crossovers Linkwitz-Riley / Butterworth, EQ paramétrico y shelving,
+# transformada de Linkwitz y retardos. Cada bloque se representa como secciones de segundo orden (SOS)
+# [b0, b1, b2, a0, a1, a2] y se evalúa en la grilla de simulación de forma vectorizada (estilo sosfreqz).
+# Los parámetros pueden ser arrays: las SOS toman forma (*lote, secciones, 6) y la respuesta (*lote, F),
+# lo que permite evaluar miles de ajustes de EQ a la vez.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Evaluación vectorizada de SOS
+# -------------------------------
+
+_Z_CACHE = {}                                                           # (fs, f) → (z⁻¹, z⁻²)
+
+def _z_powers(f, fs):
+    # Potencias de z⁻¹ en la grilla; se reutilizan entre bloques y llamadas con la misma grilla.
+    key = (fs, f.shape, f.tobytes())
+    z = _Z_CACHE.get(key)
+    if z is None:
+        if len(_Z_CACHE) > 32:
+            _Z_CACHE.clear()
+        z1 = np.exp(-2j * np.pi * f / fs)
+        z = (z1, z1 * z1)
+        _Z_CACHE[key] = z
+    return z
+
+def sos_response(sos, f, fs=48000):
+    """
+    Respuesta en frecuencia de una cascada de secciones de segundo orden.
+
+    Args:
+        sos: Array (*lote, secciones, 6) con [b0, b1, b2, a0, a1, a2]
+        f: Frecuencias en Hz
+        fs: Frecuencia de muestreo en Hz
+
+    Returns:
+        Respuesta compleja de forma (*lote, F)
+    """
+    sos = np.asarray(sos, dtype=float)
+    f = np.atleast_1d(np.asarray(f, dtype=float))
+    z1, z2 = _z_powers(f, fs)
+    c = sos[..., None]                                                  # (*lote, S, 6, 1)
+    num = c[..., 0, :] + c[..., 1, :] * z1 + c[..., 2, :] * z2
+    den = c[..., 3, :] + c[..., 4, :] * z1 + c[..., 5, :] * z2
+    return np.prod(num / den, axis=-2)
+
+def _stack(b0, b1, b2, a0, a1, a2):
+    # Arma una sección normalizada (a0 = 1) con forma (*lote, 1, 6).
+    b0, b1, b2, a0, a1, a2 = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (b0, b1, b2, a0, a1, a2)))
+    return np.stack([b0 / a0, b1 / a0, b2 / a0, np.ones_like(a0), a1 / a0, a2 / a0], axis=-1)[..., None, :]
+
+#====================================================================================================================================
+# -------------------------------
+# Bloque DSP y cadena de bloques
+# -------------------------------
+
+class Block:
+    """
+    Bloque DSP: cascada de SOS más ganancia y retardo puro.
+
+    Args:
+        sos: Array (*lote, secciones, 6) o None (solo ganancia/retardo)
+        fs: Frecuencia de muestreo en Hz
+        gain: Factor de ganancia lineal (negativo invierte la polaridad)
+        delay: Retardo en s
+    """
+
+    def __init__(self, sos=None, fs=48000, gain=1.0, delay=0.0):
+        self.sos = None if sos is None else np.asarray(sos, dtype=float)
+        self.fs = fs
+        self.gain = np.asarray(gain, dtype=float)
+        self.delay = np.asarray(delay, dtype=float)
+        self._cache = None                                              # (clave de f, respuesta)
+
+    def response(self, f):
+        # Respuesta compleja (*lote, F) con caché para la última grilla evaluada.
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        key = (f.shape, f.tobytes())
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+        H = self.gain[..., None] * np.exp(-2j * np.pi * f * self.delay[..., None])
+        if self.sos is not None:
+            H = H * sos_response(self.sos, f, self.fs)
+        self._cache = (key, H)
+        return H
+
+class Chain:
+    """
+    Cadena de bloques DSP delante de un driver.
+
+    Args:
+        blocks: Lista inicial de bloques
+    """
+
+    def __init__(self, blocks=()):
+        self.blocks = list(blocks)
+
+    def add(self, block):
+        self.blocks.append(block)
+        return self
+
+    def response(self, f):
+        # Producto de las respuestas de todos los bloques (los lotes se combinan por broadcasting).
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        H = np.ones_like(f, dtype=complex)
+        for block in self.blocks:
+            H = H * block.response(f)
+        return H
+
+    def apply(self, driver, f, U=2.83):
+        # Presión compleja en eje del driver precedido por la cadena: (*lote, F).
+        return driver.pressure(np.atleast_1d(np.asarray(f, dtype=float)), U) * self.response(f)
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Diseño de bloques (fórmulas del RBJ Audio EQ Cookbook y transformación bilineal)
+# -------------------------------
+
+def _biquad_terms(f0, Q, fs):
+    w0 = 2 * np.pi * np.asarray(f0, dtype=float) / fs
+    return np.cos(w0), np.sin(w0) / (2 * np.asarray(Q, dtype=float))
+
+def _lowpass2(fc, Q, fs):
+    cw, alpha = _biquad_terms(fc, Q, fs)
+    return _stack((1 - cw) / 2, 1 - cw, (1 - cw) / 2, 1 + alpha, -2 * cw, 1 - alpha)
+
+def _highpass2(fc, Q, fs):
+    cw, alpha = _biquad_terms(fc, Q, fs)
+    return _stack((1 + cw) / 2, -(1 + cw), (1 + cw) / 2, 1 + alpha, -2 * cw, 1 - alpha)
+
+def _first_order(kind, fc, fs):
+    K = np.tan(np.pi * np.asarray(fc, dtype=float) / fs)
+    if kind == "lowpass":
+        return _stack(K, K, 0, K + 1, K - 1, 0)
+    return _stack(1, -1, 0, K + 1, K - 1, 0)
+
+def butterworth(kind, order, fc, fs=48000):
+    """
+    Filtro Butterworth pasa-bajos o pasa-altos de orden 1 a 8.
+
+    Args:
+        kind: "lowpass" o "highpass"
+        order: Orden del filtro
+        fc: Frecuencia de corte (-3 dB) en Hz (escalar o array)
+        fs: Frecuencia de muestreo en Hz
+    """
+    if kind not in ("lowpass", "highpass"):
+        raise ValueError("kind debe ser 'lowpass' o 'highpass'.")
+    if not 1 <= int(order) <= 8:
+        raise ValueError("El orden Butterworth debe estar entre 1 y 8.")
+    order = int(order)
+    design = _lowpass2 if kind == "lowpass" else _highpass2
+    # Q de cada par de polos: polos en s = exp(jπ(2m + N + 1)/(2N)), Q = -1 / (2·Re(s))
+    sections = [design(fc, -1 / (2 * np.cos(np.pi * (2 * m + order + 1) / (2 * order))), fs) for m in range(order // 2)]
+    if order % 2:
+        sections.append(_first_order(kind, fc, fs))
+    return Block(np.concatenate(np.broadcast_arrays(*sections), axis=-2), fs)
+
+def linkwitz_riley(kind, order, fc, fs=48000):
+    """
+    Filtro Linkwitz-Riley (Butterworth de orden/2 al cuadrado) de orden 2, 4 u 8.
+    La suma de LR2 requiere invertir la polaridad de una de las vías.
+    """
+    if int(order) not in (2, 4, 8):
+        raise ValueError("El orden Linkwitz-Riley debe ser 2, 4 u 8.")
+    half = butterworth(kind, int(order) // 2, fc, fs).sos
+    return Block(np.concatenate([half, half], axis=-2), fs)
+
+def peaking(f0, gain_db, Q=1.0, fs=48000):
+    # Ecualizador paramétrico de pico/valle.
+    cw, alpha = _biquad_terms(f0, Q, fs)
+    A = 10**(np.asarray(gain_db, dtype=float) / 40)
+    return Block(_stack(1 + alpha * A, -2 * cw, 1 - alpha * A, 1 + alpha / A, -2 * cw, 1 - alpha / A), fs)
+
+def low_shelf(f0, gain_db, Q=np.sqrt(0.5), fs=48000):
+    # Shelving de graves.
+    cw, alpha = _biquad_terms(f0, Q, fs)
+    A = 10**(np.asarray(gain_db, dtype=float) / 40)
+    s = 2 * np.sqrt(A) * alpha
+    return Block(_stack(A * ((A + 1) - (A - 1) * cw + s), 2 * A * ((A - 1) - (A + 1) * cw), A * ((A + 1) - (A - 1) * cw - s),
+                        (A + 1) + (A - 1) * cw + s, -2 * ((A - 1) + (A + 1) * cw), (A + 1) + (A - 1) * cw - s), fs)
+
+def high_shelf(f0, gain_db, Q=np.sqrt(0.5), fs=48000):
+    # Shelving de agudos.
+    cw, alpha = _biquad_terms(f0, Q, fs)
+    A = 10**(np.asarray(gain_db, dtype=float) / 40)
+    s = 2 * np.sqrt(A) * alpha
+    return Block(_stack(A * ((A + 1) + (A - 1) * cw + s), -2 * A * ((A - 1) + (A + 1) * cw), A * ((A + 1) + (A - 1) * cw - s),
+                        (A + 1) - (A - 1) * cw + s, 2 * ((A - 1) - (A + 1) * cw), (A + 1) - (A - 1) * cw - s), fs)
+
+def linkwitz_transform(f0, Q0, fp, Qp, fs=48000):
+    """
+    Transformada de Linkwitz: reemplaza los polos (f0, Q0) de la caja por (fp, Qp).
+    H(s) = (s² + s·ω0/Q0 + ω0²) / (s² + s·ωp/Qp + ωp²), discretizada por bilineal con pre-warping en √(f0·fp).
+    """
+    w0, wp = 2 * np.pi * np.asarray(f0, dtype=float), 2 * np.pi * np.asarray(fp, dtype=float)
+    wm = np.sqrt(w0 * wp)
+    K = wm / np.tan(wm / (2 * fs))                                      # Constante bilineal con pre-warping
+    b2, b1, b0 = 1.0, w0 / Q0, w0**2
+    a2, a1, a0 = 1.0, wp / Qp, wp**2
+    return Block(_stack(b2 * K**2 + b1 * K + b0, 2 * (b0 - b2 * K**2), b2 * K**2 - b1 * K + b0,
+                        a2 * K**2 + a1 * K + a0, 2 * (a0 - a2 * K**2), a2 * K**2 - a1 * K + a0), fs)
+
+def delay(seconds, fs=48000):
+    # Retardo puro.
+    return Block(None, fs, delay=seconds)
+
+def gain(gain_db=0.0, polarity=1, fs=48000):
+    # Ganancia en dB y polaridad.
+    return Block(None, fs, gain=polarity * 10**(np.asarray(gain_db, dtype=float) / 20))
@@ -0,0 +1,286 @@
+# --------------------------------------------
+# history.py
+# Resultados calculados de cada simulación de la sesión, indexados por la clave sim_key de las GUIs.
+# Los cambios de cursor, leyendas, visibilidad y pestañas solo redibujan desde aquí, y las exportaciones
+# leen los arreglos guardados en vez de volver a simular.
+# SimulationHistory agrega un límite de memoria: guarda en float32, contabiliza bytes por corrida y libera
+# las menos vistas recientemente; una corrida liberada se recalcula desde sus parámetros al volver a usarla.
+# --------------------------------------------
+
+import itertools                                                        # Importa itertools para el reloj de uso (LRU)
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+# Curvas en frecuencia que se exportan (columna, clave del resultado de core.simulation)
+EXPORT_COLUMNS = (
+    ("f [Hz]", "frequencies"),
+    ("|Z| [Ohm]", "Z_magnitude"),
+    ("Fase Z [°]", "Z_phase"),
+    ("SPL [dB]", "SPL_total"),
+    ("Fase SPL [°]", "SPL_phase"),
+    ("SPL cono [dB]", "SPL_cone"),
+    ("SPL puerto [dB]", "SPL_port"),
+    ("Desplazamiento [mm]", "displacements_mm"),
+    ("Velocidad [m/s]", "velocities"),
+    ("P. real [W]", "P_real"),
+    ("P. reactiva [VAR]", "P_reactiva"),
+    ("P. aparente [VA]", "P_aparente"),
+    ("P. acústica [W]", "P_ac"),
+    ("Retardo de grupo [s]", "group_delay_vals"),
+    ("Eficiencia [%]", "efficiency_val"),
+    ("Fuerza [N]", "cone_force_array"),
+)
+
+class SimulationStore:
+    """
+    Registro de las simulaciones de una sesión en orden de creación.
+
+    Cada entrada guarda nombre, parámetros, driver (None para el bandpass isobárico), el dict de
+    curvas de core.simulation y datos extra de la GUI (p. ej. el sistema bandpass).
+    """
+
+    def __init__(self):
+        self._records = {}                                              # sim_key → registro (en orden de inserción)
+
+    def __contains__(self, key):
+        return key in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    def add(self, key, name, params, result, driver=None, **extra):
+        """
+        Guarda una simulación nueva.
+
+        Args:
+            key: Clave sim_key de la GUI (parámetros + recinto)
+            name: Nombre mostrado en leyendas y checkboxes
+            params: Parámetros del driver usados
+            result: dict con las claves de plot_all (core.simulation)
+            driver: Driver simulado (opcional)
+
+        Returns:
+            El registro guardado (dict)
+        """
+        if key in self._records:
+            raise KeyError(f"Ya existe una simulación con la clave {key!r}")
+        record = {"key": key, "name": name, "params": dict(params), "driver": driver,
+                  "result": result, "index": len(self._records)}
+        record.update(extra)
+        self._records[key] = record
+        return record
+
+    def update(self, key, result, driver=None):
+        # Reemplaza las curvas (refinamiento progresivo del mismo barrido).
+        record = self._records[key]
+        record["result"] = result
+        if driver is not None:
+            record["driver"] = driver
+        return record
+
+    def get(self, key):
+        return self._records.get(key)
+
+    def last(self):
+        return next(reversed(self._records.values()), None)
+
+    def at(self, index):
+        # Registro por posición (el mismo índice que los checkboxes y plot_lines).
+        return list(self._records.values())[index]
+
+    def names(self):
+        return [record["name"] for record in self._records.values()]
+
+    def table(self, key):
+        """
+        Curvas en frecuencia de una simulación como tabla (una columna por curva disponible).
+
+        Returns:
+            (encabezados, arreglo de n_frecuencias × n_columnas)
+        """
+        result = self._records[key]["result"]
+        columns = [(name, result[k]) for name, k in EXPORT_COLUMNS if result.get(k) is not None]
+        return [name for name, _ in columns], np.column_stack([np.asarray(v, dtype=float) for _, v in columns])
+
+    def write_csv(self, key, path):
+        # Exporta las curvas guardadas (sin volver a simular).
+        header, data = self.table(key)
+        np.savetxt(path, data, delimiter=",", header=",".join(header), comments="", fmt="%.8g", encoding="utf-8")
+
+    def summary(self, key, units=None):
+        """
+        Texto del resumen de una simulación con los parámetros con que se calculó.
+
+        Args:
+            units: dict opcional parámetro → unidad
+        """
+        record = self._records[key]
+        units = units or {}
+        params_str = "Parámetros del driver:\n"
+        for k, v in record["params"].items():
+            params_str += f"{k}: {v} {units.get(k, '')}\n"
+        resumen = record["driver"].resumen_parametros() if record["driver"] is not None else ""
+        return f"Nombre: {record['name']}\n\n{params_str}\nResumen:\n{resumen}"
+
+#====================================================================================================================================
+# -------------------------------
+# Historial acotado en memoria
+# -------------------------------
+
+def compact_result(result):
+    """
+    Copia del resultado con los arreglos en precisión simple (float32 / complex64).
+
+    La precisión relativa de float32 (~6e-8) es invisible en pantalla y en la lectura del cursor,
+    y reduce a la mitad la memoria de cada corrida. Escalares y None no cambian.
+    """
+    out = {}
+    for key, value in result.items():
+        if isinstance(value, np.ndarray) and value.dtype.kind == "f" and value.dtype.itemsize > 4:
+            value = value.astype(np.float32)
+        elif isinstance(value, np.ndarray) and value.dtype.kind == "c" and value.dtype.itemsize > 8:
+            value = value.astype(np.complex64)
+        out[key] = value
+    return out
+
+def result_nbytes(result):
+    # Bytes ocupados por los arreglos de un resultado (0 si fue liberado).
+    if result is None:
+        return 0
+    return sum(value.nbytes for value in result.values() if isinstance(value, np.ndarray))
+
+class SimulationHistory(SimulationStore):
+    """
+    SimulationStore con presupuesto de memoria y desalojo LRU.
+
+    Cada corrida guarda sus curvas compactadas (compact_result) y una función recompute() que devuelve
+    (driver, resultado) desde sus parámetros. Cuando el total supera budget_bytes se liberan las
+    corridas no fijadas vistas hace más tiempo; on_evict(registro) avisa a la GUI para soltar sus líneas.
+
+    Los bytes de una corrida son los de sus curvas guardadas más, si se pasa artist_nbytes(registro),
+    los que la GUI mantiene vivos para mostrarla (líneas del grid, caché LOD, copias de las pestañas).
+    """
+
+    def __init__(self, budget_bytes=64 * 2**20, on_evict=None, artist_nbytes=None):
+        super().__init__()
+        self.budget_bytes = budget_bytes
+        self.on_evict = on_evict
+        self.artist_nbytes = artist_nbytes
+        self._clock = itertools.count()
+
+    def add(self, key, name, params, result, driver=None, recompute=None, **extra):
+        record = super().add(key, name, params, compact_result(result), driver=driver, **extra)
+        record.update(recompute=recompute, pinned=False, evicted=False, viewed=next(self._clock))
+        self.enforce_budget(keep=key)
+        return record
+
+    def update(self, key, result, driver=None):
+        record = super().update(key, compact_result(result), driver)
+        record["evicted"] = False
+        self.touch(key)
+        self.enforce_budget(keep=key)
+        return record
+
+    def touch(self, key):
+        # Marca la corrida como vista ahora (la última en desalojarse).
+        self._records[key]["viewed"] = next(self._clock)
+
+    # --- Memoria ---
+
+    def _record_nbytes(self, record):
+        # Curvas guardadas + datos de los artistas de la GUI para esa corrida.
+        extra = self.artist_nbytes(record) if self.artist_nbytes is not None else 0
+        return result_nbytes(record["result"]) + extra
+
+    def nbytes(self, key):
+        return self._record_nbytes(self._records[key])
+
+    def total_nbytes(self):
+        return sum(self._record_nbytes(record) for record in self._records.values())
+
+    def memory_report(self):
+        """
+        Memoria por corrida en orden de creación.
+
+        Returns:
+            lista de (nombre, bytes, fijada, liberada); bytes incluye los de artist_nbytes
+        """
+        return [(r["name"], self._record_nbytes(r), r["pinned"], r["evicted"]) for r in self._records.values()]
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        return self.enforce_budget()
+
+    # --- Desalojo ---
+
+    def evict(self, key):
+        record = self._records[key]
+        if record["evicted"]:
+            return record
+        record["result"] = None                                         # Se conservan nombre, parámetros y recompute
+        record["evicted"] = True
+        if self.on_evict is not None:
+            self.on_evict(record)
+        return record
+
+    def enforce_budget(self, keep=None):
+        """
+        Libera corridas no fijadas, de la menos a la más recientemente vista, hasta entrar en el presupuesto.
+
+        Args:
+            keep: Clave que no se libera (la corrida que se está agregando o mostrando)
+
+        Returns:
+            Lista de claves liberadas
+        """
+        evicted = []
+        total = self.total_nbytes()
+        candidates = sorted((r for r in self._records.values()
+                             if not r["pinned"] and not r["evicted"] and r["key"] != keep),
+                            key=lambda r: r["viewed"])
+        for record in candidates:
+            if total <= self.budget_bytes:
+                break
+            total -= self._record_nbytes(record)                          # on_evict suelta también sus artistas
+            self.evict(record["key"])
+            evicted.append(record["key"])
+        return evicted
+
+    def pin(self, key, pinned=True):
+        # Fija (o suelta) una corrida; fijar una corrida liberada la recalcula.
+        record = self._records[key]
+        record["pinned"] = pinned
+        if pinned and record["evicted"]:
+            self.recompute(key)
+        return record
+
+    def recompute(self, key):
+        """
+        Vuelve a calcular una corrida desde sus parámetros guardados.
+
+        Returns:
+            El registro con el resultado restaurado
+        """
+        record = self._records[key]
+        if record["recompute"] is None:
+            raise ValueError(f"La simulación {record['name']!r} no tiene cómo recalcularse")
+        driver, result = record["recompute"]()
+        record["driver"] = driver if driver is not None else record["driver"]
+        return self.update(key, result)
+
+    def ensure(self, key):
+        # Resultado disponible (recalculado si había sido liberado).
+        record = self._records[key]
+        if record["evicted"]:
+            self.recompute(key)
+        return record
+
+    def table(self, key):
+        self.ensure(key)
+        return super().table(key)
@@ -0,0 +1,180 @@
+# --------------------------------------------
+# horn.py
+# Bocina (cónica, exponencial, hiperbólica o tractrix) cargando el frente o la parte trasera del driver.
+# El perfil se discretiza en muchos segmentos cortos (aproximación escalonada de la ecuación de Webster)
+# y se resuelve con las matrices de transferencia por lotes de core.transfer_matrix, con la cadena en caché
+# por geometría. La boca radia como pistón en baffle (core.zrad).
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from core.enclosure import Enclosure                                    # Importa clase base Enclosure
+from core import transfer_matrix as tm                                  # Importa matrices de transferencia por lotes
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class HornBox(Enclosure):
+    """
+    Recinto de bocina.
+
+    Args:
+        throat_area: Área de la garganta en m²
+        mouth_area: Área de la boca en m²
+        length: Longitud axial en m (en tractrix se deduce del perfil y puede omitirse)
+        profile: "conical", "exponential", "hyperbolic" o "tractrix"
+        loading: "front" (la bocina carga el frente del cono) o "rear" (carga la parte trasera)
+        chamber_volume: Cámara de compresión entre el cono y la garganta, en litros
+        rear_volume: Cámara trasera sellada en litros (solo en carga frontal; None → sin carga trasera)
+        T: Parámetro de forma del perfil hiperbólico (T = 1 → exponencial)
+        segments: Número de segmentos de la discretización
+    """
+
+    PROFILES = ("conical", "exponential", "hyperbolic", "tractrix")
+
+    def __init__(self, throat_area, mouth_area, length=None, profile="exponential", loading="front",
+                 chamber_volume=0.0, rear_volume=None, T=0.6, segments=200):
+        if profile not in self.PROFILES:
+            raise ValueError(f"Perfil de bocina no soportado: {profile}")
+        if loading not in ("front", "rear"):
+            raise ValueError("loading debe ser 'front' o 'rear'.")
+        if throat_area <= 0 or mouth_area <= throat_area:
+            raise ValueError("La boca debe ser mayor que la garganta y ambas mayores que cero.")
+        if profile != "tractrix" and (length is None or length <= 0):
+            raise ValueError("La longitud de la bocina debe ser mayor que cero.")
+
+        self.throat_area = throat_area
+        self.mouth_area = mouth_area
+        self.profile = profile
+        self.loading = loading
+        self.T = T
+        self.segments = int(segments)
+        self.cone_radiates = loading == "rear"                          # En carga frontal solo radia la boca
+
+        if profile == "tractrix":
+            self._tractrix = self._tractrix_table()
+            length = self._tractrix[0][-1]                              # Longitud natural del perfil
+        self.length = length
+
+        self.dx = self.length / self.segments
+        self.areas = self.area((np.arange(self.segments) + 0.5) * self.dx)
+        horn_litros = np.sum(self.areas) * self.dx * 1000
+
+        super().__init__(horn_litros + chamber_volume + (rear_volume or 0.0))
+        self.C_chamber = chamber_volume / 1000 / (self.rho0 * self.c**2)                    # Compliancia de la cámara de compresión
+        self.C_rear = None if rear_volume is None else rear_volume / 1000 / (self.rho0 * self.c**2)
+
+#====================================================================================================================================
+    # ===============================
+    # Perfil de la bocina
+    # ===============================
+
+    def area(self, x):
+        # Área en m² a la distancia x (m) desde la garganta.
+        x = np.asarray(x, dtype=float)
+        St, Sm, L = self.throat_area, self.mouth_area, self.length
+        if self.profile == "conical":
+            rt, rm = np.sqrt(St / np.pi), np.sqrt(Sm / np.pi)
+            return np.pi * (rt + (rm - rt) * x / L)**2
+        if self.profile == "exponential":
+            return St * np.exp(np.log(Sm / St) * x / L)
+        if self.profile == "hyperbolic":
+            u = self._hyperbolic_scale()
+            return St * (np.cosh(u * x / L) + self.T * np.sinh(u * x / L))**2
+        z, S = self._tractrix
+        return np.interp(x, z, S)
+
+    def _hyperbolic_scale(self):
+        # Resuelve u = L/x0 tal que cosh(u) + T·sinh(u) = √(Sm/St) por bisección.
+        target = np.sqrt(self.mouth_area / self.throat_area)
+        lo, hi = 0.0, 1.0
+        while np.cosh(hi) + self.T * np.sinh(hi) < target:
+            hi *= 2
+        for _ in range(100):
+            mid = (lo + hi) / 2
+            if np.cosh(mid) + self.T * np.sinh(mid) < target:
+                lo = mid
+            else:
+                hi = mid
+        return (lo + hi) / 2
+
+    def _tractrix_table(self):
+        # Perfil tractrix: x(r) = rm·ln((rm + √(rm² - r²)) / r) - √(rm² - r²), medido desde la boca.
+        rt, rm = np.sqrt(self.throat_area / np.pi), np.sqrt(self.mouth_area / np.pi)
+        r = np.geomspace(rt, rm, 4000)
+        root = np.sqrt(np.maximum(rm**2 - r**2, 0.0))
+        x = rm * np.log((rm + root) / r) - root
+        z = x[0] - x                                                    # Distancia desde la garganta (creciente)
+        return z, np.pi * r**2
+
+#====================================================================================================================================
+    # ===============================
+    # Impedancias
+    # ===============================
+
+    def chain_matrix(self, f):
+        # Matriz total (F, 2, 2) de garganta a boca (en caché por geometría).
+        return tm.duct_chain(f, self.areas, self.dx, self.rho0, self.c)
+
+    def mouth_impedance(self, f):
+        # Impedancia acústica de radiación de la boca (pistón en baffle).
+        return self.zrad.baffled_piston(f, self.mouth_area) / self.mouth_area**2
+
+    def throat_impedance(self, f):
+        # Impedancia acústica en la garganta.
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        return tm.input_impedance(self.chain_matrix(f), self.mouth_impedance(f))
+
+    def _horn_side(self, f):
+        # Impedancia acústica del lado de la bocina vista por el cono y fracción del caudal que entra a la garganta.
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        Zt = self.throat_impedance(f)
+        if not self.C_chamber:
+            return Zt, np.ones_like(Zt)
+        Zch = 1 / (1j * 2 * np.pi * f * self.C_chamber)
+        return Zt * Zch / (Zt + Zch), Zch / (Zt + Zch)
+
+    def _rear_chamber(self, f):
+        # Impedancia acústica de la cámara trasera sellada (carga frontal).
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        if self.C_rear is None:
+            return np.zeros_like(f, dtype=complex)
+        return 1 / (1j * 2 * np.pi * f * self.C_rear)
+
+    def acoustic_load(self, f, Sd):
+        # Impedancia mecánica trasera: bocina (carga trasera) o cámara sellada (carga frontal).
+        f_was_scalar = np.isscalar(f)
+        Za = self._horn_side(f)[0] if self.loading == "rear" else self._rear_chamber(f)
+        Zm = Za * Sd**2
+        return Zm[0] if f_was_scalar else Zm
+
+    def radiation_impedance(self, f, Sd):
+        # Impedancia mecánica frontal: la bocina en carga frontal; en carga trasera la carga de aire ya está en Mms.
+        f_was_scalar = np.isscalar(f)
+        if self.loading == "front":
+            Zm = self._horn_side(f)[0] * Sd**2
+        else:
+            Zm = np.zeros_like(np.atleast_1d(np.asarray(f, dtype=float)), dtype=complex)
+        return Zm[0] if f_was_scalar else Zm
+
+    def secondary_output(self, f, Sd, v):
+        """
+        Caudal radiado por la boca.
+
+        Args:
+            f: Frecuencias en Hz
+            Sd: Área del diafragma en m²
+            v: Velocidad compleja del diafragma (positiva hacia el frente)
+
+        Returns:
+            (Q_boca, área de la boca)
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        Q_cone = v * Sd if self.loading == "front" else -v * Sd        # La cara trasera empuja en contrafase
+        Q_throat = Q_cone * self._horn_side(f)[1]
+        return Q_throat * tm.volume_velocity_ratio(self.chain_matrix(f), self.mouth_impedance(f)), self.mouth_area
+
+    def add_to_circuit(self, circuit, node, prefix=""):
+        # Netlist acústico: carga frontal y trasera en serie (mismo caudal del cono) como una impedancia.
+        circuit.add_impedance(prefix + "Horn", node, "0", lambda f: self.total_acoustic_load(f, 1.0))
+        return circuit
@@ -0,0 +1,125 @@
+# --------------------------------------------
+# max_spl.py
+# SPL máximo y curvas de límite: para cada frecuencia, el voltaje al que se alcanza el primer límite
+# (excursión, potencia térmica, velocidad del aire en el puerto, voltaje o corriente del amplificador).
+# El modelo es lineal en U, así que cada límite da un voltaje máximo en forma cerrada a partir de las
+# respuestas por voltio; todo se evalúa sobre la grilla completa y en lote sobre varios diseños.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+LIMITS = ("excursion", "thermal", "port_velocity", "amp_voltage", "amp_current")
+
+def stack_responses(drivers, f, U=1.0):
+    """
+    Respuestas de Driver.responses() de varios diseños apiladas en arrays (D, F).
+
+    Args:
+        drivers: Lista de Drivers
+        f: Frecuencias en Hz (F,)
+        U: Voltaje RMS aplicado en V
+
+    Returns:
+        dict con "p", "x", "I" y "v_port" (D, F); "v_port" es NaN en los diseños sin puerto
+        y None si ninguno lo tiene
+    """
+    responses = [d.responses(f, U) for d in drivers]
+    stacked = {key: np.stack([r[key] for r in responses]) for key in ("p", "x", "I")}
+    ports = [r["v_port"] for r in responses]
+    stacked["v_port"] = None if all(v is None for v in ports) else np.stack(
+        [np.full(np.shape(f), np.nan) if v is None else v for v in ports])
+    return stacked
+
+def limit_voltages(response, Re, Xmax_mm=None, P_rated=None, port_velocity_max=None, amp_voltage=None, amp_current=None):
+    """
+    Voltaje RMS máximo permitido por cada límite, a partir de las respuestas a 1 V.
+
+    Args:
+        response: dict de Driver.responses(f, 1.0) (los arrays pueden tener un eje de lote delante de f)
+        Re: Resistencia DC de la bobina en Ohm (disipación térmica |I|²·Re)
+        Xmax_mm: Excursión máxima lineal (pico) en mm
+        P_rated: Potencia térmica nominal en W
+        port_velocity_max: Velocidad pico máxima del aire en el puerto en m/s
+        amp_voltage: Voltaje RMS máximo del amplificador en V
+        amp_current: Corriente RMS máxima del amplificador en A
+
+    Returns:
+        Array (len(LIMITS), ...) con el voltaje máximo por límite (inf si el límite no aplica)
+    """
+    shape = np.shape(response["p"])
+    U = np.full((len(LIMITS),) + shape, np.inf)
+    with np.errstate(divide="ignore"):
+        if Xmax_mm is not None:
+            U[0] = Xmax_mm / 1000 / (np.sqrt(2) * np.abs(response["x"]))   # Excursión pico = √2·|x_rms|
+        if P_rated is not None:
+            U[1] = np.sqrt(P_rated / Re) / np.abs(response["I"])          # P = |I|²·Re
+        if port_velocity_max is not None and response["v_port"] is not None:
+            U[2] = port_velocity_max / (np.sqrt(2) * np.abs(response["v_port"]))
+        if amp_voltage is not None:
+            U[3] = amp_voltage
+        if amp_current is not None:
+            U[4] = amp_current / np.abs(response["I"])
+    return U
+
+def max_spl(drivers, f, Xmax_mm="driver", P_rated="driver", port_velocity_max=None, amp_voltage=None, amp_current=None):
+    """
+    Curva de SPL máximo y límite que la gobierna en cada frecuencia.
+
+    Args:
+        drivers: Driver o lista de Drivers (diseños a comparar en lote)
+        f: Frecuencias en Hz (F,)
+        Xmax_mm: Excursión máxima en mm ("driver" → driver.Xmax; None → sin límite; escalar o array (D,))
+        P_rated: Potencia nominal en W ("driver" → driver.Pe; None → sin límite; escalar o array (D,))
+        port_velocity_max: Velocidad pico máxima en el puerto en m/s (solo bass-reflex; p. ej. 17 ≈ Mach 0.05)
+        amp_voltage: Voltaje RMS máximo del amplificador en V
+        amp_current: Corriente RMS máxima del amplificador en A
+
+    Returns:
+        dict con arrays (D, F) (o (F,) si se pasa un solo Driver):
+            "SPL_max", "U_max" (voltaje RMS al primer límite), "governing" (nombre del límite),
+            "limit_index" (índice en LIMITS), "U_limits" (len(LIMITS), ...) y "SPL_1V"
+    """
+    single = not isinstance(drivers, (list, tuple))
+    drivers = [drivers] if single else list(drivers)
+    f = np.atleast_1d(np.asarray(f, dtype=float))
+    if np.any(f <= 0):
+        raise ValueError("Las frecuencias deben ser mayores que cero.")
+
+    stacked = stack_responses(drivers, f)
+
+    def per_design(value, attr):
+        # Valor del límite por diseño como columna (D, 1); "driver" toma el atributo de cada Driver.
+        if isinstance(value, str) and value == "driver":
+            values = [getattr(d, attr, None) for d in drivers]
+            if all(v is None for v in values):
+                return None
+            value = [np.inf if v is None else v for v in values]
+        return None if value is None else np.reshape(np.asarray(value, dtype=float), (-1, 1))
+
+    Re = np.array([d.Re for d in drivers])[:, None]
+    U_limits = limit_voltages(stacked, Re, per_design(Xmax_mm, "Xmax"), per_design(P_rated, "Pe"),
+                              port_velocity_max, amp_voltage, amp_current)
+    U_limits = np.where(np.isnan(U_limits), np.inf, U_limits)
+    if np.all(np.isinf(U_limits)):
+        raise ValueError("Debe definirse al menos un límite (Xmax, potencia, puerto o amplificador).")
+
+    index = np.argmin(U_limits, axis=0)
+    U_max = np.take_along_axis(U_limits, index[None], axis=0)[0]
+    spl_1v = 20 * np.log10(np.abs(stacked["p"]) / 20e-6)
+    result = {
+        "f": f,
+        "SPL_max": spl_1v + 20 * np.log10(U_max),                       # Lineal en U: +20·log10(U) dB
+        "U_max": U_max,
+        "governing": np.asarray(LIMITS)[index],
+        "limit_index": index,
+        "U_limits": U_limits,
+        "SPL_1V": spl_1v,
+    }
+    if single:
+        result = {key: (value[:, 0] if key == "U_limits" else value[0] if key != "f" else value)
+                  for key, value in result.items()}
+    return result
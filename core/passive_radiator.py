@@ -0,0 +1,152 @@
+# --------------------------------------------
+# passive_radiator.py
+# Caja con radiador pasivo: el cono y el radiador quedan acoplados por la compliancia del aire de la caja.
+# Se resuelve como sistema de dos grados de libertad para todas las frecuencias a la vez; la masa
+# agregada del radiador puede ser un array para evaluar lotes de sintonías en una sola llamada.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from core.enclosure import Enclosure                                    # Importa clase base Enclosure
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class PassiveRadiatorBox(Enclosure):
+    """
+    Caja cerrada con un radiador pasivo.
+
+    Args:
+        Vb_litros: Volumen interno en litros
+        Sp: Área efectiva del radiador en m²
+        Mmp: Masa móvil del radiador en kg
+        Cmp: Compliancia de la suspensión del radiador en m/N
+        Rmp: Resistencia mecánica del radiador en N·s/m (None → se deriva de Qmp)
+        Qmp: Factor de calidad mecánico del radiador (usado si Rmp es None)
+        added_mass: Masa agregada en kg (escalar o array para lotes de sintonía)
+    """
+
+    def __init__(self, Vb_litros, Sp, Mmp, Cmp, Rmp=None, Qmp=7.0, added_mass=0.0):
+        if Sp <= 0 or Mmp <= 0 or Cmp <= 0:
+            raise ValueError("Sp, Mmp y Cmp del radiador deben ser mayores que cero.")
+        super().__init__(Vb_litros)
+
+        self.Sp = Sp
+        self.Mmp = Mmp
+        self.Cmp = Cmp
+        if Rmp is None:
+            Rmp = np.sqrt(Mmp / Cmp) / Qmp                              # Rmp = ωp·Mmp / Qmp
+        self.Rmp = Rmp
+        self.added_mass = np.asarray(added_mass, dtype=float)
+        self.Cab = self.Vb_m3 / (self.rho0 * self.c**2)                 # Compliancia acústica de la caja
+
+    def tuning_frequency(self):
+        # Frecuencia de sintonía del radiador cargado por la caja: (1/2π)·√((1/Cmp + Sp²/Cab) / Mtotal).
+        M = self.Mmp + self.added_mass
+        return np.sqrt((1 / self.Cmp + self.Sp**2 / self.Cab) / M) / (2 * np.pi)
+
+#====================================================================================================================================
+
+    def _impedances(self, f):
+        # Impedancia acústica de la caja y del radiador (con el eje de lote de la masa agregada delante de f).
+        w = 2 * np.pi * np.atleast_1d(np.asarray(f, dtype=float))
+        M = (self.Mmp + self.added_mass)[..., None]
+        Zmp = self.Rmp + 1j * w * M + 1 / (1j * w * self.Cmp)          # Impedancia mecánica del radiador
+        return 1 / (1j * w * self.Cab), Zmp / self.Sp**2
+
+    def acoustic_load(self, f, Sd):
+        # Impedancia mecánica trasera: caja en paralelo con el radiador, llevada al diafragma.
+        f_was_scalar = np.isscalar(f)
+        Zab, Zap = self._impedances(f)
+        Zm = Zab * Zap / (Zab + Zap) * Sd**2
+        return Zm[..., 0] if f_was_scalar else Zm
+
+    def radiation_impedance(self, f, Sd):
+        # La carga de aire frontal ya está incluida en Mms.
+        return np.zeros_like(np.asarray(f, dtype=float), dtype=complex)
+
+    def secondary_output(self, f, Sd, v):
+        # Caudal radiado por el radiador (en contrafase con el cono por debajo de la sintonía).
+        Zab, Zap = self._impedances(f)
+        return -v * Sd * Zab / (Zab + Zap), self.Sp
+
+#====================================================================================================================================
+
+    def solve(self, driver, f, U=2.83):
+        """
+        Resuelve el sistema acoplado cono-radiador (dos grados de libertad) en todas las frecuencias.
+
+            (Zmd + Bl²/Ze + Sd²·Zab)·vd +          Sd·Sp·Zab·vp = Bl·U/Ze
+                         Sd·Sp·Zab·vd + (Zmp + Sp²·Zab)·vp = 0
+
+        con Zab la impedancia acústica de la caja y velocidades positivas hacia afuera.
+
+        Args:
+            driver: Driver montado en la caja
+            f: Frecuencias en Hz
+            U: Voltaje RMS aplicado en V
+
+        Returns:
+            dict con arrays (*lote, F): "v_cone", "v_radiator", "x_cone", "x_radiator" (desplazamientos
+            complejos en m), "p_cone", "p_radiator", "p_total" (Pa a 1 m) y "SPL" (dB)
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        w = 2 * np.pi * f
+        Sd, Sp = driver.Sd, self.Sp
+
+        Ze = driver.blocked_impedance(f)
+        Zab, Zap = self._impedances(f)
+        Zmp = Zap * Sp**2
+        Zmd = driver.Rms + 1j * w * driver.Mms + 1 / (1j * w * driver.Cms) + driver.Bl**2 / Ze
+
+        a11 = Zmd + Sd**2 * Zab
+        a12 = Sd * Sp * Zab
+        a22 = Zmp + Sp**2 * Zab
+        F = driver.Bl * U / Ze                                          # Fuerza con la bobina bloqueada
+        det = a11 * a22 - a12**2
+        vd = F * a22 / det
+        vp = -F * a12 / det
+
+        def radiated(v, S):                                             # Presión a 1 m de un pistón en baffle
+            D = driver._piston_directivity(np.broadcast_to(w / driver.c * np.sqrt(S / np.pi), np.shape(v)).copy())
+            return 1j * w * driver.rho0 * v * S * D / (2 * np.pi * 1.0)
+
+        p_cone, p_radiator = radiated(vd, Sd), radiated(vp, Sp)
+        p_total = p_cone + p_radiator
+        return {
+            "v_cone": vd,
+            "v_radiator": vp,
+            "x_cone": vd / (1j * w),
+            "x_radiator": vp / (1j * w),
+            "p_cone": p_cone,
+            "p_radiator": p_radiator,
+            "p_total": p_total,
+            "SPL": 20 * np.log10(np.abs(p_total) / 20e-6),
+        }
+
+    def add_to_circuit(self, circuit, node, prefix=""):
+        # Netlist acústico: Cab en paralelo con la rama del radiador (Rmp, Mmp, Cmp llevados al lado acústico).
+        Sp2 = self.Sp**2
+        circuit.add_capacitor(prefix + "Cab", node, "0", self.Cab)
+        circuit.add_resistor(prefix + "Rap", node, prefix + "pr1", self.Rmp / Sp2)
+        circuit.add_inductor(prefix + "Map", prefix + "pr1", prefix + "pr2", (self.Mmp + self.added_mass) / Sp2)
+        circuit.add_capacitor(prefix + "Cap", prefix + "pr2", "0", self.Cmp * Sp2)  # Su corriente es el caudal del radiador
+        return circuit
+
+    def rational_load(self):
+        """
+        Polinomios en s (mayor potencia primero) de la carga acústica trasera y de la salida radiada.
+
+        Con Zap = N/s, N = (M·s² + Rmp·s + 1/Cmp)/Sp²:  Za = Zab || Zap = N / (Cab·s·N + s) = Na / Da
+        y Q_radiado / Q_cono = Zap / (Zab + Zap) = Cab·s·N / Da. La masa agregada en lote
+        da coeficientes de forma (*lote, n).
+
+        Returns:
+            (Na, Da, No) con Q_radiado / Q_cono = No / Da
+        """
+        M = self.Mmp + self.added_mass
+        N = np.stack(np.broadcast_arrays(M, self.Rmp, 1 / self.Cmp), axis=-1) / self.Sp**2
+        No = self.Cab * np.concatenate([N, np.zeros(N.shape[:-1] + (1,))], axis=-1)
+        Da = No.copy()
+        Da[..., -2] += 1.0                                              # + s
+        return N, Da, No
@@ -0,0 +1,87 @@
+# --------------------------------------------
+# port_compression.py
+# Compresión no lineal del puerto bass-reflex a alto nivel.
+# La turbulencia agrega una resistencia acústica que crece con la velocidad del aire en el puerto:
+#     R_nl = ½·ρ0·K·|v_pico| / Sp
+# El sistema (lineal para una R dada) se resuelve por iteración de punto fijo amortiguada sobre |v_port|,
+# simultáneamente en todas las frecuencias y niveles de excitación, con máscaras de convergencia.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+def port_compression(driver, f, U, K=1.5, damping=0.5, tol=1e-4, max_iter=200, chuff_mach=0.05):
+    """
+    SPL comprimido del bass-reflex para varios niveles de excitación.
+
+    Args:
+        driver: Driver con un BassReflexBox
+        f: Frecuencias en Hz (F,)
+        U: Voltajes RMS (escalar o array (L,))
+        K: Coeficiente de pérdidas por turbulencia (entrada + salida del puerto)
+        damping: Factor de amortiguamiento de la iteración (0 < damping ≤ 1)
+        tol: Tolerancia relativa sobre |v_port|
+        max_iter: Número máximo de iteraciones
+        chuff_mach: Número de Mach pico a partir del cual se marca riesgo de ruido de puerto (chuffing)
+
+    Returns:
+        dict con arrays (L, F) (o (F,) si U es escalar):
+            "SPL", "SPL_linear", "compression_db", "v_port" (velocidad compleja RMS), "mach" (pico),
+            "chuffing" (bool), "R_nl" (resistencia no lineal), "converged" (bool) e "iterations" (int)
+    """
+    if 'BassReflex' not in driver.enclosure.__class__.__name__:
+        raise ValueError("La compresión de puerto requiere un Driver con caja bass-reflex.")
+    if not 0 < damping <= 1:
+        raise ValueError("damping debe estar en (0, 1].")
+
+    f = np.atleast_1d(np.asarray(f, dtype=float))
+    U_was_scalar = np.isscalar(U)
+    U = np.atleast_1d(np.asarray(U, dtype=float))[:, None]              # (L, 1)
+    Sp = driver.enclosure.area_port
+    gain = 0.5 * driver.rho0 * K * np.sqrt(2) / Sp                      # R_nl = gain·|v_rms| (|v_pico| = √2·|v_rms|)
+
+    # Punto de partida: modelo lineal
+    p_d0, p_p0, _, v0 = driver._bassreflex_pressures(f, U, with_velocities=True)
+    v_mag = np.abs(v0)
+    R = gain * v_mag
+    p_d, p_p, v = p_d0, p_p0, v0
+
+    active = np.ones(v_mag.shape, dtype=bool)
+    iterations = np.zeros(v_mag.shape, dtype=int)
+    for _ in range(max_iter):
+        p_d_new, p_p_new, _, v_new = driver._bassreflex_pressures(f, U, R_extra=R, with_velocities=True)
+        target = (1 - damping) * v_mag + damping * np.abs(v_new)       # Paso amortiguado sobre |v_port|
+        change = np.abs(target - v_mag) / np.maximum(v_mag, 1e-12)
+
+        # Solo avanzan los puntos que aún no convergieron
+        v_mag = np.where(active, target, v_mag)
+        p_d = np.where(active, p_d_new, p_d)
+        p_p = np.where(active, p_p_new, p_p)
+        v = np.where(active, v_new, v)
+        iterations += active
+        active &= change > tol
+        if not active.any():
+            break
+        R = gain * v_mag
+
+    spl_lin = 20 * np.log10(np.abs(p_d0 + p_p0) / 20e-6)
+    spl = 20 * np.log10(np.abs(p_d + p_p) / 20e-6)
+    mach = np.sqrt(2) * np.abs(v) / driver.c
+    result = {
+        "f": f,
+        "SPL": spl,
+        "SPL_linear": spl_lin,
+        "compression_db": spl_lin - spl,
+        "v_port": v,
+        "mach": mach,
+        "chuffing": mach > chuff_mach,
+        "R_nl": gain * np.abs(v),
+        "converged": ~active,
+        "iterations": iterations,
+    }
+    if U_was_scalar:
+        result = {key: (value[0] if key != "f" else value) for key, value in result.items()}
+    return result
@@ -0,0 +1,244 @@
+# --------------------------------------------
+# rational.py
+# Funciones de transferencia racionales en s para los sistemas de parámetros concentrados
+# (baffle infinito, caja sellada, bass-reflex, pasabanda y radiador pasivo).
+# Cada recinto entrega los polinomios de su carga acústica (rational_load) y el sistema completo se arma
+# con aritmética de polinomios; la evaluación usa Horner vectorizado, los polos salen de la matriz
+# compañera y las respuestas al impulso y al escalón son exactas a partir de los residuos.
+# Los coeficientes pueden tener un eje de lote delante (*lote, n) para evaluar muchos diseños a la vez.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Aritmética de polinomios por lotes (mayor potencia primero)
+# -------------------------------
+
+def _pad(p, n):
+    # Completa con ceros a la izquierda hasta n coeficientes.
+    p = np.asarray(p, dtype=float)
+    return np.concatenate([np.zeros(p.shape[:-1] + (n - p.shape[-1],)), p], axis=-1)
+
+def polyadd(a, b):
+    n = max(np.shape(a)[-1], np.shape(b)[-1])
+    return _pad(a, n) + _pad(b, n)
+
+def polymul(a, b):
+    a, b = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    n, m = a.shape[-1], b.shape[-1]
+    out = np.zeros(np.broadcast_shapes(a.shape[:-1], b.shape[:-1]) + (n + m - 1,))
+    for i in range(n):                                                  # Convolución sobre el último eje (grados bajos)
+        out[..., i:i + m] += a[..., i:i + 1] * b
+    return out
+
+def horner(p, s):
+    """
+    Evalúa polinomios (*lote, n) en los puntos s (S,) por Horner; resultado (*lote, S).
+    """
+    p = np.asarray(p)
+    acc = np.zeros(p.shape[:-1] + np.shape(s), dtype=complex)
+    for k in range(p.shape[-1]):
+        acc = acc * s + p[..., k, None]
+    return acc
+
+def _trim(num, den):
+    # Quita ceros líderes comunes a todo el lote y cancela potencias de s compartidas por num y den.
+    while den.shape[-1] > 1 and not np.any(den[..., 0]):
+        den = den[..., 1:]
+    while num.shape[-1] > 1 and not np.any(num[..., 0]):
+        num = num[..., 1:]
+    while num.shape[-1] > 1 and den.shape[-1] > 1 and not np.any(num[..., -1]) and not np.any(den[..., -1]):
+        num, den = num[..., :-1], den[..., :-1]
+    return num, den
+
+#====================================================================================================================================
+# -------------------------------
+# Función de transferencia racional
+# -------------------------------
+
+class RationalTF:
+    """
+    H(s) = num(s) / den(s) con coeficientes reales (*lote, n), mayor potencia primero.
+    """
+
+    def __init__(self, num, den):
+        num, den = np.asarray(num, dtype=float), np.asarray(den, dtype=float)
+        shape = np.broadcast_shapes(num.shape[:-1], den.shape[:-1])
+        self.num, self.den = _trim(np.broadcast_to(num, shape + num.shape[-1:]).copy(),
+                                   np.broadcast_to(den, shape + den.shape[-1:]).copy())
+        self._cache = {}
+
+    def __mul__(self, other):
+        if isinstance(other, RationalTF):
+            return RationalTF(polymul(self.num, other.num), polymul(self.den, other.den))
+        return RationalTF(self.num * np.asarray(other, dtype=float)[..., None], self.den)
+
+    __rmul__ = __mul__
+
+    def times_s(self, power=1):
+        # H(s)·s^power (derivada temporal para power > 0, integral para power < 0).
+        if power >= 0:
+            return RationalTF(np.concatenate([self.num, np.zeros(self.num.shape[:-1] + (power,))], axis=-1), self.den)
+        return RationalTF(self.num, np.concatenate([self.den, np.zeros(self.den.shape[:-1] + (-power,))], axis=-1))
+
+    def __call__(self, s):
+        return horner(self.num, s) / horner(self.den, s)
+
+    def response(self, f):
+        # Respuesta en frecuencia H(j·2πf), forma (*lote, F).
+        s = 2j * np.pi * np.atleast_1d(np.asarray(f, dtype=float))
+        return self(s)
+
+#====================================================================================================================================
+
+    def poles(self):
+        # Raíces del denominador (*lote, n) como autovalores de la matriz compañera (por lotes).
+        if "poles" not in self._cache:
+            self._cache["poles"] = _roots(self.den)
+        return self._cache["poles"]
+
+    def zeros(self):
+        return _roots(self.num)
+
+    def gain(self):
+        # Ganancia de la forma polos-ceros: coeficiente líder del numerador / del denominador.
+        return self.num[..., 0] / self.den[..., 0]
+
+    def pole_frequencies(self):
+        """
+        Frecuencia natural y Q de cada polo: f0 = |p|/2π, Q = |p| / (−2·Re p).
+
+        Los pares complejos conjugados aparecen dos veces; los polos reales dan Q ≤ 0.5.
+
+        Returns:
+            (f0 en Hz, Q), cada uno (*lote, n)
+        """
+        p = self.poles()
+        mag = np.abs(p)
+        with np.errstate(divide="ignore"):
+            return mag / (2 * np.pi), mag / (-2 * p.real)
+
+    def residues(self):
+        """
+        Expansión en fracciones parciales H(s) = k + Σ r_i / (s − p_i), asumiendo polos simples.
+
+        Returns:
+            (r, p, k): residuos (*lote, n), polos (*lote, n) y término directo (*lote,)
+        """
+        if self.num.shape[-1] > self.den.shape[-1]:
+            raise ValueError("La función de transferencia debe ser propia (grado del numerador ≤ grado del denominador).")
+        if "residues" not in self._cache:
+            p = self.poles()
+            n = self.den.shape[-1] - 1
+            k = self.num[..., 0] / self.den[..., 0] if self.num.shape[-1] == n + 1 else np.zeros(self.den.shape[:-1])
+            d_den = self.den[..., :-1] * np.arange(n, 0, -1)           # Derivada del denominador
+            num_p = _horner_at(self.num, p) - k[..., None] * _horner_at(self.den, p)   # Parte estrictamente propia
+            r = num_p / _horner_at(d_den, p)
+            self._cache["residues"] = (r, p, k)
+        return self._cache["residues"]
+
+    def impulse(self, t):
+        # Respuesta al impulso h(t) = Σ r_i·e^(p_i·t) (sin la delta del término directo), forma (*lote, T).
+        r, p, _ = self.residues()
+        t = np.asarray(t, dtype=float)
+        return np.real(np.sum(r[..., None] * np.exp(p[..., None] * t), axis=-2)) * (t >= 0)
+
+    def step(self, t):
+        # Respuesta al escalón k + Σ r_i·(e^(p_i·t) − 1) / p_i, forma (*lote, T).
+        r, p, k = self.residues()
+        t = np.asarray(t, dtype=float)
+        terms = r[..., None] * np.expm1(p[..., None] * t) / p[..., None]
+        return (k[..., None] + np.real(np.sum(terms, axis=-2))) * (t >= 0)
+
+def _roots(c):
+    # Raíces de polinomios por lotes (*lote, n) → (*lote, n-1).
+    c = np.asarray(c, dtype=float)
+    n = c.shape[-1] - 1
+    if n < 1:
+        return np.zeros(c.shape[:-1] + (0,), dtype=complex)
+    companion = np.zeros(c.shape[:-1] + (n, n))
+    companion[..., 0, :] = -c[..., 1:] / c[..., :1]
+    companion[..., np.arange(1, n), np.arange(n - 1)] = 1.0
+    return np.linalg.eigvals(companion).astype(complex)
+
+def _horner_at(c, x):
+    # Evalúa polinomios (*lote, n) en puntos propios de cada lote x (*lote, m).
+    acc = np.zeros(x.shape, dtype=complex)
+    for k in range(c.shape[-1]):
+        acc = acc * x + c[..., k, None]
+    return acc
+
+#====================================================================================================================================
+# -------------------------------
+# Sistema driver + recinto
+# -------------------------------
+
+OUTPUTS = ("velocity", "displacement", "acceleration", "current", "impedance", "pressure")
+
+def system_tf(driver, output="pressure", r=1.0):
+    """
+    Función de transferencia racional del sistema completo (mismo circuito equivalente que driver_netlist).
+
+        Ze(s) = Rg + Re + s·Le (|| Reh),   Zm(s) = s·Mms + Rms + 1/(s·Cms) + Sd²·Za(s)
+        v / U = Bl / (Ze·Zm + Bl²)
+
+    La presión es la de baja frecuencia en semiespacio (sin directividad): p = ρ0·s·Q_radiado / (2π·r).
+
+    Args:
+        driver: Driver (o lista de Drivers con el mismo tipo de recinto para evaluar en lote)
+        output: Una de OUTPUTS; todas por voltio salvo "impedance" (Ohm)
+        r: Distancia en m para la presión
+
+    Returns:
+        RationalTF con eje de lote si se pasa una lista
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"Salida no soportada: {output}")
+    if isinstance(driver, (list, tuple)):
+        parts = [_system_polynomials(d, output, r) for d in driver]
+        n = max(p[0].shape[-1] for p in parts)
+        m = max(p[1].shape[-1] for p in parts)
+        return RationalTF(np.stack([_pad(p[0], n) for p in parts]), np.stack([_pad(p[1], m) for p in parts]))
+    return RationalTF(*_system_polynomials(driver, output, r))
+
+def _system_polynomials(driver, output, r):
+    # Numerador y denominador de una salida del sistema para un Driver.
+    enclosure = driver.enclosure
+    if enclosure is None:
+        Na, Da, No = np.array([0.0]), np.array([1.0]), np.array([1.0])
+    elif hasattr(enclosure, "rational_load"):
+        Na, Da, No = enclosure.rational_load()                          # Za = Na/Da, Q_radiado/Q_cono = No/Da
+    else:
+        raise ValueError(f"{enclosure.__class__.__name__} no es un sistema de parámetros concentrados (sin rational_load).")
+
+    # Bobina: Ze = Ne / De
+    if driver.Reh:
+        Ne = np.array([driver.Le * (driver.Re + driver.Rg + driver.Reh), (driver.Re + driver.Rg) * driver.Reh])
+        De = np.array([driver.Le, driver.Reh])
+    else:
+        Ne, De = np.array([driver.Le, driver.Re + driver.Rg]), np.array([1.0])
+
+    # Mecánica + carga: Zm = Nm / (s·Da)
+    Nmech = np.array([driver.Mms, driver.Rms, 1 / driver.Cms])
+    Nm = polyadd(polymul(Nmech, Da), driver.Sd**2 * polymul(Na, [1.0, 0.0]))
+    sDa = polymul(Da, [1.0, 0.0])
+
+    den = polyadd(polymul(Ne, Nm), driver.Bl**2 * polymul(De, sDa))
+    v_num = driver.Bl * polymul(De, sDa)                                # v/U = Bl·De·s·Da / den
+
+    if output == "velocity":
+        return v_num, den
+    if output == "displacement":
+        return v_num, polymul(den, [1.0, 0.0])
+    if output == "acceleration":
+        return polymul(v_num, [1.0, 0.0]), den
+    if output == "current":
+        return polymul(De, Nm), den
+    if output == "impedance":
+        return den, polymul(De, Nm)
+    # Presión: p = ρ0·s·Sd·v·(No / Da) / (2π·r) = ρ0·Sd·Bl·De·s²·No / (2π·r·den)
+    scale = driver.rho0 * driver.Sd * driver.Bl / (2 * np.pi * r)
+    return scale * polymul(De, polymul(No, [1.0, 0.0, 0.0])), den
@@ -29,3 +29,16 @@ class SealedBox(Enclosure):
         Za_mechanical = 1 / (1j * omega * Cmb)                          # Impedancia mecánica (reactancia capacitiva)
         
         return Za_mechanical                                            # Retorna impedancia mecánica de la caja sellada
+
+    def add_to_circuit(self, circuit, node, prefix=""):
+        # Netlist acústico de la caja sellada: compliancia del aire Cab entre el nodo trasero y tierra.
+        Cab = self.Vb_m3 / (self.rho0 * self.c**2)                      # Compliancia acústica de la caja
+        circuit.add_capacitor(prefix + "Cab", node, "0", Cab)
+        return circuit
+
+    def rational_load(self):
+        # Polinomios en s (mayor potencia primero) de la carga acústica trasera Za(s) = 1 / (s·Cab) = Na / Da
+        # y numerador No de la relación caudal radiado / caudal del cono = No / Da (solo radia el cono).
+        Cab = self.Vb_m3 / (self.rho0 * self.c**2)
+        Da = np.array([Cab, 0.0])
+        return np.array([1.0]), Da, Da
@@ -0,0 +1,270 @@
+# --------------------------------------------
+# simulation.py
+# Barrido completo de un Driver (o del sistema pasabanda isobárico) con todas las curvas que muestran
+# las interfaces gráficas: impedancia, SPL, desplazamiento, velocidad, potencias, retardo de grupo,
+# respuesta al escalón, eficiencia y excursión.
+# Es código sin interfaz (solo numpy): las GUIs lo ejecutan en un hilo de trabajo y reciben el resultado
+# como un dict cuyas claves coinciden con los argumentos de visualization.plots.plot_all.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from core.driver import Driver                                          # Importa la clase Driver del sistema
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class SimulationCancelled(Exception):
+    # Se lanza dentro del barrido cuando el trabajo fue reemplazado por uno más reciente.
+    pass
+
+def frequency_grid(driver, n=1000, f_min=5.0, ka_max=1.0):
+    """
+    Grilla logarítmica de frecuencias de f_min hasta el límite ka ≤ ka_max del driver.
+
+    Returns:
+        (frequencies, f_max)
+    """
+    f_max = driver.f_max_ka(ka_max=ka_max)                              # Limitar a ka ≤ 1
+    return np.logspace(np.log10(f_min), np.log10(f_max), n), f_max
+
+def _stages(progress, cancelled, total):
+    # Generador de avance: antes de cada etapa verifica la cancelación e informa la fracción completada.
+    for k in range(total):
+        if cancelled is not None and cancelled():
+            raise SimulationCancelled()
+        if progress is not None:
+            progress(k / total)
+        yield k
+    if progress is not None:
+        progress(1.0)
+
+def _frequency_curves(driver, f, U):
+    # Curvas puntuales (cada frecuencia es independiente) en los puntos f; la fase del SPL se guarda
+    # envuelta y H es la función compleja del retardo de grupo, ambas se completan al ensamblar.
+    w = 2 * np.pi * f
+    Z = driver.impedance(f)
+    v = driver.velocity(f, U)                                           # Una sola evaluación; el resto se deriva
+    S = U * np.conj(U / Z)                                              # Potencia compleja U·I*
+    c = {
+        "Z_magnitude": np.abs(Z), "Z_phase": np.angle(Z, deg=True),
+        "SPL_total": driver.spl_total(f, U),
+        "phase": (driver.spl_phase(f, U) + 180) % 360 - 180,
+        "H": driver.spl_complex(f, U),
+        "displacements_mm": np.abs(v) / w * 1000, "velocities": np.abs(v),
+        "P_real": S.real, "P_reactiva": S.imag, "P_aparente": np.abs(S),
+        "P_ac": 0.5 * driver.rho0 * driver.c * driver.Sd**2 * np.abs(v)**2,
+        "cone_force_array": np.abs(driver.Mms * 1j * w * v),
+    }
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c["efficiency_val"] = np.where(c["P_real"] > 0, (c["P_ac"] / c["P_real"]) * 100, 0)
+    if driver.enclosure is not None and 'BassReflex' in driver.enclosure.__class__.__name__:
+        c["SPL_cone"] = driver.spl_bassreflex_cone(f, U)                # SPL separado solo para bass-reflex
+        c["SPL_port"] = driver.spl_bassreflex_port(f, U)
+    return c
+
+def _assemble(driver, f, curves, step, f_max):
+    # Resultado con las claves de plot_all a partir de las curvas puntuales en la grilla f (ordenada).
+    r = {key: value for key, value in curves.items() if key not in ("phase", "H")}
+    r.setdefault("SPL_cone", None)
+    r.setdefault("SPL_port", None)
+    r["frequencies"], r["f_max"] = f, f_max
+    r["SPL_phase"] = np.degrees(np.unwrap(np.radians(curves["phase"])))
+    r["group_delay_vals"] = -np.gradient(np.unwrap(np.angle(curves["H"])), f) / (2 * np.pi)   # Igual que group_delay_array
+    r["step_t"], r["step_x"], r["step_v"], r["step_a"] = step
+    r["excursion_mm"] = r["displacements_mm"]
+    r["excursion_ratio"] = r["excursion_mm"] / driver.Xmax
+    r["excursion_peak"] = np.max(r["excursion_mm"])
+    r["cone_force_peak"] = np.max(r["cone_force_array"])
+    r["xmax_mm"] = driver.Xmax
+    return r
+
+def level_indices(n, levels):
+    """
+    Índices de la grilla completa (n puntos) que forman cada nivel de refinamiento.
+
+    Los niveles quedan anidados exactamente cuando (n - 1) es múltiplo de (nivel - 1), p. ej. n = 1025
+    con niveles 65 y 257; siempre terminan en la grilla completa.
+    """
+    sizes = [L for L in levels if 2 <= L < n] + [n]
+    return [np.unique(np.round(np.linspace(0, n - 1, L)).astype(int)) for L in sizes]
+
+def progressive_sweep(driver, frequencies=None, n=1025, levels=(65, 257), n_time=1000, U=2.83,
+                      progress=None, cancelled=None):
+    """
+    Barrido progresivo de grueso a fino: entrega el resultado completo en cada nivel de resolución.
+
+    Cada nivel evalúa solo las frecuencias que aún no se calcularon y las combina con las anteriores;
+    las magnitudes no puntuales (fase desenvuelta, retardo de grupo, picos) se recalculan sobre la
+    grilla combinada. La respuesta al escalón se calcula una vez en el primer nivel.
+
+    Args:
+        driver: Driver con cualquier recinto
+        frequencies: Grilla completa en Hz (None → frequency_grid(driver, n))
+        n: Puntos de la grilla completa por defecto (1025 = 2^10 + 1 anida 65, 257 y 1025)
+        levels: Tamaños de los niveles intermedios
+        n_time: Número de instantes de la respuesta al escalón
+        U: Voltaje RMS aplicado en V
+        progress: Función opcional progress(fracción de puntos calculados)
+        cancelled: Función opcional; si devuelve True se lanza SimulationCancelled entre niveles
+
+    Yields:
+        dict con las claves de los argumentos de plot_all, cada vez con más puntos
+    """
+    if frequencies is None:
+        f_full, f_max = frequency_grid(driver, n)
+    else:
+        f_full = np.asarray(frequencies, dtype=float)
+        f_max = float(f_full[-1])
+    n = f_full.size
+    done = np.zeros(n, dtype=bool)
+    store = None
+    step = None
+
+    for index in level_indices(n, levels):
+        if cancelled is not None and cancelled():
+            raise SimulationCancelled()
+        new = index[~done[index]]
+        if new.size:
+            curves = _frequency_curves(driver, f_full[new], U)
+            if store is None:
+                store = {key: np.zeros(n, dtype=value.dtype) for key, value in curves.items()}
+            for key, value in curves.items():
+                store[key][new] = value
+            done[new] = True
+        if step is None:
+            Fs = abs(driver.Fs) if driver.Fs != 0 else 1e-6             # Evita división por cero
+            t_array = np.linspace(0, 5 * (1 / Fs), n_time)              # 5 periodos de la resonancia
+            step = driver.step_response(t_array, U)
+        if progress is not None:
+            progress(np.count_nonzero(done) / n)
+        yield _assemble(driver, f_full[index], {key: value[index] for key, value in store.items()}, step, f_max)
+
+def simulate_driver(driver, frequencies=None, n=1000, n_time=1000, U=2.83, progress=None, cancelled=None):
+    """
+    Evalúa todas las curvas de la GUI para un Driver, vectorizado sobre las frecuencias.
+
+    Args:
+        driver: Driver con cualquier recinto
+        frequencies: Frecuencias en Hz (None → frequency_grid(driver, n))
+        n: Número de puntos de la grilla por defecto
+        n_time: Número de instantes de la respuesta al escalón
+        U: Voltaje RMS aplicado en V
+        progress: Función opcional progress(fracción) llamada entre etapas
+        cancelled: Función opcional sin argumentos; si devuelve True se lanza SimulationCancelled
+
+    Returns:
+        dict con las claves de los argumentos de plot_all (frequencies, Z_magnitude, ..., f_max, SPL_cone, SPL_port)
+    """
+    if progress is not None:
+        progress(0.0)
+    for result in progressive_sweep(driver, frequencies, n, levels=(), n_time=n_time, U=U,
+                                    progress=progress, cancelled=cancelled):
+        pass
+    return result
+
+def simulate_bandpass(system, user_params, n=1000, progress=None, cancelled=None):
+    """
+    Curvas de la GUI para BandpassIsobaricBox.simulate (las que el modelo no calcula quedan como marcadores).
+
+    Args:
+        system: BandpassIsobaricBox
+        user_params: Parámetros del driver ingresados en la GUI (Re, Qes, Qms, Fs, Bl, Sd)
+        n: Número de puntos de la grilla
+
+    Returns:
+        dict con las mismas claves que simulate_driver
+    """
+    stage = _stages(progress, cancelled, 2)
+    next(stage)
+
+    # f_max por ka ≤ 1 con un driver temporal armado con los parámetros del driver
+    temp_params = {key: user_params[key] for key in ("Re", "Qes", "Qms", "Fs", "Bl", "Sd")}
+    temp_params.update({"Vas": 0.05, "Xmax": 7.5})                      # Valores temporales
+    rho0, c = 1.2, 344
+    temp_params["Cms"] = temp_params["Vas"] / 1000 / (rho0 * c**2 * temp_params["Sd"]**2)
+    frequencies, f_max = frequency_grid(Driver(temp_params), n)
+
+    next(stage)
+    results = system.simulate(frequencies)
+    ones = np.ones_like(frequencies)                                    # Marcador para curvas no modeladas
+    t_array = np.linspace(0, 0.1, 1000)
+    zeros_t = np.zeros_like(t_array)
+    r = {
+        "frequencies": frequencies, "f_max": f_max,
+        "Z_magnitude": results["Zt"], "Z_phase": results["ZtΦ"],
+        "SPL_total": results["SPL"], "SPL_phase": np.zeros_like(results["SPL"]),   # Bandpass no calcula fase SPL
+        "displacements_mm": results["DEZ"],                             # DEZ está en mm
+        "velocities": ones, "P_real": ones, "P_reactiva": ones, "P_aparente": ones, "P_ac": ones,
+        "group_delay_vals": results["groupdelay"],
+        "step_t": t_array, "step_x": zeros_t, "step_v": zeros_t, "step_a": zeros_t,
+        "efficiency_val": ones,
+        "excursion_mm": results["DEZ"], "excursion_ratio": ones, "excursion_peak": np.max(results["DEZ"]),
+        "cone_force_array": ones, "cone_force_peak": 1.0,
+        "xmax_mm": 7.5,
+        "SPL_cone": None, "SPL_port": None,                             # Para bandpass no hay SPL separado
+    }
+
+    for _ in stage:
+        pass
+    return r
+
+def simulate_design(params, enclosure=None, radiation_model="baffled", n=1000, n_time=1000, progress=None, cancelled=None):
+    """
+    Construye el Driver y lo simula (unidad de trabajo que la GUI ejecuta en segundo plano).
+
+    Returns:
+        (driver, resultado de simulate_driver)
+    """
+    driver = Driver(params, enclosure=enclosure, radiation_model=radiation_model)
+    return driver, simulate_driver(driver, n=n, n_time=n_time, progress=progress, cancelled=cancelled)
+
+def progressive_design(params, enclosure=None, radiation_model="baffled", n=1025, levels=(65, 257),
+                       progress=None, cancelled=None):
+    """
+    Versión progresiva de simulate_design para las GUIs.
+
+    Yields:
+        (driver, resultado parcial de progressive_sweep) en cada nivel
+    """
+    driver = Driver(params, enclosure=enclosure, radiation_model=radiation_model)
+    for result in progressive_sweep(driver, n=n, levels=levels, progress=progress, cancelled=cancelled):
+        yield driver, result
+
+def simulate_family(params, enclosure, values, radiation_model="baffled", n=1025, U=2.83, progress=None, cancelled=None):
+    """
+    Curvas en frecuencia de una familia de diseños en una sola evaluación vectorizada.
+
+    El parámetro barrido va en el recinto como columna (m, 1), p. ej. SealedBox(vb[:, None]) o
+    BassReflexBox(..., length_port=L[:, None]); con la grilla de frecuencias (n,) todas las curvas
+    puntuales salen por broadcasting como matrices (m, n) en una sola pasada.
+
+    Args:
+        params: Parámetros del driver
+        enclosure: Recinto con el parámetro barrido como columna
+        values: Valores del parámetro (m,) (para la escala de colores)
+        n: Puntos de la grilla de frecuencias
+
+    Returns:
+        dict con "frequencies" (n,), "values" (m,), "f_max" y cada curva de plot_all en frecuencia como (m, n)
+    """
+    stage = _stages(progress, cancelled, 2)
+    next(stage)
+    driver = Driver(params, enclosure=enclosure, radiation_model=radiation_model)
+    f, f_max = frequency_grid(driver, n)
+    values = np.asarray(values, dtype=float)
+    shape = (values.size, f.size)
+
+    next(stage)
+    curves = _frequency_curves(driver, f, U)
+    r = {key: np.broadcast_to(value, shape) for key, value in curves.items()    # Curvas que no dependen del recinto
+         if key not in ("phase", "H")}
+    r["SPL_phase"] = np.degrees(np.unwrap(np.radians(np.broadcast_to(curves["phase"], shape)), axis=-1))
+    H = np.broadcast_to(curves["H"], shape)
+    r["group_delay_vals"] = -np.gradient(np.unwrap(np.angle(H), axis=-1), f, axis=-1) / (2 * np.pi)
+    r["excursion_mm"] = r["displacements_mm"]
+    r["frequencies"], r["values"], r["f_max"] = f, values, f_max
+
+    for _ in stage:
+        pass
+    return r
@@ -0,0 +1,20 @@
+# --------------------------------------------
+# special.py
+# Funciones especiales (Bessel J1 y Struve H1) con importación diferida de scipy.special.
+# scipy se carga en la primera llamada y no al importar core, así los procesos sin interfaz que solo
+# importan el modelo (lotes, trabajadores del optimizador) no pagan su costo de arranque.
+# --------------------------------------------
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+def j1(x):
+    # Bessel de primer orden (directividad del pistón y resistencia de radiación).
+    from scipy.special import j1 as _j1
+    return _j1(x)
+
+def struve(order, x):
+    # Struve de orden order (reactancia de radiación del pistón).
+    from scipy.special import struve as _struve
+    return _struve(order, x)
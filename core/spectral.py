@@ -0,0 +1,106 @@
+# --------------------------------------------
+# spectral.py
+# Excursión, potencia y velocidad de puerto esperadas bajo ruido de programa, sin simulación temporal.
+# Para un sistema lineal excitado por ruido con densidad espectral S(f) (V²/Hz), la media cuadrática de
+# cualquier salida es ∫|H(f)|²·S(f) df. La integral sobre la grilla se reduce a un producto matriz-vector
+# con pesos fijos, así que miles de diseños (D, F) se evalúan en una sola operación.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+# -------------------------------
+# Espectros de excitación (forma relativa; la escala la fija el voltaje RMS total)
+# -------------------------------
+
+def pink_psd(f):
+    # Ruido rosa: densidad ∝ 1/f (igual energía por octava).
+    return 1 / np.asarray(f, dtype=float)
+
+def iec_psd(f, f_low=40.0, f_high=2000.0):
+    """
+    Aproximación de la señal de programa simulada de IEC 60268-1.
+
+    Ruido rosa limitado en banda por un pasa-altos de 2º orden (Butterworth) en f_low y un pasa-bajos de
+    1er orden en f_high, que reproduce la caída de energía en los extremos de la señal normalizada.
+    """
+    f = np.asarray(f, dtype=float)
+    r = (f / f_low)**2
+    hp = r**2 / (1 + r**2)                                              # |H|² del pasa-altos de 2º orden
+    lp = 1 / (1 + (f / f_high)**2)                                      # |H|² del pasa-bajos de 1er orden
+    return pink_psd(f) * hp * lp
+
+def measured_psd(f, f_measured, psd_measured):
+    # Espectro medido interpolado en escala log-log sobre la grilla (cero fuera del rango medido).
+    f = np.asarray(f, dtype=float)
+    f_measured = np.asarray(f_measured, dtype=float)
+    log_psd = np.interp(np.log(f), np.log(f_measured), np.log(np.asarray(psd_measured, dtype=float)))
+    inside = (f >= f_measured[0]) & (f <= f_measured[-1])
+    return np.where(inside, np.exp(log_psd), 0.0)
+
+#====================================================================================================================================
+# -------------------------------
+# Integración espectral
+# -------------------------------
+
+def psd_weights(f, psd, U_rms=1.0):
+    """
+    Pesos de integración de modo que Σ w·|H|² = ∫|H(f)|²·S(f) df, con S escalada a un voltaje RMS total U_rms.
+
+    Args:
+        f: Frecuencias en Hz (F,)
+        psd: Densidad espectral relativa (F,)
+        U_rms: Voltaje RMS total de la excitación en V
+
+    Returns:
+        Array (F,) de pesos en V²
+    """
+    f = np.asarray(f, dtype=float)
+    psd = np.asarray(psd, dtype=float)
+    df = np.empty_like(f)                                               # Ancho trapezoidal de cada punto
+    df[1:-1] = (f[2:] - f[:-2]) / 2
+    df[0], df[-1] = (f[1] - f[0]) / 2, (f[-1] - f[-2]) / 2
+    w = psd * df
+    return w * U_rms**2 / np.sum(w)
+
+def noise_response(responses, f, psd, Re, U_rms=1.0, crest_factor=2.0):
+    """
+    Valores RMS y pico esperados bajo ruido, a partir de respuestas por voltio.
+
+    Args:
+        responses: dict con "x", "I" y opcionalmente "v_port" a 1 V (F,) o (D, F); p. ej.
+                   Driver.responses(f, 1.0) o core.max_spl.stack_responses(drivers, f)
+        f: Frecuencias en Hz (F,)
+        psd: Densidad espectral relativa de la excitación (F,)
+        Re: Resistencia DC de la bobina en Ohm (escalar o (D,))
+        U_rms: Voltaje RMS total en V (escalar o (D,))
+        crest_factor: Relación pico/RMS de la señal (2 ≈ 6 dB, típico de ruido de programa limitado)
+
+    Returns:
+        dict con arrays (D,) (o escalares): "x_rms", "x_peak" (mm), "I_rms" (A), "power" (W disipados en Re),
+        "v_port_rms", "v_port_peak" (m/s; NaN sin puerto) y "density_x" ((D, F) contribución a x_rms² en mm²)
+    """
+    w = psd_weights(f, psd)                                             # Pesos para 1 V RMS total
+    U2 = np.asarray(U_rms, dtype=float)**2
+
+    def mean_square(H):
+        H = np.asarray(H)
+        return (H.real**2 + H.imag**2) @ w * U2                         # ∫|H|²·S df como producto matriz-vector
+
+    x_rms = np.sqrt(mean_square(responses["x"])) * 1000
+    I_rms = np.sqrt(mean_square(responses["I"]))
+    v_port = responses.get("v_port")
+    v_port_rms = np.full(np.shape(x_rms), np.nan) if v_port is None else np.sqrt(mean_square(v_port))
+
+    x = np.asarray(responses["x"]) * 1000
+    return {
+        "x_rms": x_rms,
+        "x_peak": crest_factor * x_rms,
+        "I_rms": I_rms,
+        "power": I_rms**2 * np.asarray(Re, dtype=float),
+        "v_port_rms": v_port_rms,
+        "v_port_peak": crest_factor * v_port_rms,
+        "density_x": (x.real**2 + x.imag**2) * w * (U2[..., None] if U2.ndim else U2),
+    }
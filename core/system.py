@@ -0,0 +1,155 @@
+# --------------------------------------------
+# system.py
+# Sistema multivía: suma compleja de varias ramas Driver + caja (woofer, medio, tweeter) con centro acústico
+# desplazado sobre el baffle, polaridad y retardo. Evalúa la respuesta en eje y fuera de eje sobre una
+# grilla frecuencia × ángulo en una sola operación vectorizada. La respuesta compleja de cada rama se guarda
+# en caché: cambiar un retardo, polaridad o posición solo vuelve a sumar, sin re-simular ningún driver.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class System:
+    """
+    Sistema multivía compuesto por ramas Driver + caja.
+
+    Coordenadas: x horizontal y y vertical sobre el baffle, z hacia el oyente. El centro acústico de cada
+    rama se ubica en (x, y, -profundidad), con el eje de referencia en el origen.
+
+    Args:
+        U: Voltaje RMS aplicado a cada rama en V
+        distance: Distancia de escucha en m, medida desde el origen del eje de referencia
+        c: Velocidad del sonido en m/s (None → la del primer driver agregado)
+    """
+
+    def __init__(self, U=2.83, distance=2.0, c=None):
+        self.U = U
+        self.distance = distance
+        self.c = c
+        self.branches = {}                                              # Ramas en orden de inserción
+        self._cache = {}                                                # nombre → (clave de f, U, presión en eje)
+
+    def add_branch(self, name, driver, offset=(0.0, 0.0, 0.0), polarity=1, delay=0.0, gain_db=0.0, dsp=None):
+        """
+        Agrega una rama al sistema.
+
+        Args:
+            name: Nombre de la rama (woofer, mid, tweeter, ...)
+            driver: Driver con su caja ya asignada
+            offset: (x, y, profundidad) del centro acústico en m; un escalar se toma como altura y
+            polarity: +1 o -1
+            delay: Retardo eléctrico en s
+            gain_db: Ganancia de la rama en dB
+            dsp: Cadena o bloque DSP (core.dsp) delante del driver, o None
+        """
+        if name in self.branches:
+            raise ValueError(f"Ya existe una rama con el nombre '{name}'.")
+        if self.c is None:
+            self.c = driver.c
+        self.branches[name] = {"driver": driver}
+        self.set_branch(name, offset=offset, polarity=polarity, delay=delay, gain_db=gain_db, dsp=dsp)
+        return self
+
+    def set_branch(self, name, **kwargs):
+        """
+        Modifica offset, polarity, delay, gain_db o dsp de una rama sin invalidar su respuesta en caché.
+        Cambiar el driver sí la invalida.
+        """
+        branch = self.branches[name]
+        for key, value in kwargs.items():
+            if key == "offset":
+                value = (0.0, float(value), 0.0) if np.isscalar(value) else tuple(float(v) for v in value)
+                if len(value) == 2:
+                    value = value + (0.0,)
+            elif key == "driver":
+                self.invalidate(name)
+            elif key not in ("polarity", "delay", "gain_db", "dsp"):
+                raise ValueError(f"Parámetro de rama no soportado: {key}")
+            branch[key] = value
+        return self
+
+    def invalidate(self, name=None):
+        # Descarta la respuesta en caché de una rama (o de todas).
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+#====================================================================================================================================
+
+    def branch_response(self, name, f):
+        """
+        Presión compleja en eje a 1 m de una rama (sin retardo, polaridad ni geometría), con caché.
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        key = (f.shape, f.tobytes(), self.U)
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != key:
+            p = self.branches[name]["driver"].pressure(f, self.U)
+            cached = (key, p)
+            self._cache[name] = cached
+        return cached[1]
+
+    def response(self, f, angles=0.0, plane="vertical", per_branch=False):
+        """
+        Respuesta compleja sumada en la grilla frecuencia × ángulo.
+
+        Cada rama aporta p_eje(f) · H_dsp(f) · D(ka·sinθ) · (1/d) · e^(-jk(d - r)) · e^(-jωτ) · polaridad · ganancia,
+        con d la distancia real desde su centro acústico al punto de escucha y D la directividad de pistón.
+
+        Args:
+            f: Frecuencias en Hz
+            angles: Ángulo o array de ángulos en grados respecto al eje de referencia
+            plane: "vertical" (plano y-z) u "horizontal" (plano x-z)
+            per_branch: Si es True, devuelve además el aporte de cada rama
+
+        Returns:
+            Presión compleja de forma (A, F), o (F,) si angles es escalar
+        """
+        if plane not in ("vertical", "horizontal"):
+            raise ValueError("plane debe ser 'vertical' u 'horizontal'.")
+        if not self.branches:
+            raise ValueError("El sistema no tiene ramas.")
+
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        scalar_angle = np.isscalar(angles)
+        theta = np.radians(np.atleast_1d(np.asarray(angles, dtype=float)))[:, None]    # (A, 1)
+        w = 2 * np.pi * f
+        k = w / self.c
+        r = self.distance
+
+        # Punto de escucha en el plano elegido
+        lateral = r * np.sin(theta)
+        forward = r * np.cos(theta)
+
+        contributions = {}
+        for name, branch in self.branches.items():
+            x, y, depth = branch["offset"]
+            u = y if plane == "vertical" else x                         # Desplazamiento dentro del plano
+            v = x if plane == "vertical" else y                         # Desplazamiento fuera del plano
+            d = np.sqrt((lateral - u)**2 + v**2 + (forward + depth)**2) # Distancia real (A, 1)
+
+            driver = branch["driver"]
+            ka = k * np.sqrt(driver.Sd / np.pi) * np.abs(np.sin(theta))
+            D = driver._piston_directivity(ka)                          # Directividad fuera de eje (A, F)
+
+            scale = branch["polarity"] * 10**(branch["gain_db"] / 20)
+            phase = np.exp(-1j * k * (d - r) - 1j * w * branch["delay"])
+            p_axis = self.branch_response(name, f)
+            if branch["dsp"] is not None:
+                p_axis = p_axis * branch["dsp"].response(f)             # Filtros activos delante del driver
+            contributions[name] = scale * p_axis * D * phase / d
+
+        p_total = sum(contributions.values())
+        if scalar_angle:
+            p_total = p_total[0]
+            contributions = {name: p[0] for name, p in contributions.items()}
+        return (p_total, contributions) if per_branch else p_total
+
+    def spl(self, f, angles=0.0, plane="vertical"):
+        # Nivel de presión sonora en dB de la respuesta sumada.
+        p = self.response(f, angles, plane)
+        return 20 * np.log10(np.abs(p) / 20e-6)
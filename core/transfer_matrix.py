@@ -0,0 +1,163 @@
+# --------------------------------------------
+# transfer_matrix.py
+# Matrices de transferencia acústicas 2×2 (presión, caudal) para conductos discretizados en segmentos.
+# Todas las frecuencias y segmentos se manejan como pilas (F × N × 2 × 2); la cadena se multiplica por
+# reducción en árbol (log2(N) productos por lotes), sin bucles por frecuencia ni por segmento.
+#
+#   [p_entrada]   [A  B] [p_salida]
+#   [U_entrada] = [C  D] [U_salida]
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from collections import OrderedDict                                     # Caché LRU de cadenas por geometría
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+def wave_parameters(f, area, rho0, c, stuffing=0.0):
+    """
+    Número de onda complejo e impedancia característica acústica de un conducto relleno.
+
+    El relleno se modela por su resistividad al flujo σ como densidad efectiva compleja ρe = ρ0 + σ/(jω);
+    con σ = 0 se recupera el conducto sin pérdidas. f, area y stuffing se combinan por broadcasting
+    (p. ej. f (F,) con area (N, 1) da resultados (N, F)).
+
+    Args:
+        f: Frecuencias en Hz
+        area: Área de cada segmento en m²
+        rho0: Densidad del aire en kg/m³
+        c: Velocidad del sonido en m/s
+        stuffing: Resistividad al flujo del relleno en Pa·s/m² (escalar o por segmento)
+
+    Returns:
+        (k, Zc): número de onda (parte imaginaria negativa = atenuación) e impedancia característica
+    """
+    w = 2 * np.pi * np.asarray(f, dtype=float)
+    sigma = np.asarray(stuffing, dtype=float)
+    K = rho0 * c**2                                                     # Módulo de compresibilidad adiabático
+    if not np.any(sigma):
+        k = w / c * np.ones_like(np.asarray(area, dtype=float))         # Sin relleno: número de onda real
+        Zc = rho0 * c / np.asarray(area, dtype=float) * np.ones_like(w)
+        return np.broadcast_arrays(k, Zc)
+    rho_e = rho0 + sigma / (1j * w)                                     # Densidad efectiva compleja
+    k = w * np.sqrt(rho_e / K)
+    Zc = np.sqrt(rho_e * K) / np.asarray(area, dtype=float)
+    return np.broadcast_arrays(k, Zc)
+
+def segment_elements(k, Zc, length):
+    """
+    Elementos (A, B, C, D) de las matrices de segmentos uniformes, con la forma de k y Zc.
+    """
+    kl = k * length
+    if np.iscomplexobj(kl):
+        e = np.exp(1j * kl)                                             # Una sola exponencial compleja para cos y sin
+        ei = 1 / e
+        cos, jsin = (e + ei) / 2, (e - ei) / 2                          # jsin = j·sin(kl)
+    else:
+        cos, jsin = np.cos(kl), 1j * np.sin(kl)
+    return cos, Zc * jsin, jsin / Zc, cos
+
+def segment_matrices(k, Zc, length):
+    """
+    Matrices de transferencia de segmentos uniformes.
+
+    Args:
+        k, Zc: Arrays (..., N) de número de onda e impedancia característica
+        length: Longitud de cada segmento en m (escalar o (N,))
+
+    Returns:
+        Array (..., N, 2, 2)
+    """
+    return stack_elements(*segment_elements(k, Zc, length))
+
+def chain_elements(a, b, c, d):
+    """
+    Producto ordenado de matrices 2×2 dadas por sus elementos, sobre el primer eje (segmentos).
+
+    La reducción es en árbol: en cada nivel se multiplican por lotes los pares (0·1, 2·3, ...), con los
+    cuatro elementos escritos explícitamente (mucho más rápido que np.matmul con matrices tan pequeñas).
+
+    Args:
+        a, b, c, d: Arrays (N, ...) con los elementos de cada segmento
+
+    Returns:
+        (A, B, C, D) de la cadena, cada uno de forma (...)
+    """
+    while a.shape[0] > 1:
+        n = a.shape[0] // 2 * 2                                         # Pares completos
+        a1, b1, c1, d1 = a[0:n:2], b[0:n:2], c[0:n:2], d[0:n:2]
+        a2, b2, c2, d2 = a[1:n:2], b[1:n:2], c[1:n:2], d[1:n:2]
+        pa, pb = a1 * a2 + b1 * c2, a1 * b2 + b1 * d2
+        pc, pd = c1 * a2 + d1 * c2, c1 * b2 + d1 * d2
+        if n < a.shape[0]:                                              # Segmento impar: se arrastra al siguiente nivel
+            pa, pb, pc, pd = (np.concatenate([p, x[-1:]]) for p, x in ((pa, a), (pb, b), (pc, c), (pd, d)))
+        a, b, c, d = pa, pb, pc, pd
+    return a[0], b[0], c[0], d[0]
+
+def chain(T):
+    """
+    Producto ordenado T[0] · T[1] · ... · T[N-1] sobre el eje de segmentos.
+
+    Args:
+        T: Array (..., N, 2, 2)
+
+    Returns:
+        Array (..., 2, 2)
+    """
+    elements = (np.ascontiguousarray(np.moveaxis(T[..., i, j], -1, 0)) for i, j in ((0, 0), (0, 1), (1, 0), (1, 1)))
+    return stack_elements(*chain_elements(*elements))
+
+def stack_elements(a, b, c, d):
+    # Arma la pila (..., 2, 2) a partir de sus elementos.
+    T = np.empty(np.broadcast(a, b, c, d).shape + (2, 2), dtype=complex)
+    T[..., 0, 0], T[..., 0, 1], T[..., 1, 0], T[..., 1, 1] = a, b, c, d
+    return T
+
+#====================================================================================================================================
+# -------------------------------
+# Conducto discretizado con caché por geometría
+# -------------------------------
+
+_DUCT_CACHE = OrderedDict()                                             # (geometría, f) → matriz de la cadena (F, 2, 2)
+_DUCT_CACHE_SIZE = 32
+
+def duct_chain(f, areas, dx, rho0, c, stuffing=0.0):
+    """
+    Matriz total (F, 2, 2) de un conducto de segmentos uniformes, desde el primer segmento hasta el último.
+
+    El resultado se guarda por geometría y grilla de frecuencias: dos recintos con la misma geometría, o el
+    mismo recinto usado con otro driver, reutilizan la cadena sin recalcularla.
+
+    Args:
+        f: Frecuencias en Hz (F,)
+        areas: Área de cada segmento en m² (N,)
+        dx: Longitud de cada segmento en m
+        rho0, c: Densidad del aire y velocidad del sonido
+        stuffing: Resistividad al flujo en Pa·s/m² (escalar o (N,))
+    """
+    f = np.atleast_1d(np.asarray(f, dtype=float))
+    areas = np.asarray(areas, dtype=float)
+    stuffing = np.asarray(stuffing, dtype=float)
+    key = (areas.tobytes(), float(dx), float(rho0), float(c), stuffing.tobytes(), f.shape, f.tobytes())
+    T = _DUCT_CACHE.get(key)
+    if T is not None:
+        _DUCT_CACHE.move_to_end(key)
+        return T
+
+    # Segmentos en el primer eje: (N, F)
+    k, Zc = wave_parameters(f, areas[:, None], rho0, c, stuffing[:, None] if stuffing.ndim else stuffing)
+    T = stack_elements(*chain_elements(*segment_elements(k, Zc, dx)))
+    _DUCT_CACHE[key] = T
+    if len(_DUCT_CACHE) > _DUCT_CACHE_SIZE:
+        _DUCT_CACHE.popitem(last=False)
+    return T
+
+def input_impedance(T, Z_load):
+    # Impedancia de entrada de la cadena terminada en Z_load: (A·Z + B) / (C·Z + D).
+    A, B, C, D = T[..., 0, 0], T[..., 0, 1], T[..., 1, 0], T[..., 1, 1]
+    return (A * Z_load + B) / (C * Z_load + D)
+
+def volume_velocity_ratio(T, Z_load):
+    # Relación U_salida / U_entrada de la cadena terminada en Z_load: 1 / (C·Z + D).
+    return 1 / (T[..., 1, 0] * Z_load + T[..., 1, 1])
@@ -0,0 +1,83 @@
+# --------------------------------------------
+# transient.py
+# Respuestas al escalón y al impulso del cono (desplazamiento, velocidad y aceleración) según el recinto.
+# En los sistemas de parámetros concentrados (baffle infinito, sellada, bass-reflex, pasabanda, radiador
+# pasivo) se evalúan en forma cerrada a partir de los residuos de core.rational, en cualquier instante y
+# por lotes de diseños (p. ej. conjuntos de Monte Carlo). Los recintos distribuidos (línea, bocina, puerto
+# distribuido) no son racionales: su respuesta se obtiene por síntesis espectral (irfft) de Driver.responses.
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from core.rational import system_tf                                     # Funciones de transferencia racionales
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+QUANTITIES = (("x", "displacement"), ("v", "velocity"), ("a", "acceleration"))
+
+def is_rational(driver):
+    # True si el sistema driver + recinto es una función racional de s.
+    enclosure = driver.enclosure
+    if enclosure is None:
+        return True
+    return hasattr(enclosure, "rational_load") and getattr(enclosure, "port_model", "lumped") == "lumped"
+
+def transient_response(drivers, t, U=2.83, kind="step", fs=8192.0):
+    """
+    Respuesta temporal del cono a un escalón (o impulso) de voltaje.
+
+    Args:
+        drivers: Driver o lista de Drivers (los de igual estructura se resuelven como un solo lote)
+        t: Instantes en s (T,), en cualquier orden
+        U: Amplitud del escalón en V (o área del impulso en V·s)
+        kind: "step" o "impulse"
+        fs: Frecuencia de muestreo de la síntesis espectral (solo recintos no racionales)
+
+    Returns:
+        dict con arrays (T,) o (D, T): "x" (m), "v" (m/s) y "a" (m/s²)
+    """
+    if kind not in ("step", "impulse"):
+        raise ValueError("kind debe ser 'step' o 'impulse'.")
+    single = not isinstance(drivers, (list, tuple))
+    drivers = [drivers] if single else list(drivers)
+    t = np.asarray(t, dtype=float)
+
+    if all(is_rational(d) for d in drivers):
+        # Diseños con la misma estructura (recinto y bobina) se evalúan como un solo sistema por lotes
+        keys = [(type(d.enclosure), bool(d.Reh), bool(d.Le)) for d in drivers]
+        rows = {key: [None] * len(drivers) for key, _ in QUANTITIES}
+        for structure in dict.fromkeys(keys):
+            index = [i for i, k in enumerate(keys) if k == structure]
+            group = [drivers[i] for i in index]
+            for key, output in QUANTITIES:
+                H = system_tf(group[0] if single else group, output)
+                y = U * (H.step(t) if kind == "step" else H.impulse(t))
+                if single:
+                    rows[key] = y                                       # (T,) o (lote, T) con masa agregada en lote
+                else:
+                    for i, row in zip(index, y):
+                        rows[key][i] = row
+        return rows if single else {key: np.stack(value) for key, value in rows.items()}
+
+    parts = [_spectral_response(d, t, U, kind, fs) for d in drivers]
+    return parts[0] if single else {key: np.stack([p[key] for p in parts]) for key, _ in QUANTITIES}
+
+def _spectral_response(driver, t, U, kind, fs):
+    # Síntesis espectral para recintos distribuidos: irfft de la respuesta en frecuencia, integrada para el escalón.
+    duration = max(2 * np.max(np.abs(t)), 1.0)
+    n = int(2**np.ceil(np.log2(duration * fs)))
+    f = np.fft.rfftfreq(n, 1 / fs)
+    w = 2 * np.pi * f[1:]
+    r = driver.responses(f[1:], 1.0)
+    bins = {"v": r["v"], "x": r["x"], "a": 1j * w * r["v"]}
+
+    out = {}
+    for key, H in bins.items():
+        spectrum = np.concatenate([[H[0].real], H])                    # DC extrapolado del primer bin
+        h = np.fft.irfft(spectrum, n) * fs                              # Respuesta al impulso muestreada
+        if kind == "step":
+            h = np.concatenate([[0.0], np.cumsum((h[1:] + h[:-1]) / 2) / fs])
+        tn = np.arange(n) / fs
+        out[key] = U * np.interp(t, tn, h) * (t >= 0)
+    return out
@@ -0,0 +1,92 @@
+# --------------------------------------------
+# transmission_line.py
+# Línea de transmisión y cuarto de onda (recto o cónico) cargando la parte trasera del driver.
+# La línea se discretiza en segmentos con matrices de transferencia 2×2; el relleno agrega pérdidas
+# como número de onda complejo. La boca radia como pistón en baffle (core.zrad).
+# --------------------------------------------
+
+import numpy as np                                                      # Importa numpy para cálculos matemáticos
+from core.enclosure import Enclosure                                    # Importa clase base Enclosure
+from core import transfer_matrix as tm                                  # Importa matrices de transferencia por lotes
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class TransmissionLineBox(Enclosure):
+    """
+    Línea de transmisión con el driver en el extremo cerrado y la boca abierta al baffle.
+
+    Args:
+        length: Longitud de la línea en m
+        area_start: Área en el extremo del driver en m²
+        area_end: Área en la boca en m² (None → línea recta; menor que area_start → cuarto de onda cónico)
+        stuffing: Resistividad al flujo del relleno en Pa·s/m² (escalar o array por segmento)
+        segments: Número de segmentos de la discretización
+    """
+
+    def __init__(self, length, area_start, area_end=None, stuffing=0.0, segments=200):
+        if length <= 0 or area_start <= 0 or (area_end is not None and area_end <= 0):
+            raise ValueError("La longitud y las áreas de la línea deben ser mayores que cero.")
+        if int(segments) < 1:
+            raise ValueError("La línea necesita al menos un segmento.")
+
+        self.length = length
+        self.area_start = area_start
+        self.area_end = area_start if area_end is None else area_end
+        self.stuffing = stuffing
+        self.segments = int(segments)
+
+        # Área de cada segmento en su punto medio (conicidad lineal en área)
+        x = (np.arange(self.segments) + 0.5) / self.segments
+        self.areas = self.area_start + (self.area_end - self.area_start) * x
+        self.dx = self.length / self.segments
+
+        super().__init__(np.sum(self.areas) * self.dx * 1000)           # Volumen interno en litros
+
+#====================================================================================================================================
+
+    def chain_matrix(self, f):
+        # Matriz total (F, 2, 2) de la línea, desde el driver hasta la boca (en caché por geometría).
+        return tm.duct_chain(f, self.areas, self.dx, self.rho0, self.c, self.stuffing)
+
+    def mouth_impedance(self, f):
+        # Impedancia acústica de radiación de la boca (pistón en baffle).
+        return self.zrad.baffled_piston(f, self.area_end) / self.area_end**2
+
+    def input_impedance(self, f):
+        # Impedancia acústica vista por la cara trasera del diafragma.
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        return tm.input_impedance(self.chain_matrix(f), self.mouth_impedance(f))
+
+    def acoustic_load(self, f, Sd):
+        # Impedancia mecánica trasera: la impedancia acústica de entrada llevada al diafragma.
+        f_was_scalar = np.isscalar(f)
+        Zm = self.input_impedance(f) * Sd**2
+        return Zm[0] if f_was_scalar else Zm
+
+    def radiation_impedance(self, f, Sd):
+        # La carga de aire frontal ya está incluida en Mms.
+        return np.zeros_like(np.asarray(f, dtype=float), dtype=complex)
+
+    def secondary_output(self, f, Sd, v):
+        """
+        Caudal radiado por la boca.
+
+        Args:
+            f: Frecuencias en Hz
+            Sd: Área del diafragma en m²
+            v: Velocidad compleja del diafragma (positiva hacia el frente)
+
+        Returns:
+            (Q_boca, área de la boca)
+        """
+        f = np.atleast_1d(np.asarray(f, dtype=float))
+        T = self.chain_matrix(f)
+        Q_in = -v * Sd                                                  # La cara trasera empuja en contrafase
+        return Q_in * tm.volume_velocity_ratio(T, self.mouth_impedance(f)), self.area_end
+
+    def add_to_circuit(self, circuit, node, prefix=""):
+        # Netlist acústico: la línea completa como impedancia de entrada dependiente de la frecuencia.
+        circuit.add_impedance(prefix + "TL", node, "0", self.input_impedance)
+        return circuit
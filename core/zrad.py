@@ -4,7 +4,7 @@
 # --------------------------------------------
 
 import numpy as np                                                      # Importa numpy para cálculos matemáticos
-from scipy.special import j1                                            # Importa función Bessel de primer orden
+from core.special import j1, struve                                      # Bessel y Struve de primer orden (scipy diferido)
 from core.environment import AcousticEnvironment                       # Importa entorno acústico
 
 #====================================================================================================================================
@@ -37,14 +37,14 @@ class RadiationImpedance:
                 Xr = 0                                                  # Reactancia de radiación nula
             else:
                 Rr = self.rho0 * self.c * Sd * (1 - (j1(2 * ka) / ka)) # Resistencia de radiación
-                Xr = self.rho0 * self.c * Sd * (2 / (np.pi * ka)) * j1(2 * ka) # Reactancia de radiación (masa añadida)
+                Xr = self.rho0 * self.c * Sd * struve(1, 2 * ka) / ka         # Reactancia de radiación (masa añadida)
             return complex(Rr, Xr)                                      # Retorna impedancia compleja
         else:
             Rr = np.zeros_like(ka)                                      # Inicializa array de resistencias
             Xr = np.zeros_like(ka)                                      # Inicializa array de reactancias
             mask = ka != 0                                              # Máscara para evitar división por cero
             Rr[mask] = self.rho0 * self.c * Sd * (1 - (j1(2 * ka[mask]) / ka[mask])) # Resistencia para elementos no nulos
-            Xr[mask] = self.rho0 * self.c * Sd * (2 / (np.pi * ka[mask])) * j1(2 * ka[mask]) # Reactancia para elementos no nulos
+            Xr[mask] = self.rho0 * self.c * Sd * struve(1, 2 * ka[mask]) / ka[mask] # Reactancia para elementos no nulos
             return Rr + 1j * Xr                                         # Retorna array de impedancias complejas
     
     def unbaffled_piston(self, f: float, Sd: float) -> complex:
@@ -69,6 +69,12 @@ class RadiationImpedance:
         Za = 1j * omega * m_ac                                          # Impedancia acústica reactiva
         return Za                                                       # Retorna impedancia del extremo del tubo
     
+    def end_correction(self, S: float, flanged=True) -> float:
+        # Corrección de longitud de un extremo abierto de área S (límite ka → 0).
+        # Con brida coincide con la masa de radiación del pistón en baffle: 8a/(3π) ≈ 0.85·a; sin brida ≈ 0.61·a.
+        a = np.sqrt(S / np.pi)                                          # Radio equivalente
+        return 8 * a / (3 * np.pi) if flanged else 0.6133 * a           # Retorna la corrección en m
+
     def front_load(self, f: float, Sd: float, load_type="baffled") -> complex:
         # Wrapper para seleccionar el modelo de radiación frontal.
         if load_type == "baffled":                                      # Si es pistón con baffle
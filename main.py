@@ -3,17 +3,9 @@
 # Script principal para simular y analizar el comportamiento de un parlante.
 # --------------------------------------------
 
-import numpy as np                                                      # Importa numpy para cálculos matemáticos
-import matplotlib.pyplot as plt                                         # Importa matplotlib para gráficas
-import tkinter as tk                                                    # Importa tkinter para interfaz gráfica alternativa
-from tkinter import ttk                                                 # Importa widgets temáticos de tkinter
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg         # Backend de matplotlib para tkinter
-from core.driver import Driver                                          # Importa la clase Driver del sistema
-from visualization.plots import plot_all                                # Importa funciones de visualización
 import sys                                                              # Importa sys para manejo del sistema
-from visualization.app import App                                       # Importa aplicación tkinter
-from visualization.app_qt5 import AppQt                                 # Importa aplicación Qt5
-from PyQt5.QtWidgets import QApplication                                # Importa QApplication de PyQt5
+# Las GUIs (PyQt5 o tkinter) y matplotlib se importan dentro de main() solo para el toolkit elegido:
+# `from main import params, units` y los procesos sin interfaz no cargan ninguna.
 
 #====================================================================================================================================
 #====================================================================================================================================
@@ -52,8 +44,12 @@ units = {
 
 def main():
     # Función principal para ejecutar la aplicación SSS.
-    # Por defecto ejecuta la versión Qt5, pero puede cambiarse a Tkinter.
+    # Por defecto ejecuta la versión Qt5; con `python main.py --tk` (o si Qt5 falla) usa Tkinter.
+    if "--tk" in sys.argv[1:]:
+        return run_tk()
     try:
+        from PyQt5.QtWidgets import QApplication                        # Importa QApplication de PyQt5
+        from visualization.app_qt5 import AppQt                         # Importa aplicación Qt5
         print("Iniciando aplicación SSS (Qt5)...")                     # Mensaje de inicio de aplicación Qt5
         print("Creando QApplication...")                               # Mensaje de creación de QApplication
         app = QApplication(sys.argv)                                    # Crea la aplicación Qt5
@@ -73,17 +69,23 @@ def main():
         import traceback                                                # Importa traceback para debugging
         traceback.print_exc()                                           # Imprime el stack trace completo
         print("Intentando con aplicación Tkinter...")                  # Mensaje de fallback a Tkinter
-        try:
-            root = tk.Tk()                                              # Crea ventana raíz de Tkinter
-            root.title("SSS - Speaker Simulation System")              # Establece título de la ventana
-            app = App(root, params, units)                              # Crea aplicación Tkinter
-            root.mainloop()                                             # Ejecuta el loop principal de Tkinter
-        except Exception as e2:
-            print(f"Error al iniciar aplicación Tkinter: {e2}")        # Captura errores de Tkinter
-            import traceback                                            # Importa traceback nuevamente
-            traceback.print_exc()                                       # Imprime el stack trace de Tkinter
-            print("No se pudo iniciar ninguna aplicación.")            # Mensaje de fallo total
-            sys.exit(1)                                                 # Sale con código de error
+        run_tk()
+
+def run_tk():
+    # Aplicación Tkinter (alternativa a Qt5).
+    try:
+        import tkinter as tk                                            # Importa tkinter para interfaz gráfica alternativa
+        from visualization.app import App                               # Importa aplicación tkinter
+        root = tk.Tk()                                                  # Crea ventana raíz de Tkinter
+        root.title("SSS - Speaker Simulation System")                   # Establece título de la ventana
+        app = App(root, params, units)                                  # Crea aplicación Tkinter
+        root.mainloop()                                                 # Ejecuta el loop principal de Tkinter
+    except Exception as e2:
+        print(f"Error al iniciar aplicación Tkinter: {e2}")            # Captura errores de Tkinter
+        import traceback                                                # Importa traceback nuevamente
+        traceback.print_exc()                                           # Imprime el stack trace de Tkinter
+        print("No se pudo iniciar ninguna aplicación.")                # Mensaje de fallo total
+        sys.exit(1)                                                     # Sale con código de error
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,150 @@
+# tests/test_app_qt5.py
+
+import os
+import threading
+import numpy as np
+import pytest
+
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+from PyQt5.QtCore import QEventLoop, QTimer
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+def wait_until(app, condition, timeout_s=20):
+    # Procesa eventos hasta que condition() sea verdadera (o se agote el tiempo).
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: condition() and loop.quit())
+    timer.start(10)
+    QTimer.singleShot(int(timeout_s * 1000), loop.quit)
+    loop.exec_()
+    timer.stop()
+    app.processEvents()
+    return condition()
+
+# ------------------------
+# Test: Una corrida reemplazada tras su primer parcial no queda a baja resolución
+# ------------------------
+def test_superseded_run_is_refined(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if not isinstance(app, QtWidgets.QApplication):
+        pytest.skip("Ya existe una QCoreApplication sin widgets")
+    import visualization.app_qt5 as app_qt5
+    from main import params, units
+
+    # El primer trabajo entrega su parcial de 65 puntos y espera a ser reemplazado
+    gate = threading.Event()
+    progressive_design = app_qt5.progressive_design
+    def gated(*args, **kwargs):
+        stream = progressive_design(*args, **kwargs)
+        yield next(stream)
+        gate.wait(10)
+        yield from stream
+    monkeypatch.setattr(app_qt5, "progressive_design", gated)
+    warnings = []
+    monkeypatch.setattr(app_qt5.QMessageBox, "warning", lambda *args: warnings.append(args[1]))
+
+    window = app_qt5.AppQt(params, units)
+    window.enclosure_type_combo.setCurrentText("Caja Sellada")
+    window.vb_entry.setText("20")
+    window.on_submit()
+    assert wait_until(app, lambda: len(window.store) == 1)
+    first = window.store.last()
+    assert first["provisional"] and first["result"]["frequencies"].size == 65
+
+    window.vb_entry.setText("40")
+    assert warnings == []
+    window.on_submit()                                                  # Reemplaza (cancela) el primer trabajo
+    gate.set()
+    assert wait_until(app, lambda: len(window.store) == 2 and not any(r["provisional"] for r in window.store))
+    for record in window.store:
+        assert record["result"]["frequencies"].size == 1025
+        assert window.checkboxes[record["index"]].text() == record["name"]
+    assert all(np.size(line.get_xdata()) >= 65 for line in window.plot_lines[first["index"]])
+
+    window.vb_entry.setText("20")
+    window.on_submit()                                                  # Ya completa: es un duplicado real
+    assert warnings == ["Simulación duplicada"]
+    window.close()
+
+# ------------------------
+# Test: Al soltar el ajuste en vivo la vista previa se descarta y el diseño queda como corrida normal
+# ------------------------
+def test_live_release_registers_run(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if not isinstance(app, QtWidgets.QApplication):
+        pytest.skip("Ya existe una QCoreApplication sin widgets")
+    import visualization.app_qt5 as app_qt5
+    from main import params, units
+    warnings = []
+    monkeypatch.setattr(app_qt5.QMessageBox, "warning", lambda *args: warnings.append(args[1]))
+
+    window = app_qt5.AppQt(params, units)
+    window.enclosure_type_combo.setCurrentText("Caja Sellada")
+    window.vb_entry.setText("20")
+    window.on_submit()
+    assert wait_until(app, lambda: len(window.store) == 1 and not window.runner.is_busy())
+
+    window.live_field_combo.setCurrentText("Vb [L]")
+    window.live_slider.setValue(100)                                    # ×2 → 40 L
+    assert wait_until(app, lambda: window.live is not None)
+    window.on_live_released()
+    assert window.live is None
+    assert wait_until(app, lambda: len(window.store) == 2 and not any(r["provisional"] for r in window.store))
+    assert window.store.last()["result"]["frequencies"].size == 1025
+    assert len(window.checkboxes) == len(window.plot_lines) == 2
+    assert not any(line.get_label() == "_vista previa" for ax in window.fig.axes for line in ax.get_lines())
+
+    window.on_live_released()                                           # Mismo diseño: no se duplica ni avisa
+    assert len(window.store) == 2 and warnings == []
+    window.close()
+
+# ------------------------
+# Test: El barrido de Vb usa la misma conversión litros/m³ que la simulación individual
+# ------------------------
+def test_family_vb_conversion():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if not isinstance(app, QtWidgets.QApplication):
+        pytest.skip("Ya existe una QCoreApplication sin widgets")
+    import visualization.app_qt5 as app_qt5
+    from main import params, units
+
+    window = app_qt5.AppQt(params, units)
+    window.enclosure_type_combo.setCurrentText("Bass-reflex")
+    values = np.array([0.03, 0.5, 20.0, 60.0])                          # m³ (≤ 1) y litros (> 1) mezclados
+    enclosure, _ = window.family_enclosure("Vb [L]", values)
+    for value, vb_m3 in zip(values, enclosure.Vb_m3[:, 0]):
+        window.vb_entry.setText(str(value))
+        assert np.isclose(window.read_form(notify=False)[1].Vb_m3, vb_m3)
+    window.close()
+
+# ------------------------
+# Test: La memoria informada incluye las líneas del grid y sus copias en las pestañas
+# ------------------------
+def test_memory_counts_artists():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if not isinstance(app, QtWidgets.QApplication):
+        pytest.skip("Ya existe una QCoreApplication sin widgets")
+    import visualization.app_qt5 as app_qt5
+    from core.history import result_nbytes
+    from main import params, units
+
+    window = app_qt5.AppQt(params, units)
+    window.enclosure_type_combo.setCurrentText("Caja Sellada")
+    window.vb_entry.setText("20")
+    window.on_submit()
+    assert wait_until(app, lambda: len(window.store) == 1 and not window.store.last()["provisional"])
+    record = window.store.last()
+    stored = result_nbytes(record["result"])
+    grid = window.store.nbytes(record["key"])
+    assert grid > stored + sum(line.get_xydata().nbytes for line in window.plot_lines[0])
+
+    window.tabs.setCurrentIndex(2)                                      # La pestaña SPL copia sus líneas
+    app.processEvents()
+    assert window.store.nbytes(record["key"]) > grid
+    assert "curvas + líneas" in window.memory_label.text()
+
+    window.store.evict(record["key"])                                   # Liberar suelta grid y pestañas
+    assert window.store.nbytes(record["key"]) == 0
+    assert all(not view.lines for view in window.tab_views.values())
+    window.close()
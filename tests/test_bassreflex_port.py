@@ -0,0 +1,72 @@
+# tests/test_bassreflex_port.py
+
+from core.bassreflex import BassReflexBox
+from core.zrad import RadiationImpedance
+from core.driver import Driver
+from core.circuit import driver_netlist
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 3.3, 1200)
+
+def make_box(port_model):
+    return BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), area_port=0.005, length_port=0.28, port_model=port_model)
+
+# ------------------------
+# Test: A baja frecuencia el puerto distribuido es una masa con corrección en ambos extremos
+# ------------------------
+def test_low_frequency_mass():
+    box = make_box("distributed")
+    f_low = np.array([5.0, 10.0, 20.0])
+    Zap, ratio = box.port_response(f_low)
+    delta = box.zrad.end_correction(0.005)
+    L_mass = np.imag(Zap) / (2 * np.pi * f_low * box.rho0 / 0.005)
+    assert np.allclose(L_mass, 0.28 + 2 * delta, rtol=0.03)
+    assert np.all(np.real(Zap) > 0)                                     # Pérdidas de capa límite y radiación
+    assert np.allclose(np.abs(ratio), 1.0, atol=0.01)
+
+# ------------------------
+# Test: El puerto largo muestra la resonancia de tubo que el modelo concentrado no tiene
+# ------------------------
+def test_pipe_resonance_in_port_output():
+    lumped = Driver(params, enclosure=make_box("lumped"))
+    distributed = Driver(params, enclosure=make_box("distributed"))
+    diff = 20 * np.log10(np.abs(distributed._bassreflex_pressures(f)[1]) / np.abs(lumped._bassreflex_pressures(f)[1]))
+    f_pipe = 343 / (2 * (0.28 + 2 * RadiationImpedance().end_correction(0.005)))
+    k = np.argmax(diff)
+    assert diff[k] > 15
+    assert 0.8 * f_pipe < f[k] < 1.1 * f_pipe
+
+# ------------------------
+# Test: El modelo distribuido es seleccionable en Driver y en el netlist sin cambiar el concentrado
+# ------------------------
+def test_selectable_model():
+    lumped_before = Driver(params, enclosure=BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), 0.005, 0.28))
+    lumped = Driver(params, enclosure=make_box("lumped"))
+    assert np.allclose(lumped.impedance(f), lumped_before.impedance(f))
+    air = Driver(params)                                                # Misma ρ0 y c que usa Driver para Cab
+    box = BassReflexBox(0.05, air.rho0, air.c, RadiationImpedance(), 0.005, 0.28, port_model="distributed")
+    distributed = Driver(params, enclosure=box)
+    sol = driver_netlist(distributed).solve(f)
+    assert np.allclose(sol.input_impedance("Vg"), distributed.impedance(f), rtol=1e-9)
+    assert distributed.enclosure.acoustic_load(f, 0.055).shape == f.shape
+    with pytest.raises(ValueError):
+        make_box("lossy")
@@ -0,0 +1,110 @@
+# tests/test_circuit.py
+
+from core.circuit import Circuit, driver_netlist, cone_velocity
+from core.driver import Driver
+from core.sealed import SealedBox
+from core.bassreflex import BassReflexBox
+from core.zrad import RadiationImpedance
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes (Reh = 0 para usar la misma bobina que Driver.impedance)
+# ------------------------
+params = {
+    "Fs": 52,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.32,
+    "Qes": 0.34,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 3.5, 400)
+
+# ------------------------
+# Test: Divisor RC resuelto por MNA coincide con la solución analítica
+# ------------------------
+def test_rc_divider():
+    ckt = Circuit()
+    ckt.add_voltage_source("V", "in", "0", 1.0)
+    ckt.add_resistor("R", "in", "out", 100.0)
+    ckt.add_capacitor("C", "out", "0", 1e-6)
+    sol = ckt.solve(f)
+    H = 1 / (1 + 1j * 2 * np.pi * f * 100.0 * 1e-6)
+    assert np.allclose(sol.voltage("out"), H)
+    assert np.allclose(sol.current("R"), sol.current("C"))
+    assert np.allclose(sol.input_impedance("V"), 100.0 + 1 / (1j * 2 * np.pi * f * 1e-6))
+
+# ------------------------
+# Test: Girador y transformador reflejan la carga como Bl²/Z y n²·Z
+# ------------------------
+def test_two_port_reflection():
+    ckt = Circuit()
+    ckt.add_voltage_source("V", "a", "0", 1.0)
+    ckt.add_gyrator("GY", "a", "0", "b", "0", 3.0)
+    ckt.add_transformer("TF", "b", "0", "c", "0", 0.5)
+    ckt.add_resistor("R", "c", "0", 8.0)
+    sol = ckt.solve(f)
+    assert np.allclose(sol.input_impedance("V"), 3.0**2 / (0.5**2 * 8.0))
+
+# ------------------------
+# Test: Infinite baffle como netlist reproduce Driver.impedance y Driver.velocity
+# ------------------------
+def test_infinite_baffle_matches_driver():
+    driver = Driver(params)
+    sol = driver_netlist(driver).solve(f)
+    assert np.allclose(sol.input_impedance("Vg"), driver.impedance(f), rtol=1e-9)
+    assert np.allclose(cone_velocity(sol), driver.velocity(f), rtol=1e-9)
+
+# ------------------------
+# Test: Caja sellada como netlist coincide con el modelo de compliancia equivalente
+# ------------------------
+def test_sealed_matches_driver():
+    driver = Driver(params, enclosure=SealedBox(40))
+    sol = driver_netlist(driver).solve(f)
+    Z_ref = driver.impedance(f)
+    assert np.max(np.abs(sol.input_impedance("Vg") / Z_ref - 1)) < 0.02
+
+# ------------------------
+# Test: Bass-reflex conserva el caudal: cono = caja + puerto
+# ------------------------
+def test_bassreflex_flow_conservation():
+    box = BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), area_port=0.01, length_port=0.1)
+    driver = Driver(params, enclosure=box)
+    sol = driver_netlist(driver).solve(f)
+    Qd = sol.volume_velocity("Sd", port=2)
+    assert np.allclose(-Qd, sol.volume_velocity("Cab") + sol.volume_velocity("Map"))
+    # En la sintonía del puerto el cono casi no se mueve: la caja y el puerto intercambian el caudal
+    k = np.argmin(np.abs(f - box.fp))
+    assert np.abs(Qd[k]) < 0.2 * np.abs(sol.volume_velocity("Map")[k])
+
+# ------------------------
+# Test: Valores de lote producen una pila (*lote, F) en una sola resolución
+# ------------------------
+def test_batched_values():
+    C = np.array([1e-6, 2e-6, 4e-6])
+    ckt = Circuit()
+    ckt.add_voltage_source("V", "in", "0", 1.0)
+    ckt.add_resistor("R", "in", "out", 100.0)
+    ckt.add_capacitor("C", "out", "0", C)
+    sol = ckt.solve(f)
+    assert sol.voltage("out").shape == (3, len(f))
+    for i, Ci in enumerate(C):
+        H = 1 / (1 + 1j * 2 * np.pi * f * 100.0 * Ci)
+        assert np.allclose(sol.voltage("out")[i], H)
+
+# ------------------------
+# Test: Nombres duplicados no se permiten
+# ------------------------
+def test_duplicate_name():
+    ckt = Circuit()
+    ckt.add_resistor("R", "a", "0", 1.0)
+    with pytest.raises(ValueError):
+        ckt.add_resistor("R", "a", "b", 1.0)
@@ -0,0 +1,134 @@
+# tests/test_crossover.py
+
+from core.crossover import Crossover, lowpass, highpass, zobel, lpad
+from core.driver import Driver
+from core.sealed import SealedBox
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+woofer_params = {
+    "Fs": 52,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.32,
+    "Qes": 0.34,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+tweeter_params = {
+    "Fs": 900,
+    "Mms": 0.0004,
+    "Qts": 0.5,
+    "Qes": 0.9,
+    "Qms": 1.2,
+    "Re": 4.8,
+    "Bl": 3.5,
+    "Sd": 0.00085,
+    "Le": 0.05e-3,
+    "Xmax": 0.3
+}
+
+f = np.logspace(1, 4.3, 300)
+
+class ResistiveLoad:
+    # Carga resistiva con la interfaz mínima de Driver (impedancia + presión por voltio).
+    def __init__(self, R):
+        self.R = R
+        self.Rg = 0.0
+        self.Re = R
+        self.Le = 0.0
+
+    def impedance(self, f):
+        return self.R * np.ones_like(f, dtype=complex)
+
+    def pressure(self, f, U=2.83):
+        return U / self.R * np.ones_like(f, dtype=complex)
+
+# ------------------------
+# Test: Sin filtro, el driver recibe la misma presión que simulado solo
+# ------------------------
+def test_single_way_matches_driver():
+    driver = Driver(woofer_params, enclosure=SealedBox(40))
+    res = Crossover(U=2.83).add_way("woofer", driver).solve(f)
+    assert np.allclose(res["p_total"], driver.pressure(f, 2.83))
+    assert np.allclose(res["Zin"], driver.impedance(f) - driver.Rg)
+
+# ------------------------
+# Test: Linkwitz-Riley 4º orden sobre carga resistiva: -6 dB en fc y suma plana
+# ------------------------
+def test_linkwitz_riley_on_resistor():
+    fc = 2000
+    xo = Crossover(U=1.0, Rg=0.0)
+    xo.add_way("lp", ResistiveLoad(8.0), [lowpass(4, fc, 8.0, "linkwitz-riley")])
+    xo.add_way("hp", ResistiveLoad(8.0), [highpass(4, fc, 8.0, "linkwitz-riley")])
+    res = xo.solve(f)
+    k = np.argmin(np.abs(f - fc))
+    assert abs(np.abs(res["V"]["lp"][k]) - 0.5) < 0.02
+    assert abs(np.abs(res["V"]["hp"][k]) - 0.5) < 0.02
+    assert np.allclose(np.abs(res["V"]["lp"] + res["V"]["hp"]), 1.0, atol=1e-3)
+
+# ------------------------
+# Test: Wiring serie reparte la tensión; wiring paralelo la mantiene
+# ------------------------
+def test_series_and_parallel_wiring():
+    loads = [ResistiveLoad(8.0), ResistiveLoad(8.0)]
+    par = Crossover(U=1.0, Rg=0.0).add_way("w", loads, wiring="parallel").solve(f)
+    ser = Crossover(U=1.0, Rg=0.0).add_way("w", loads, wiring="series").solve(f)
+    assert np.allclose(par["Zin"], 4.0)
+    assert np.allclose(ser["Zin"], 16.0)
+    assert np.allclose(np.abs(ser["V"]["w1"]), 0.5)
+
+# ------------------------
+# Test: Zobel aplana la impedancia inductiva y L-pad atenúa lo pedido
+# ------------------------
+def test_zobel_and_lpad():
+    tweeter = Driver(tweeter_params)
+    xo = Crossover(U=1.0, Rg=0.0).add_way("tw", tweeter, [lpad(6.0, 8.0)])
+    res = xo.solve(f)
+    ref = Crossover(U=1.0, Rg=0.0).add_way("tw", ResistiveLoad(8.0), [lpad(6.0, 8.0)]).solve(f)
+    assert np.allclose(np.abs(ref["V"]["tw"]), 10**(-6 / 20))
+    woofer = Driver(woofer_params)
+    z = Crossover(U=1.0, Rg=0.0).add_way("w", woofer, [zobel(woofer)]).solve(f)
+    hf = f > 5000
+    assert np.all(np.abs(z["Zin"][hf]) < np.abs(woofer.impedance(f)[hf] - woofer.Rg))
+    assert res["SPL"].shape == f.shape
+
+# ------------------------
+# Test: L-pad de 0 dB equivale a no tener atenuador, también como extremo de un lote
+# ------------------------
+def test_lpad_zero_is_bypass():
+    tweeter = Driver(tweeter_params)
+    bare = Crossover(U=1.0).add_way("tw", tweeter, [highpass(2, 3000.0, 8.0)]).solve(f)
+    assert lpad(0.0) == []
+    with np.errstate(all="raise"):
+        batch = Crossover(U=1.0).add_way("tw", tweeter, [highpass(2, 3000.0, 8.0), lpad(np.array([0.0, 6.0]))]).solve(f)
+    six = Crossover(U=1.0).add_way("tw", tweeter, [highpass(2, 3000.0, 8.0), lpad(6.0)]).solve(f)
+    assert np.all(np.isfinite(batch["SPL"])) and np.all(np.isfinite(batch["Zin"]))
+    assert np.allclose(batch["SPL"][0], bare["SPL"]) and np.allclose(batch["Zin"][0], bare["Zin"])
+    assert np.allclose(batch["SPL"][1], six["SPL"])
+
+# ------------------------
+# Test: Modo lote evalúa miles de combinaciones en una sola resolución
+# ------------------------
+def test_batch_components():
+    woofer = Driver(woofer_params)
+    fc = np.linspace(500, 3000, 1000)
+    xo = Crossover(U=2.83).add_way("woofer", woofer, [lowpass(2, fc, 8.0)])
+    res = xo.solve(f)
+    assert res["p_total"].shape == (1000, len(f))
+    single = Crossover(U=2.83).add_way("woofer", woofer, [lowpass(2, fc[10], 8.0)]).solve(f)
+    assert np.allclose(res["p_total"][10], single["p_total"])
+
+# ------------------------
+# Test: Alineaciones no soportadas
+# ------------------------
+def test_unsupported_alignment():
+    with pytest.raises(ValueError):
+        lowpass(3, 1000, 8.0, "linkwitz-riley")
@@ -0,0 +1,91 @@
+# tests/test_crossover_optimizer.py
+
+from core.crossover import Crossover
+from core.crossover_optimizer import CrossoverOptimizer, snap_to_series, target_slope
+from core.driver import Driver
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+woofer = Driver({"Fs": 52, "Mms": 0.065, "Vas": 62, "Qts": 0.32, "Qes": 0.34, "Qms": 4.5,
+                 "Re": 5.3, "Bl": 18.1, "Sd": 0.055, "Le": 1.5e-3, "Xmax": 7.5})
+tweeter = Driver({"Fs": 900, "Mms": 0.0004, "Qts": 0.5, "Qes": 0.9, "Qms": 1.2,
+                  "Re": 4.8, "Bl": 3.5, "Sd": 0.00085, "Le": 0.05e-3, "Xmax": 0.3})
+
+class ResistiveLoad:
+    # Driver ideal: carga resistiva y respuesta plana (85 dB a 2.83 V sobre 8 Ohm).
+    Rg = 0.0
+    def __init__(self, R=8.0):
+        self.R = R
+    def impedance(self, f):
+        return self.R * np.ones_like(f, dtype=complex)
+    def pressure(self, f, U=2.83):
+        return 10**(85 / 20) * 20e-6 * U / 2.83 * np.ones_like(f, dtype=complex)
+
+f = np.logspace(np.log10(300), np.log10(12000), 60)
+fc = 2500
+bounds = [(0.1e-3, 3e-3), (1e-6, 50e-6), (1e-6, 30e-6), (0.05e-3, 2e-3)]
+
+def build_two_way(X, drivers=(woofer, tweeter)):
+    # X: (población, 4) → L1, C1 (woofer) y C2, L2 (tweeter) de 2º orden
+    xo = Crossover(U=2.83)
+    xo.add_way("woofer", drivers[0], [[("series", "L", X[:, 0]), ("shunt", "C", X[:, 1])]])
+    xo.add_way("tweeter", drivers[1], [[("series", "C", X[:, 2]), ("shunt", "L", X[:, 3])]], polarity=-1)
+    return xo
+
+def build_ideal(X):
+    return build_two_way(X, (ResistiveLoad(), ResistiveLoad()))
+
+def make_optimizer(workers=1, build=build_two_way, level=88.0):
+    targets = {
+        "woofer": target_slope(f, fc, 2, "lowpass", level),
+        "tweeter": target_slope(f, fc, 2, "highpass", level),
+    }
+    return CrossoverOptimizer(build, bounds, f, targets, series="E24", workers=workers)
+
+# ------------------------
+# Test: Redondeo a series E12/E24
+# ------------------------
+def test_snap_to_series():
+    assert np.isclose(snap_to_series(4.8e-6, "E12"), 4.7e-6)
+    assert np.isclose(snap_to_series(5.05, "E24"), 5.1)
+    assert np.isclose(snap_to_series(9.8e-3, "E12"), 10e-3)
+    assert snap_to_series(np.ones((3, 2)), "E24").shape == (3, 2)
+    with pytest.raises(ValueError):
+        snap_to_series(1.0, "E96")
+
+# ------------------------
+# Test: La población se evalúa como un lote (población × frecuencia)
+# ------------------------
+def test_population_evaluation_matches_single():
+    opt = make_optimizer()
+    X = np.array([[1e-3, 10e-6, 8e-6, 0.4e-3], [0.5e-3, 5e-6, 4e-6, 0.2e-3]])
+    cost, total_err, way_err = opt.evaluate(X)
+    assert cost.shape == (2,)
+    single = opt.evaluate(X[1:])[0]
+    assert np.isclose(cost[1], single[0])
+    assert set(way_err) == {"woofer", "tweeter"}
+
+# ------------------------
+# Test: La evolución diferencial mejora el error en eje y devuelve valores normalizados
+# ------------------------
+def test_optimize_improves_response():
+    opt = make_optimizer(build=build_ideal, level=85.0)
+    x0 = np.array([2.5e-3, 45e-6, 2e-6, 1.5e-3])                       # Diseño inicial malo
+    initial = opt.evaluate(x0[None, :])[0][0]
+    res = opt.optimize(popsize=8, maxiter=40, seed=1, x0=x0)
+    assert res["cost"] < initial
+    assert np.allclose(snap_to_series(res["x"], "E24"), res["x"])
+    assert res["on_axis_error"] < 1.0
+    assert np.all(np.diff(res["history"]) <= 1e-12)
+
+# ------------------------
+# Test: El pool de procesos reproduce la evaluación en serie
+# ------------------------
+def test_process_pool_matches_serial():
+    serial = make_optimizer().optimize(popsize=5, maxiter=5, seed=3)
+    pooled = make_optimizer(workers=2).optimize(popsize=5, maxiter=5, seed=3)
+    assert np.allclose(serial["x"], pooled["x"])
+    assert np.isclose(serial["cost"], pooled["cost"])
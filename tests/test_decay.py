@@ -0,0 +1,99 @@
+# tests/test_decay.py
+
+from core.decay import pressure_impulse, csd, burst_decay
+from core.driver import Driver
+from core.sealed import SealedBox
+from core.bassreflex import BassReflexBox
+from core.zrad import RadiationImpedance
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+
+fs = 8192.0
+
+def resonance(f0=200.0, tau=0.02, n=8192):
+    # Resonancia aislada: h(t) = e^(-t/τ)·sin(2π·f0·t)
+    t = np.arange(n) / fs
+    return np.exp(-t / tau) * np.sin(2 * np.pi * f0 * t)
+
+# ------------------------
+# Test: La respuesta al impulso reproduce la respuesta en frecuencia
+# ------------------------
+def test_impulse_matches_frequency_response():
+    driver = Driver(params, enclosure=SealedBox(30))
+    t, h = pressure_impulse(driver, fs=fs, n=8192)
+    f = np.fft.rfftfreq(8192, 1 / fs)[1:-1]
+    assert np.allclose(np.fft.rfft(h)[1:-1], driver.responses(f, 2.83)["p"])
+    assert np.argmax(np.abs(h)) < int(0.02 * fs)                        # Energía al comienzo (causal)
+
+# ------------------------
+# Test: La cascada decae a la tasa de la resonancia
+# ------------------------
+def test_csd_decay_rate():
+    tau = 0.02
+    res = csd(resonance(tau=tau), fs, window_ms=100, duration_ms=40, slices=9)
+    assert res["level_db"].shape == (9, res["f"].size)
+    k = np.argmin(np.abs(res["f"] - 200.0))
+    slope = np.polyfit(res["t"], res["level_db"][:, k], 1)[0]           # dB/s
+    assert np.isclose(slope, -20 * np.log10(np.e) / tau, rtol=0.05)
+    assert np.isclose(res["level_db"][0].max(), 0.0)
+
+    # Sin taper las rebanadas se transforman directo desde la vista; coinciden con cortar a mano
+    h = resonance(tau=tau)
+    flat = csd(h, fs, window_ms=50, duration_ms=40, slices=5, taper=0.0)
+    L, step = int(round(0.05 * fs)), int(round(0.01 * fs))
+    manual = np.abs(np.fft.rfft(np.stack([h[i * step:i * step + L] for i in range(5)]), axis=-1))
+    assert np.allclose(flat["level_db"], 20 * np.log10(manual / manual[0].max()))
+
+# ------------------------
+# Test: Las ráfagas decaen más lento en la resonancia
+# ------------------------
+def test_burst_decay_resonance():
+    f0, tau = 200.0, 0.05
+    res = burst_decay(resonance(f0, tau), fs, [100.0, 200.0, 400.0], cycles=5, periods=10)
+    assert res["level_db"].shape == (3, 11)
+    # En f0 la envolvente cae 20·log10(e)/(f0·τ) dB por periodo
+    rate = np.diff(res["level_db"][1, 2:]).mean()
+    assert np.isclose(rate, -20 * np.log10(np.e) / (f0 * tau), rtol=0.1)
+    assert np.all(res["level_db"][[0, 2], 0] < res["level_db"][1, 0])
+
+# ------------------------
+# Test: Cascada y ráfagas desde un Driver bass-reflex
+# ------------------------
+def test_driver_waterfall_and_bursts():
+    box = BassReflexBox(0.05, 1.18, 343, RadiationImpedance(), area_port=0.005, length_port=0.28)
+    _, h = pressure_impulse(Driver(params, enclosure=box), fs=fs)
+    res = csd(h, fs)
+    assert res["level_db"].shape == (40, res["f"].size)
+    assert np.all(res["level_db"][-1] <= res["level_db"][0].max())
+    bursts = burst_decay(h, fs, np.geomspace(20, 500, 12))
+    assert np.all(np.isfinite(bursts["level_db"][:, 0]))
+
+# ------------------------
+# Test: Gráficos de cascada y ráfagas
+# ------------------------
+def test_plots():
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    from visualization.plots import plot_waterfall, plot_burst_decay
+    h = resonance()
+    fig, ax = plot_waterfall(csd(h, fs, slices=10))
+    assert len(ax.lines) == 10
+    fig, ax = plot_burst_decay(burst_decay(h, fs, np.geomspace(50, 800, 8)))
+    assert ax.get_xscale() == "log"
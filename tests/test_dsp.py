@@ -0,0 +1,98 @@
+# tests/test_dsp.py
+
+from core import dsp
+from core.driver import Driver
+from core.system import System
+import numpy as np
+import pytest
+from scipy.signal import butter, sosfreqz
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 52,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.32,
+    "Qes": 0.34,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+
+fs = 48000
+f = np.logspace(1, 4.3, 300)
+
+# ------------------------
+# Test: Butterworth coincide con scipy.signal.butter + sosfreqz
+# ------------------------
+@pytest.mark.parametrize("order", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("kind", ["lowpass", "highpass"])
+def test_butterworth_matches_scipy(kind, order):
+    H = dsp.butterworth(kind, order, 1000, fs).response(f)
+    _, ref = sosfreqz(butter(order, 1000, kind, fs=fs, output="sos"), worN=f, fs=fs)
+    assert np.allclose(np.abs(H), np.abs(ref), atol=1e-9)
+
+# ------------------------
+# Test: Linkwitz-Riley 4: -6 dB en fc y suma de magnitud plana
+# ------------------------
+def test_linkwitz_riley_sum():
+    lp = dsp.linkwitz_riley("lowpass", 4, 2000, fs).response(f)
+    hp = dsp.linkwitz_riley("highpass", 4, 2000, fs).response(f)
+    fc = np.array([2000.0])
+    assert np.isclose(20 * np.log10(np.abs(dsp.linkwitz_riley("lowpass", 4, 2000, fs).response(fc)[0])), -6.02, atol=0.01)
+    assert np.allclose(np.abs(lp + hp), 1.0, atol=1e-6)
+
+# ------------------------
+# Test: EQ paramétrico, shelving, transformada de Linkwitz, retardo y ganancia
+# ------------------------
+def test_eq_blocks():
+    f0 = np.array([1000.0])
+    assert np.isclose(20 * np.log10(np.abs(dsp.peaking(1000, 6.0, 2.0, fs).response(f0)[0])), 6.0)
+    assert np.isclose(20 * np.log10(np.abs(dsp.low_shelf(200, -4.0, fs=fs).response([10.0])[0])), -4.0, atol=0.05)
+    assert np.isclose(20 * np.log10(np.abs(dsp.high_shelf(5000, 3.0, fs=fs).response([20000.0])[0])), 3.0, atol=0.1)
+    lt = dsp.linkwitz_transform(60, 0.9, 30, 0.5, fs).response(np.array([1e-3, 10000.0]))
+    assert np.isclose(np.abs(lt[0]), (60 / 30)**2, rtol=1e-3)        # DC: ω0²/ωp²
+    assert np.isclose(np.abs(lt[1]), 1.0, atol=1e-2)
+    d = dsp.delay(1e-3, fs).response(f)
+    assert np.allclose(np.abs(d), 1.0) and np.isclose(np.angle(d[0]), -2 * np.pi * f[0] * 1e-3)
+    assert np.allclose(dsp.gain(-6.0, polarity=-1).response(f), -10**(-6 / 20))
+
+# ------------------------
+# Test: Lote de miles de ajustes de EQ en una sola evaluación
+# ------------------------
+def test_batch_eq_sets():
+    N = 5000
+    rng = np.random.default_rng(0)
+    f0 = rng.uniform(50, 5000, N)
+    g = rng.uniform(-12, 12, N)
+    Q = rng.uniform(0.5, 5, N)
+    chain = dsp.Chain([dsp.peaking(f0, g, Q, fs), dsp.high_shelf(3000, 2.0, fs=fs)])
+    H = chain.response(f)
+    assert H.shape == (N, len(f))
+    single = dsp.Chain([dsp.peaking(f0[7], g[7], Q[7], fs), dsp.high_shelf(3000, 2.0, fs=fs)]).response(f)
+    assert np.allclose(H[7], single)
+    driver = Driver(params)
+    assert chain.apply(driver, f).shape == (N, len(f))
+
+# ------------------------
+# Test: El DSP se multiplica en las ramas de System sin re-simular el driver
+# ------------------------
+def test_system_branch_dsp():
+    driver = Driver(params)
+    system = System(distance=1.0).add_branch("woofer", driver, dsp=dsp.linkwitz_riley("lowpass", 4, 500, fs))
+    p = system.response(f)
+    assert np.allclose(p, driver.pressure(f) * dsp.linkwitz_riley("lowpass", 4, 500, fs).response(f))
+
+# ------------------------
+# Test: Parámetros fuera de rango
+# ------------------------
+def test_invalid_blocks():
+    with pytest.raises(ValueError):
+        dsp.linkwitz_riley("lowpass", 3, 1000)
+    with pytest.raises(ValueError):
+        dsp.butterworth("bandpass", 2, 1000)
@@ -0,0 +1,95 @@
+# tests/test_history.py
+
+from core.history import SimulationStore, SimulationHistory, EXPORT_COLUMNS, compact_result, result_nbytes
+from core.simulation import simulate_driver, simulate_design
+from core.driver import Driver
+from core.sealed import SealedBox
+import numpy as np
+import pytest
+
+params = {"Fs": 52, "Mms": 0.065, "Vas": 62, "Qts": 0.32, "Qes": 0.34, "Qms": 4.5,
+          "Re": 5.3, "Bl": 18.1, "Sd": 0.055, "Le": 1.5e-3, "Xmax": 7.5}
+
+# ------------------------
+# Test: El almacén guarda, refina y exporta sin volver a simular
+# ------------------------
+def test_store_roundtrip(tmp_path):
+    driver = Driver(params, enclosure=SealedBox(20))
+    coarse = simulate_driver(driver, n=65)
+    store = SimulationStore()
+    record = store.add(("a",), "Sellada", params, coarse, driver=driver)
+    assert ("a",) in store and len(store) == 1 and record["index"] == 0
+    with pytest.raises(KeyError):
+        store.add(("a",), "Otra", params, coarse)
+
+    full = simulate_driver(driver, n=257)
+    store.update(("a",), full)
+    assert store.get(("a",))["result"] is full and store.last() is record and store.at(0) is record
+
+    header, data = store.table(("a",))
+    assert data.shape == (257, len(header)) and "SPL cono [dB]" not in header    # Sin SPL separado en sellada
+    path = tmp_path / "curvas.csv"
+    store.write_csv(("a",), path)
+    loaded = np.loadtxt(path, delimiter=",", skiprows=1)
+    assert np.allclose(loaded[:, 0], full["frequencies"]) and np.allclose(loaded[:, 3], full["SPL_total"])
+    text = store.summary(("a",), {"Fs": "Hz"})
+    assert text.startswith("Nombre: Sellada") and "Fs: 52 Hz" in text
+    assert store.names() == ["Sellada"] and len(EXPORT_COLUMNS) == 16
+
+# ------------------------
+# Test: Historial acotado: float32, contabilidad de memoria, desalojo LRU y recálculo
+# ------------------------
+def test_history_budget_and_eviction():
+    runs = {vb: simulate_design(params, SealedBox(vb), n=257) for vb in (10, 20, 30, 40)}
+    compact = compact_result(runs[10][1])
+    assert compact["SPL_total"].dtype == np.float32 and compact["f_max"] == runs[10][1]["f_max"]
+    assert np.allclose(compact["SPL_total"], runs[10][1]["SPL_total"], rtol=1e-6)
+    per_run = result_nbytes(compact)
+    assert per_run * 2 == result_nbytes(runs[10][1])                    # Mitad de memoria que float64
+
+    evicted, calls = [], []
+    def recompute(vb):
+        calls.append(vb)
+        return simulate_design(params, SealedBox(vb), n=257)
+    history = SimulationHistory(budget_bytes=int(2.5 * per_run), on_evict=lambda r: evicted.append(r["name"]))
+    for vb, (driver, result) in runs.items():
+        history.add(vb, f"Vb {vb}", params, result, driver=driver, recompute=lambda vb=vb: recompute(vb))
+        if vb == 10:
+            history.pin(10)
+        if vb == 20:
+            history.touch(10)
+    assert evicted == ["Vb 20", "Vb 30"]                                # La fijada nunca se libera
+    assert history.total_nbytes() <= history.budget_bytes and history.nbytes(20) == 0
+    assert [r[3] for r in history.memory_report()] == [False, True, True, False]
+
+    header, data = history.table(20)                                    # Exportar una liberada la recalcula
+    assert calls == [20] and data.shape[0] == 257 and not history.get(20)["evicted"]
+    assert history.get(40)["evicted"]                                   # ... y libera la menos vista
+    assert np.allclose(history.get(20)["result"]["SPL_total"], runs[20][1]["SPL_total"], rtol=1e-6)
+
+    history.pin(40)                                                     # Fijar una liberada la recalcula
+    assert calls == [20, 40] and history.get(40)["pinned"] and not history.get(40)["evicted"]
+    assert history.get(20)["evicted"]                                   # Dos fijadas + 20 no entran en el presupuesto
+    assert history.set_budget(0) == [] and history.total_nbytes() == 2 * per_run
+    history.add(50, "Sin recálculo", params, runs[10][1])
+    history.evict(50)
+    with pytest.raises(ValueError):
+        history.recompute(50)
+
+# ------------------------
+# Test: Los bytes de los artistas de la GUI (artist_nbytes) cuentan en el presupuesto
+# ------------------------
+def test_history_counts_artist_bytes():
+    driver, result = simulate_design(params, SealedBox(20), n=257)
+    per_run = result_nbytes(compact_result(result))
+    artists = {}                                                        # clave → bytes de "líneas" vivas
+    history = SimulationHistory(budget_bytes=3 * per_run, on_evict=lambda r: artists.pop(r["key"]),
+                                artist_nbytes=lambda r: artists.get(r["key"], 0))
+    for key in (1, 2):
+        history.add(key, f"Corrida {key}", params, result, driver=driver)
+        artists[key] = per_run                                          # La GUI dibuja la corrida después de guardarla
+    assert history.nbytes(1) == 2 * per_run and history.total_nbytes() == 4 * per_run
+    assert history.memory_report()[0][1] == 2 * per_run
+
+    assert history.enforce_budget(keep=2) == [1]                        # Solo entra con sus líneas contadas
+    assert 1 not in artists and history.total_nbytes() == 2 * per_run <= history.budget_bytes
@@ -0,0 +1,88 @@
+# tests/test_horn.py
+
+from core.horn import HornBox
+from core.driver import Driver
+from core.circuit import driver_netlist
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1.5, 4, 400)
+
+# ------------------------
+# Test: Cada perfil va de la garganta a la boca
+# ------------------------
+@pytest.mark.parametrize("profile", HornBox.PROFILES)
+def test_profiles_end_areas(profile):
+    horn = HornBox(0.005, 0.3, 1.5, profile)
+    assert np.isclose(horn.area(0.0), 0.005, rtol=1e-6)
+    assert np.isclose(horn.area(horn.length), 0.3, rtol=1e-6)
+    assert np.all(np.diff(horn.areas) > 0)
+
+# ------------------------
+# Test: Bocina exponencial: resistencia de garganta ≈ ρc/St sobre el corte y casi nula debajo
+# ------------------------
+def test_exponential_cutoff():
+    horn = HornBox(0.005, 0.5, 2.0, "exponential")
+    fc = np.log(0.5 / 0.005) / 2.0 * horn.c / (4 * np.pi)
+    R = np.real(horn.throat_impedance(f)) * 0.005 / (horn.rho0 * horn.c)
+    assert np.all(R[f < 0.5 * fc] < 0.05)
+    band = (f > 4 * fc) & (f < 20 * fc)
+    assert abs(np.mean(R[band]) - 1) < 0.05                             # Rizado por reflexiones en la boca alrededor de 1
+    assert np.all(np.abs(R[band] - 1) < 0.4)
+
+# ------------------------
+# Test: La cadena se reutiliza entre recintos de igual geometría y entre drivers
+# ------------------------
+def test_chain_cached_per_geometry():
+    a = HornBox(0.005, 0.3, 1.5, "hyperbolic")
+    b = HornBox(0.005, 0.3, 1.5, "hyperbolic")
+    assert a.chain_matrix(f) is b.chain_matrix(f)
+    assert a.chain_matrix(f) is not HornBox(0.005, 0.3, 1.2, "hyperbolic").chain_matrix(f)
+
+# ------------------------
+# Test: Carga frontal y trasera en Driver y en el netlist
+# ------------------------
+@pytest.mark.parametrize("loading", ["front", "rear"])
+def test_driver_integration(loading):
+    horn = HornBox(0.02, 0.4, 1.8, "exponential", loading=loading, chamber_volume=1.0, rear_volume=30.0)
+    driver = Driver(params, enclosure=horn)
+    Z = driver.impedance(f)
+    sol = driver_netlist(driver).solve(f)
+    assert np.allclose(sol.input_impedance("Vg"), Z, rtol=1e-6)
+    v = driver.velocity(f)
+    Q_mouth, S_mouth = horn.secondary_output(f, driver.Sd, v)
+    w = 2 * np.pi * f
+    p_mouth = 1j * w * driver.rho0 * Q_mouth * driver._piston_directivity(w / driver.c * np.sqrt(S_mouth / np.pi)) / (2 * np.pi)
+    if loading == "front":
+        assert np.allclose(driver.pressure(f), p_mouth)                 # En carga frontal solo radia la boca
+    else:
+        assert not np.allclose(driver.pressure(f), p_mouth)
+
+# ------------------------
+# Test: Geometría inválida
+# ------------------------
+def test_invalid_horn():
+    with pytest.raises(ValueError):
+        HornBox(0.005, 0.3, 1.5, "parabolic")
+    with pytest.raises(ValueError):
+        HornBox(0.3, 0.005, 1.5)
+    with pytest.raises(ValueError):
+        HornBox(0.005, 0.3, None, "conical")
@@ -0,0 +1,45 @@
+# tests/test_imports.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Presupuesto de arranque del modelo sin interfaz (después de numpy); con scipy.special eran ~250 ms
+IMPORT_BUDGET_S = 0.15
+HEAVY = ("scipy", "matplotlib", "PyQt5", "tkinter")
+
+PROBE = f"""
+import sys, time
+import numpy
+t = time.perf_counter()
+import core, core.simulation, core.sealed, core.bassreflex, core.history, main
+elapsed = time.perf_counter() - t
+loaded = sorted({{name.split('.')[0] for name in sys.modules}} & set({HEAVY!r}))
+print(elapsed, ",".join(loaded))
+"""
+
+def run_probe():
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True, text=True, check=True)
+    elapsed, loaded = out.stdout.split()[0], (out.stdout.split() + [""])[1]
+    return float(elapsed), loaded
+
+# ------------------------
+# Test: Importar core (y los parámetros de main) solo carga numpy, dentro del presupuesto de tiempo
+# ------------------------
+def test_headless_import_budget():
+    runs = [run_probe() for _ in range(3)]                              # Proceso nuevo por medición (sin caché de módulos)
+    assert all(loaded == "" for _, loaded in runs), runs
+    assert min(elapsed for elapsed, _ in runs) < IMPORT_BUDGET_S, runs
+
+# ------------------------
+# Test: Los nombres diferidos de core y las funciones especiales cargan scipy al primer uso
+# ------------------------
+def test_lazy_names():
+    import core
+    from core.special import j1, struve
+    scipy_special = __import__("scipy.special", fromlist=["j1"])
+    assert core.Driver is __import__("core.driver", fromlist=["Driver"]).Driver
+    assert "simulate_family" in dir(core)
+    assert j1(2.5) == scipy_special.j1(2.5) and struve(1, 2.5) == scipy_special.struve(1, 2.5)
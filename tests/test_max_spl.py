@@ -0,0 +1,95 @@
+# tests/test_max_spl.py
+
+from core.max_spl import max_spl, LIMITS
+from core.bassreflex import BassReflexBox
+from core.sealed import SealedBox
+from core.zrad import RadiationImpedance
+from core.driver import Driver
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5,
+    "Pe": 300
+}
+
+f = np.logspace(1, 3, 300)
+
+def make_sealed(Vb=40):
+    return Driver(params, enclosure=SealedBox(Vb))
+
+def make_bassreflex():
+    box = BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), area_port=0.005, length_port=0.28)
+    return Driver(params, enclosure=box)
+
+# ------------------------
+# Test: En el límite gobernante se alcanza exactamente ese límite
+# ------------------------
+def test_governing_limit_is_reached():
+    driver = make_bassreflex()
+    res = max_spl(driver, f, port_velocity_max=17.0, amp_voltage=40.0, amp_current=10.0)
+    r = driver.responses(f, res["U_max"])
+
+    x_peak = np.sqrt(2) * np.abs(r["x"]) * 1000
+    P = np.abs(r["I"])**2 * driver.Re
+    v_port = np.sqrt(2) * np.abs(r["v_port"])
+    # Ningún límite se excede
+    assert np.all(x_peak <= 7.5 * (1 + 1e-9))
+    assert np.all(P <= 300 * (1 + 1e-9))
+    assert np.all(v_port <= 17.0 * (1 + 1e-9))
+    assert np.all(res["U_max"] <= 40.0)
+    assert np.all(np.abs(r["I"]) <= 10.0 * (1 + 1e-9))
+
+    # El límite gobernante queda justo en su valor
+    reached = {"excursion": x_peak / 7.5, "thermal": P / 300, "port_velocity": v_port / 17.0,
+               "amp_voltage": res["U_max"] / 40.0, "amp_current": np.abs(r["I"]) / 10.0}
+    for name in LIMITS:
+        mask = res["governing"] == name
+        if mask.any():
+            assert np.allclose(reached[name][mask], 1.0)
+
+# ------------------------
+# Test: SPL máximo coherente con el SPL a 1 V y con spl_total
+# ------------------------
+def test_spl_consistent_with_model():
+    driver = make_sealed()
+    res = max_spl(driver, f, amp_voltage=20.0)
+    assert np.allclose(res["SPL_1V"], driver.spl_total(f, 1.0), atol=1e-9)
+    assert np.allclose(res["SPL_max"], driver.spl_total(f, res["U_max"]), atol=1e-9)
+    # Excursión a baja frecuencia, amplificador o potencia arriba
+    assert res["governing"][0] == "excursion"
+    assert res["governing"][-1] in ("amp_voltage", "thermal")
+
+# ------------------------
+# Test: Lote de diseños igual a evaluarlos uno por uno
+# ------------------------
+def test_batch_matches_single():
+    designs = [make_sealed(20), make_sealed(60), make_bassreflex()]
+    batch = max_spl(designs, f, P_rated=[100, 200, 300], port_velocity_max=17.0, amp_voltage=50.0)
+    assert batch["SPL_max"].shape == (3, f.size)
+    for i, d in enumerate(designs):
+        single = max_spl(d, f, P_rated=[100, 200, 300][i], port_velocity_max=17.0, amp_voltage=50.0)
+        assert np.allclose(batch["SPL_max"][i], single["SPL_max"])
+        assert np.array_equal(batch["governing"][i], single["governing"])
+    # Las cajas selladas nunca quedan limitadas por el puerto
+    assert not np.any(batch["governing"][:2] == "port_velocity")
+
+# ------------------------
+# Test: Sin ningún límite se rechaza el cálculo
+# ------------------------
+def test_requires_a_limit():
+    with pytest.raises(ValueError):
+        max_spl(make_sealed(), f, Xmax_mm=None, P_rated=None)
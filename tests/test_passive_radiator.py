@@ -0,0 +1,79 @@
+# tests/test_passive_radiator.py
+
+from core.passive_radiator import PassiveRadiatorBox
+from core.driver import Driver
+from core.circuit import driver_netlist
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 3, 800)
+
+def make_box(added_mass=0.0):
+    return PassiveRadiatorBox(40, Sp=0.055, Mmp=0.12, Cmp=4e-4, Qmp=7.0, added_mass=added_mass)
+
+# ------------------------
+# Test: La solución 2DOF coincide con Driver (impedancia, velocidad y presión sumada) y con el netlist
+# ------------------------
+def test_two_dof_matches_driver():
+    box = make_box()
+    driver = Driver(params, enclosure=box)
+    res = box.solve(driver, f)
+    assert np.allclose(res["v_cone"], driver.velocity(f))
+    assert np.allclose(res["p_total"], driver.pressure(f))
+    assert np.allclose(res["SPL"], driver.spl_total(f))
+    sol = driver_netlist(driver).solve(f)
+    assert np.allclose(sol.input_impedance("Vg"), driver.impedance(f), rtol=1e-9)
+    # En el netlist los caudales de la caja se miden entrando desde la cara trasera del cono
+    assert np.allclose(-sol.volume_velocity("Cap"), res["v_radiator"] * box.Sp)
+
+# ------------------------
+# Test: En la sintonía el cono casi no se mueve y el radiador entrega el caudal
+# ------------------------
+def test_cone_minimum_at_tuning():
+    box = make_box()
+    res = box.solve(Driver(params, enclosure=box), f)
+    fb = box.tuning_frequency()
+    k = np.argmin(np.abs(res["x_cone"][(f > 15) & (f < 100)]))
+    assert abs(f[(f > 15) & (f < 100)][k] / fb - 1) < 0.05
+    kb = np.argmin(np.abs(f - fb))
+    assert np.abs(res["v_radiator"][kb]) > 3 * np.abs(res["v_cone"][kb])
+
+# ------------------------
+# Test: Lote sobre masa agregada: baja la sintonía y coincide con la evaluación individual
+# ------------------------
+def test_batch_added_mass():
+    masses = np.linspace(0.0, 0.2, 50)
+    box = make_box(masses)
+    driver = Driver(params, enclosure=box)
+    res = box.solve(driver, f)
+    assert res["p_total"].shape == (50, len(f))
+    assert np.all(np.diff(box.tuning_frequency()) < 0)
+    single_box = make_box(masses[20])
+    single = single_box.solve(Driver(params, enclosure=single_box), f)
+    assert np.allclose(res["x_radiator"][20], single["x_radiator"])
+    assert driver_netlist(driver).solve(f).V.shape[:2] == (50, len(f))
+
+# ------------------------
+# Test: Parámetros inválidos
+# ------------------------
+def test_invalid_radiator():
+    with pytest.raises(ValueError):
+        PassiveRadiatorBox(40, Sp=0.0, Mmp=0.1, Cmp=4e-4)
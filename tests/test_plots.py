@@ -0,0 +1,164 @@
+# tests/test_plots.py
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from visualization.plots import SubplotView, LivePreview, LIVE_CURVES, HoverCursor, FamilyOverlay, twin_axes_of
+from core.simulation import simulate_driver, simulate_family
+from core.driver import Driver
+from core.sealed import SealedBox
+import numpy as np
+
+# ------------------------
+# Test: La vista de un subplot solo agrega líneas nuevas y sigue set_data / visibilidad
+# ------------------------
+def test_subplot_view_incremental():
+    fig = Figure()
+    ax = fig.add_subplot(111)
+    twin = ax.twinx()
+    x = np.logspace(1, 3, 50)
+    a, = ax.semilogx(x, x, label="a")
+    b, = twin.semilogx(x, -x, label="b")
+    assert twin_axes_of(ax) == [twin]
+
+    view = SubplotView(ax)
+    assert view.sync() is True
+    first = view.lines[a]
+    assert len(view.fig.axes) == 2 and len(view.lines) == 2
+
+    c, = ax.semilogx(x, 2 * x, label="c")
+    a.set_data(x, 3 * x)
+    b.set_visible(False)
+    assert view.sync(show_legend=False) is True
+    assert view.lines[a] is first                                       # La línea existente se reutiliza
+    assert np.allclose(first.get_ydata(), 3 * x)
+    assert not view.lines[b].get_visible()
+    assert len(view.ax.get_legend().get_texts()) == 3 and not view.ax.get_legend().get_visible()
+
+    c.remove()
+    assert view.sync() is False
+    assert len(view.lines) == 2 and len(view.ax.get_lines()) == 1
+    assert len(view.ax.get_legend().get_texts()) == 2
+
+# ------------------------
+# Test: La vista previa en vivo dibuja por blitting y se quita sin dejar líneas
+# ------------------------
+def test_live_preview():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    params = {"Fs": 52, "Mms": 0.065, "Vas": 62, "Qts": 0.32, "Qes": 0.34, "Qms": 4.5,
+              "Re": 5.3, "Bl": 18.1, "Sd": 0.055, "Le": 1.5e-3, "Xmax": 7.5}
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    axs = [fig.add_subplot(3, 3, i + 1) for i in range(9)]
+    live = LivePreview(fig, axs)
+    assert len(live.lines) == len(LIVE_CURVES) == 9
+
+    coarse = simulate_driver(Driver(params, enclosure=SealedBox(20)), n=200, n_time=200)
+    live.update(coarse)                                                 # Primer cuadro: dibujo completo y fondo
+    assert live._background is not None
+    live.update(simulate_driver(Driver(params, enclosure=SealedBox(40)), n=200, n_time=200))
+    assert np.allclose(live.lines[6].get_xdata(), coarse["step_t"] * 1000)
+
+    live.remove()
+    assert all(len(ax.get_lines()) == 0 for ax in axs)
+
+# ------------------------
+# Test: La reducción LOD conserva picos y muescas y se recalcula al hacer zoom
+# ------------------------
+def test_line_decimator():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from visualization.plots import decimate_minmax, LineDecimator, full_data
+    f = np.logspace(0, np.log10(20000), 65536)
+    y = np.sin(f / 50.0)
+    y[30000] = 12.0                                                     # Pico angosto
+    y[50000] = -12.0                                                    # Muesca angosta
+
+    idx = decimate_minmax(f, y, 300, log=True)
+    assert idx.size <= 600 + 2 and np.all(np.diff(idx) > 0)
+    assert 30000 in idx and 50000 in idx and idx[0] == 0 and idx[-1] == f.size - 1
+
+    fig = Figure(figsize=(4, 3), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    line, = ax.semilogx(f, y)
+    lod = LineDecimator(fig)
+    lod.refresh()
+    coarse = line.get_xdata().size
+    assert coarse < 1000 and np.max(line.get_ydata()) == 12.0 and np.min(line.get_ydata()) == -12.0
+    assert full_data(line)[0].size == f.size
+
+    ax.set_xlim(1000, 1100)                                             # Zoom: se reduce desde la caché completa
+    zoomed = line.get_xdata()
+    assert zoomed.size < 1000 and zoomed.min() < 1000 and zoomed.max() > 1100
+    inside = (f >= 1000) & (f <= 1100)
+    assert np.count_nonzero((zoomed >= 1000) & (zoomed <= 1100)) >= min(np.count_nonzero(inside), 2 * 250)
+
+    line.set_data(f[:100], y[:100])                                     # set_data externo: pasan a ser los datos completos
+    lod.refresh()
+    assert full_data(line)[0].size == 100
+
+# ------------------------
+# Test: El cursor indexado encuentra el punto visible más cercano entre ejes y twins
+# ------------------------
+def test_hover_cursor():
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.backend_bases import MouseEvent
+    fig = Figure(figsize=(4, 3), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    twin = ax.twinx()
+    f = np.logspace(1, 3, 1000)
+    low, = ax.semilogx(f, np.zeros_like(f), label="SPL Total - a")
+    high, = ax.semilogx(f[::-1], np.ones_like(f), label="SPL Total - b")   # x desordenada
+    phase, = twin.semilogx(f[:500], 90 * np.ones(500), label="Fase SPL [°] - a")
+    ax.set_ylim(-1, 2)
+    twin.set_ylim(0, 100)
+    cursor = HoverCursor(fig)
+    fig.canvas.draw()
+
+    def hover(x, y, target_ax=ax):
+        px, py = target_ax.transData.transform((x, y))
+        MouseEvent("motion_notify_event", fig.canvas, px, py)._process()
+        return cursor.annotation.get_text()
+
+    assert "SPL Total - b" in hover(100, 0.9) and "Y: 1.00 dB" in cursor.annotation.get_text()
+    assert "SPL Total - a" in hover(100, 0.1)
+    entry = cursor._index[ax]
+    assert np.all(np.diff(entry["keys"]) > 0)                           # Índice ordenado (línea, x)
+    assert "Fase SPL" in hover(50, 90, twin) and "Y: 90.00 °" in cursor.annotation.get_text()
+    x_shown = float(hover(50.0, 0.1).split("X: ")[1].split()[0])
+    assert abs(x_shown - 50.0) < 1.0                                    # Punto de la línea bajo el mouse (±1 px)
+
+    high.set_visible(False)
+    assert "SPL Total - a" in hover(300, 0.9)                           # Las líneas ocultas no participan
+    phase.remove()
+    fig.canvas.draw()                                                   # Reindexa tras el dibujo
+    assert twin not in (cursor._index or {}) and "SPL Total - a" in hover(50, 90, twin)
+    cursor.remove()
+    assert cursor.annotation.figure is None
+
+# ------------------------
+# Test: La familia de curvas es una LineCollection por subplot con barra de color y se quita sin dejar rastro
+# ------------------------
+def test_family_overlay():
+    params = {"Fs": 52, "Mms": 0.065, "Vas": 62, "Qts": 0.32, "Qes": 0.34, "Qms": 4.5,
+              "Re": 5.3, "Bl": 18.1, "Sd": 0.055, "Le": 1.5e-3, "Xmax": 7.5}
+    fig = Figure(figsize=(12, 9))
+    axs = [fig.add_subplot(3, 3, i + 1) for i in range(9)]
+    axs[0].twinx()
+    n_axes = len(fig.axes)
+    positions = [ax.get_position().bounds for ax in fig.axes]
+
+    vb = np.linspace(10, 80, 8)
+    family = simulate_family(params, SealedBox(vb[:, None]), vb, n=65)
+    overlay = FamilyOverlay(fig, axs, family, label="Vb [L]")
+    assert len(overlay.collections) >= 6
+    assert np.allclose([ax.get_position().bounds for ax in fig.axes[:n_axes]], positions)  # El grid no se mueve
+    segments = overlay.collections[0].get_segments()
+    assert len(segments) == 8 and segments[0].shape == (65, 2)
+    assert np.allclose(overlay.collections[0].get_array(), vb)
+    assert overlay.colorbar.ax.get_ylabel() == "Vb [L]"
+
+    overlay.remove()
+    assert len(fig.axes) == n_axes and not any(ax.collections for ax in axs)
+    assert np.allclose([ax.get_position().bounds for ax in fig.axes], positions)
@@ -0,0 +1,94 @@
+# tests/test_port_compression.py
+
+from core.port_compression import port_compression
+from core.bassreflex import BassReflexBox
+from core.sealed import SealedBox
+from core.zrad import RadiationImpedance
+from core.driver import Driver
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 3, 400)
+levels = np.array([0.01, 1.0, 2.83, 10.0, 30.0, 60.0])
+
+def make_driver():
+    box = BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), area_port=0.005, length_port=0.28)
+    return Driver(params, enclosure=box)
+
+# ------------------------
+# Test: A bajo nivel coincide con el modelo lineal; la compresión crece con el nivel
+# ------------------------
+def test_compression_grows_with_level():
+    driver = make_driver()
+    res = port_compression(driver, f, levels)
+    assert res["SPL"].shape == (len(levels), len(f))
+    assert res["converged"].all()
+    assert np.max(np.abs(res["compression_db"][0])) < 0.05                 # Casi lineal (salvo en la cancelación bajo fp)
+    assert np.allclose(res["SPL_linear"][1], driver.spl_bassreflex_total(f, 1.0))
+    k = np.argmax(res["mach"][-1])                                      # Frecuencia de máxima velocidad en el puerto
+    assert np.all(np.diff(res["compression_db"][:, k]) > 0)
+
+# ------------------------
+# Test: La solución es un punto fijo de R_nl(|v_port|)
+# ------------------------
+def test_fixed_point_consistency():
+    driver = make_driver()
+    res = port_compression(driver, f, 30.0, tol=1e-8)
+    _, _, _, v = driver._bassreflex_pressures(f, 30.0, R_extra=res["R_nl"], with_velocities=True)
+    assert np.allclose(np.abs(v), np.abs(res["v_port"]), rtol=1e-5)
+
+# ------------------------
+# Test: Con R_extra la velocidad del cono sale de la misma carga mecánica (solución autoconsistente)
+# ------------------------
+def test_extra_resistance_closed_form():
+    driver = Driver(params, enclosure=BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), area_port=0.002, length_port=0.28))
+    f = np.array([20.0, 60.0, 200.0])
+    Sp, R_extra = 0.002, 5 * driver.rho0 * driver.c / 0.002
+    _, _, v, _ = driver._bassreflex_pressures(f, 2.83, R_extra=R_extra, with_velocities=True)
+
+    w = 2 * np.pi * f
+    Zab = 1 / (1j * w * driver.enclosure.Vb_m3 / (driver.rho0 * driver.c**2))
+    Map = driver.rho0 * (0.28 + 0.85 * np.sqrt(Sp / np.pi)) / Sp
+    Zap = driver.rho0 * driver.c * 0.02 / Sp + 1j * w * Map + R_extra
+    Zm_total = (driver.Rms + 1j * w * driver.Mms + 1 / (1j * w * driver.Cms)
+                + Zab * Zap / (Zab + Zap) * driver.Sd**2)
+    expected = driver.Bl * 2.83 / (driver.blocked_impedance(f) * Zm_total + driver.Bl**2)
+    assert np.allclose(v, expected)
+
+# ------------------------
+# Test: Mach, banderas de chuffing y máscara de convergencia
+# ------------------------
+def test_mach_flags_and_masks():
+    driver = make_driver()
+    res = port_compression(driver, f, levels, chuff_mach=0.05)
+    assert np.allclose(res["mach"], np.sqrt(2) * np.abs(res["v_port"]) / driver.c)
+    assert not res["chuffing"][0].any()
+    assert res["chuffing"][-1].any()
+    assert np.array_equal(res["chuffing"], res["mach"] > 0.05)
+    partial = port_compression(driver, f, levels, tol=1e-12, max_iter=2)
+    assert not partial["converged"].all()
+    assert partial["iterations"].max() == 2
+
+# ------------------------
+# Test: Solo para bass-reflex
+# ------------------------
+def test_requires_bassreflex():
+    with pytest.raises(ValueError):
+        port_compression(Driver(params, enclosure=SealedBox(40)), f, 10.0)
@@ -0,0 +1,125 @@
+# tests/test_rational.py
+
+from core.rational import system_tf, RationalTF, polymul
+from core.circuit import driver_netlist, cone_velocity
+from core.driver import Driver
+from core.sealed import SealedBox
+from core.bassreflex import BassReflexBox
+from core.passive_radiator import PassiveRadiatorBox
+from core.zrad import RadiationImpedance
+from scipy.signal import lti
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 3.5, 400)
+
+def make_driver(enclosure):
+    driver = Driver(params, enclosure=enclosure)
+    if enclosure is not None:
+        enclosure.rho0, enclosure.c = driver.rho0, driver.c             # Mismo aire que el driver
+    return driver
+
+def enclosures():
+    return [None, SealedBox(30),
+            BassReflexBox(0.05, 1.18, 343, RadiationImpedance(), area_port=0.005, length_port=0.28),
+            PassiveRadiatorBox(40, Sp=0.05, Mmp=0.2, Cmp=3e-4)]
+
+# ------------------------
+# Test: La función racional coincide con el circuito equivalente (MNA)
+# ------------------------
+@pytest.mark.parametrize("index", range(4))
+def test_matches_netlist(index):
+    driver = make_driver(enclosures()[index])
+    sol = driver_netlist(driver, U=1.0).solve(f)
+    v = cone_velocity(sol)
+    assert np.allclose(system_tf(driver, "velocity").response(f), v, rtol=1e-9)
+    assert np.allclose(driver.transfer_function("impedance").response(f), sol.input_impedance("Vg"), rtol=1e-9)
+    assert np.allclose(system_tf(driver, "displacement").response(f), v / (2j * np.pi * f), rtol=1e-9)
+
+# ------------------------
+# Test: Presión de baja frecuencia igual a Driver.pressure en baffle infinito
+# ------------------------
+def test_pressure_matches_driver():
+    driver = make_driver(None)
+    f_low = np.logspace(1, 1.9, 50)                                     # ka pequeño: directividad ≈ 1
+    p = system_tf(driver, "pressure").response(f_low)
+    assert np.allclose(p, driver.pressure(f_low, 1.0), rtol=5e-3)
+
+# ------------------------
+# Test: Polos, frecuencia y Q de la caja sellada
+# ------------------------
+def test_sealed_poles():
+    driver = Driver(dict(params, Le=0.0), enclosure=SealedBox(30))   # Sin Le: sistema de 2º orden exacto
+    driver.enclosure.rho0, driver.enclosure.c = driver.rho0, driver.c
+    H = system_tf(driver, "velocity")
+    f0, Q = H.pole_frequencies()
+    assert H.den.shape[-1] == 3
+
+    # Resonancia y Q del sistema sellado: K = 1/Cms + Sd²/Cab, R = Rms + Bl²/(Re + Rg)
+    Cab = 0.030 / (driver.rho0 * driver.c**2)
+    K = 1 / driver.Cms + driver.Sd**2 / Cab
+    R = driver.Rms + driver.Bl**2 / (driver.Re + driver.Rg)
+    assert np.allclose(f0, np.sqrt(K / driver.Mms) / (2 * np.pi))
+    assert np.allclose(Q, np.sqrt(K * driver.Mms) / R)
+    assert np.all(np.real(H.poles()) < 0)                               # Sistema estable
+
+# ------------------------
+# Test: Impulso y escalón exactos por residuos frente a scipy
+# ------------------------
+@pytest.mark.parametrize("index", range(4))
+def test_step_and_impulse_match_scipy(index):
+    driver = make_driver(enclosures()[index])
+    H = system_tf(driver, "velocity")
+    t = np.linspace(0, 0.2, 2001)
+    system = lti(H.num, H.den)
+    _, step_ref = system.step(T=t)
+    _, impulse_ref = system.impulse(T=t)
+    assert np.allclose(H.step(t), step_ref, atol=1e-6 * np.max(np.abs(step_ref)))
+    assert np.allclose(H.impulse(t), impulse_ref, atol=1e-6 * np.max(np.abs(impulse_ref)))
+
+# ------------------------
+# Test: Lote de diseños y masa agregada en lote
+# ------------------------
+def test_batched_designs():
+    designs = [make_driver(SealedBox(v)) for v in (10, 30, 90)]
+    H = system_tf(designs, "displacement")
+    X = H.response(f)
+    assert X.shape == (3, f.size)
+    for i, d in enumerate(designs):
+        assert np.allclose(X[i], system_tf(d, "displacement").response(f))
+    assert H.step(np.linspace(0, 0.1, 50)).shape == (3, 50)
+
+    box = PassiveRadiatorBox(40, Sp=0.05, Mmp=0.2, Cmp=3e-4, added_mass=np.array([0.0, 0.1, 0.3]))
+    H_pr = system_tf(make_driver(box), "pressure")
+    assert H_pr.response(f).shape == (3, f.size)
+
+# ------------------------
+# Test: Aritmética de polinomios y recintos no racionales
+# ------------------------
+def test_polynomials_and_errors():
+    assert np.allclose(polymul([1, 2], [1, 3]), [1, 5, 6])
+    H = RationalTF([1.0], [1.0, 1.0])
+    assert np.allclose(H.step(np.array([0.0, 1.0])), [0.0, 1 - np.exp(-1)])
+    with pytest.raises(ValueError):
+        RationalTF([1.0, 0.0, 0.0], [1.0, 1.0]).step(np.array([0.0]))
+    box = BassReflexBox(0.05, 1.18, 343, RadiationImpedance(), area_port=0.005, length_port=0.28, port_model="distributed")
+    with pytest.raises(ValueError):
+        system_tf(make_driver(box))
@@ -0,0 +1,133 @@
+# tests/test_simulation.py
+
+from core.simulation import simulate_driver, simulate_design, simulate_family, progressive_sweep, level_indices, SimulationCancelled
+from core.driver import Driver
+from core.sealed import SealedBox
+from core.bassreflex import BassReflexBox
+from core.zrad import RadiationImpedance
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 52,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.32,
+    "Qes": 0.34,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+
+def make_bassreflex():
+    box = BassReflexBox(0.02, 1.21, 343, RadiationImpedance(), area_port=0.01, length_port=0.1)
+    return Driver(params, enclosure=box)
+
+# ------------------------
+# Test: El barrido vectorizado coincide con la evaluación punto a punto
+# ------------------------
+@pytest.mark.parametrize("driver", [Driver(params), Driver(params, enclosure=SealedBox(20)), make_bassreflex()])
+def test_matches_pointwise(driver):
+    r = simulate_driver(driver, n=200)
+    f = r["frequencies"]
+    assert f.size == 200 and np.isclose(f[-1], driver.f_max_ka(1.0))
+    assert np.allclose(r["Z_magnitude"], [abs(driver.impedance(x)) for x in f])
+    assert np.allclose(r["SPL_total"], [driver.spl_total(x) for x in f])
+    assert np.allclose(r["velocities"], [abs(driver.velocity(x)) for x in f])
+    assert np.allclose(r["P_ac"], [driver.power_ac(x) for x in f])
+    assert np.allclose(r["P_real"], [driver.power_real(x) for x in f])
+    assert np.allclose(r["efficiency_val"], driver.efficiency(f))
+    assert np.allclose(r["cone_force_array"], driver.excursion(f)[3])
+    assert np.allclose(r["excursion_mm"], r["displacements_mm"])
+    assert (r["SPL_cone"] is None) == (driver.enclosure is None or "BassReflex" not in type(driver.enclosure).__name__)
+
+# ------------------------
+# Test: Progreso monótono y cancelación entre etapas
+# ------------------------
+def test_progress_and_cancel():
+    seen = []
+    driver, r = simulate_design(params, SealedBox(20), n=100, progress=seen.append)
+    assert isinstance(driver, Driver) and r["SPL_total"].shape == (100,)
+    assert seen == sorted(seen) and seen[0] == 0.0 and seen[-1] == 1.0
+
+    calls = []
+    def cancel_after_two():
+        calls.append(1)
+        return len(calls) > 2
+    sweep = progressive_sweep(Driver(params), n=129, levels=(9, 33), cancelled=cancel_after_two)
+    assert next(sweep)["frequencies"].size == 9
+    assert next(sweep)["frequencies"].size == 33
+    with pytest.raises(SimulationCancelled):
+        next(sweep)
+
+# ------------------------
+# Test: El barrido progresivo reutiliza los puntos y termina igual que el barrido completo
+# ------------------------
+def test_progressive_reuses_points():
+    driver = make_bassreflex()
+    evaluated = []
+    impedance = driver.impedance
+    driver.impedance = lambda f: (evaluated.append(np.size(f)), impedance(f))[1]
+
+    partials = list(progressive_sweep(driver, n=1025, levels=(65, 257)))
+    assert [p["frequencies"].size for p in partials] == [65, 257, 1025]
+    assert list(dict.fromkeys(evaluated)) == [65, 192, 768]                 # Solo puntos nuevos
+    assert np.all(np.isin(partials[0]["frequencies"], partials[1]["frequencies"]))
+
+    driver.impedance = impedance
+    full = simulate_driver(driver, frequencies=partials[-1]["frequencies"])
+    for key in ("Z_magnitude", "SPL_total", "SPL_phase", "SPL_port", "group_delay_vals", "efficiency_val"):
+        assert np.allclose(partials[-1][key], full[key])
+    assert np.allclose(full["SPL_phase"], driver.spl_phase(full["frequencies"]))
+    assert np.allclose(full["group_delay_vals"], -driver.group_delay_array(full["frequencies"]))
+    assert [idx.size for idx in level_indices(1025, (65, 257, 4096))] == [65, 257, 1025]
+
+# ------------------------
+# Test: El trabajo reemplazado se cancela y solo llega el resultado vigente (Qt)
+# ------------------------
+def test_runner_supersedes():
+    QtCore = pytest.importorskip("PyQt5.QtCore")
+    from visualization.worker import SimulationRunner
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    runner = SimulationRunner()
+    results = []
+    runner.result.connect(lambda context, value: results.append(context))
+    runner.submit(simulate_design, params, None, context="viejo")
+    runner.submit(simulate_design, params, SealedBox(20), context="nuevo")
+
+    loop = QtCore.QEventLoop()
+    runner.busy.connect(lambda busy: busy or loop.quit())
+    QtCore.QTimer.singleShot(20000, loop.quit)
+    if runner.is_busy():
+        loop.exec_()
+    runner.pool.waitForDone()
+    app.processEvents()
+    assert results == ["nuevo"]
+
+# ------------------------
+# Test: La familia vectorizada coincide con simular cada diseño por separado
+# ------------------------
+def test_family_matches_individual():
+    vb = np.linspace(10, 80, 8)
+    family = simulate_family(params, SealedBox(vb[:, None]), vb, n=257)
+    assert family["SPL_total"].shape == (8, 257) and family["values"].shape == (8,)
+    for i in (0, 7):
+        single = simulate_driver(Driver(params, enclosure=SealedBox(vb[i])), n=257)
+        for key in ("Z_magnitude", "SPL_total", "SPL_phase", "group_delay_vals", "efficiency_val", "excursion_mm"):
+            assert np.allclose(family[key][i], single[key])
+
+    lengths = 0.1 * np.linspace(0.7, 1.3, 5)
+    box = BassReflexBox(0.02, 1.21, 343, RadiationImpedance(), area_port=0.01, length_port=lengths[:, None])
+    family = simulate_family(params, box, lengths, n=129)
+    single = simulate_driver(Driver(params, enclosure=BassReflexBox(0.02, 1.21, 343, RadiationImpedance(),
+                                                                    area_port=0.01, length_port=lengths[3])), n=129)
+    assert np.allclose(family["SPL_total"][3], single["SPL_total"]) and np.allclose(family["SPL_port"][3], single["SPL_port"])
+    assert np.allclose(family["Z_magnitude"][3], single["Z_magnitude"])
+    assert np.ptp(family["Z_magnitude"], axis=0).max() > 1.0                 # |Z| cambia con el largo del ducto
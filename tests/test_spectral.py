@@ -0,0 +1,85 @@
+# tests/test_spectral.py
+
+from core.spectral import pink_psd, iec_psd, measured_psd, psd_weights, noise_response
+from core.max_spl import stack_responses
+from core.bassreflex import BassReflexBox
+from core.sealed import SealedBox
+from core.zrad import RadiationImpedance
+from core.driver import Driver
+import numpy as np
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 4, 600)
+
+def make_bassreflex():
+    box = BassReflexBox(0.05, 1.2, 343, RadiationImpedance(), area_port=0.005, length_port=0.28)
+    return Driver(params, enclosure=box)
+
+# ------------------------
+# Test: Los pesos integran el voltaje RMS total y el ruido rosa tiene igual energía por octava
+# ------------------------
+def test_weights_and_pink_octaves():
+    w = psd_weights(f, pink_psd(f), U_rms=3.0)
+    assert np.isclose(np.sum(w), 9.0)
+    octave_1 = np.sum(w[(f >= 100) & (f < 200)])
+    octave_2 = np.sum(w[(f >= 1000) & (f < 2000)])
+    assert np.isclose(octave_1, octave_2, rtol=0.05)
+
+    # El espectro IEC concentra menos energía en los extremos que el rosa
+    iec = psd_weights(f, iec_psd(f))
+    pink = psd_weights(f, pink_psd(f))
+    assert iec[0] < pink[0] and iec[-1] < pink[-1]
+
+# ------------------------
+# Test: Con excitación de banda angosta se recupera la respuesta a un seno
+# ------------------------
+def test_narrowband_matches_sine():
+    driver = make_bassreflex()
+    r = driver.responses(f, 1.0)
+    f0 = f[np.argmin(np.abs(f - 50.0))]
+    psd = np.exp(-0.5 * (np.log(f / f0) / 0.002)**2)                  # Toda la energía en el punto de la grilla f0
+    res = noise_response(r, f, psd, driver.Re, U_rms=10.0)
+    sine = driver.responses(np.array([f0]), 10.0)
+    assert np.isclose(res["x_rms"], np.abs(sine["x"][0]) * 1000, rtol=0.01)
+    assert np.isclose(res["v_port_rms"], np.abs(sine["v_port"][0]), rtol=0.01)
+    assert np.isclose(res["power"], np.abs(sine["I"][0])**2 * driver.Re, rtol=0.01)
+    assert np.isclose(res["x_peak"], 2.0 * res["x_rms"])
+
+# ------------------------
+# Test: Lote de diseños igual a evaluarlos uno por uno
+# ------------------------
+def test_batch_matches_single():
+    designs = [Driver(params, enclosure=SealedBox(20)), Driver(params, enclosure=SealedBox(80)), make_bassreflex()]
+    stacked = stack_responses(designs, f)
+    Re = np.array([d.Re for d in designs])
+    batch = noise_response(stacked, f, iec_psd(f), Re, U_rms=np.array([5.0, 10.0, 20.0]))
+    for i, d in enumerate(designs):
+        single = noise_response(d.responses(f, 1.0), f, iec_psd(f), d.Re, U_rms=[5.0, 10.0, 20.0][i])
+        assert np.isclose(batch["x_rms"][i], single["x_rms"])
+        assert np.isclose(batch["power"][i], single["power"])
+    assert np.all(np.isnan(batch["v_port_rms"][:2])) and np.isfinite(batch["v_port_rms"][2])
+    assert np.allclose(np.sum(batch["density_x"], axis=1), batch["x_rms"]**2)
+
+# ------------------------
+# Test: Espectro medido interpolado en log-log y nulo fuera de rango
+# ------------------------
+def test_measured_psd():
+    psd = measured_psd(f, [20, 200, 2000], [1.0, 0.1, 0.01])
+    assert np.allclose(psd[(f >= 20) & (f <= 2000)], 20 / f[(f >= 20) & (f <= 2000)])
+    assert np.all(psd[(f < 20) | (f > 2000)] == 0)
@@ -0,0 +1,97 @@
+# tests/test_system.py
+
+from core.system import System
+from core.driver import Driver
+from core.sealed import SealedBox
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 52,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.32,
+    "Qes": 0.34,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 4, 200)
+
+# ------------------------
+# Test: Una rama en el origen reproduce Driver.pressure en eje
+# ------------------------
+def test_single_branch_on_axis():
+    driver = Driver(params, enclosure=SealedBox(40))
+    system = System(distance=1.0).add_branch("woofer", driver)
+    assert np.allclose(system.response(f), driver.pressure(f))
+    assert np.allclose(system.spl(f), driver.spl_total(f))
+
+# ------------------------
+# Test: Retardo de medio período y polaridad
+# ------------------------
+def test_delay_and_polarity_cancellation():
+    driver = Driver(params)
+    f0 = 500.0
+    system = System().add_branch("a", driver).add_branch("b", driver, delay=1 / (2 * f0))
+    p = system.response(np.array([f0]))
+    assert np.abs(p[0]) < 1e-9 * np.abs(system.branch_response("a", [f0])[0])
+    system.set_branch("b", delay=0.0, polarity=-1)
+    assert np.abs(system.response(np.array([f0]))[0]) < 1e-12
+
+# ------------------------
+# Test: Separación vertical produce un nulo fuera de eje solo en el plano vertical
+# ------------------------
+def test_vertical_offset_lobing():
+    driver = Driver(params)
+    s = 0.2                                                             # Separación entre centros
+    f0 = 1000.0
+    angle = np.degrees(np.arcsin(driver.c / f0 / 2 / s))                # s·sinθ = λ/2
+    system = System(distance=50.0)
+    system.add_branch("low", driver, offset=-s / 2).add_branch("high", driver, offset=s / 2)
+    ref = np.abs(system.response([f0], 0.0)[0])
+    vertical = np.abs(system.response([f0], angle, "vertical")[0])
+    horizontal = np.abs(system.response([f0], angle, "horizontal")[0])
+    assert vertical < 0.02 * ref
+    assert horizontal > 0.5 * ref
+
+# ------------------------
+# Test: Grilla frecuencia × ángulo y caché de ramas
+# ------------------------
+def test_grid_shape_and_cache():
+    driver = Driver(params)
+    calls = []
+    original = driver.pressure
+    driver.pressure = lambda f, U=2.83: calls.append(1) or original(f, U)
+    system = System().add_branch("woofer", driver).add_branch("copy", driver, offset=(0.0, 0.3, 0.02))
+    angles = np.arange(-90, 91, 5)
+    p, parts = system.response(f, angles, per_branch=True)
+    assert p.shape == (len(angles), len(f))
+    assert parts["copy"].shape == p.shape
+    assert len(calls) == 2
+    system.set_branch("copy", delay=1e-4, polarity=-1, offset=0.1)
+    system.response(f, angles, "horizontal")
+    assert len(calls) == 2                                              # Solo se re-suma
+    system.set_branch("copy", driver=driver)
+    system.response(f, angles)
+    assert len(calls) == 3
+
+# ------------------------
+# Test: Errores de configuración
+# ------------------------
+def test_invalid_configuration():
+    driver = Driver(params)
+    system = System().add_branch("woofer", driver)
+    with pytest.raises(ValueError):
+        system.add_branch("woofer", driver)
+    with pytest.raises(ValueError):
+        system.set_branch("woofer", phase=1)
+    with pytest.raises(ValueError):
+        system.response(f, 0.0, "diagonal")
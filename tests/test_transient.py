@@ -0,0 +1,99 @@
+# tests/test_transient.py
+
+from core.transient import transient_response, _spectral_response
+from core.driver import Driver
+from core.sealed import SealedBox
+from core.transmission_line import TransmissionLineBox
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+t = np.linspace(0, 0.5, 2001)
+
+def make_driver(enclosure, **overrides):
+    driver = Driver(dict(params, **overrides), enclosure=enclosure)
+    if enclosure is not None:
+        enclosure.rho0, enclosure.c = driver.rho0, driver.c
+    return driver
+
+# ------------------------
+# Test: Escalón en caja sellada: desplazamiento estático y coherencia x, v, a
+# ------------------------
+def test_sealed_step_static_and_derivatives():
+    driver = make_driver(SealedBox(30))
+    r = transient_response(driver, t, U=2.83)
+    Cab = 0.030 / (driver.rho0 * driver.c**2)
+    K = 1 / driver.Cms + driver.Sd**2 / Cab
+    x_static = driver.Bl * 2.83 / ((driver.Re + driver.Rg) * K)
+    assert np.isclose(r["x"][-1], x_static, rtol=1e-3)
+    assert r["x"][0] == 0 and abs(r["v"][-1]) < 1e-3 * np.max(np.abs(r["v"]))
+
+    # Derivadas exactas: dx/dt = v y dv/dt = a (en una grilla fina, en cualquier instante)
+    t_fine = np.linspace(1e-3, 0.05, 20001)
+    r = transient_response(driver, t_fine, U=2.83)
+    dt = t_fine[1] - t_fine[0]
+    assert np.allclose(np.gradient(r["x"], dt)[1:-1], r["v"][1:-1], atol=1e-4 * np.max(np.abs(r["v"])))
+    assert np.allclose(np.gradient(r["v"], dt)[1:-1], r["a"][1:-1], atol=1e-3 * np.max(np.abs(r["a"])))
+
+# ------------------------
+# Test: La forma cerrada coincide con la síntesis espectral
+# ------------------------
+def test_closed_form_matches_spectral():
+    driver = make_driver(None)                                          # Baffle infinito: mismo modelo en Driver.responses
+    exact = transient_response(driver, t, U=1.0)
+    spectral = _spectral_response(driver, t, 1.0, "step", 8192.0)
+    assert np.allclose(spectral["x"], exact["x"], atol=1e-2 * np.max(np.abs(exact["x"])))
+    assert np.allclose(spectral["v"], exact["v"], atol=1e-2 * np.max(np.abs(exact["v"])))
+
+# ------------------------
+# Test: Recinto distribuido (línea de transmisión) por síntesis espectral
+# ------------------------
+def test_transmission_line_step():
+    driver = Driver(params, enclosure=TransmissionLineBox(2.0, 0.01, stuffing=200))
+    _, x, v, a = driver.step_response(np.linspace(0, 1.5, 3001))
+    # Línea abierta: el desplazamiento final lo fija solo la suspensión
+    x_static = driver.Bl * 2.83 / (driver.Re + driver.Rg) * driver.Cms * 1000
+    assert np.isclose(x[-1], x_static, rtol=0.05)
+    assert np.all(np.isfinite(v)) and np.all(np.isfinite(a))
+
+# ------------------------
+# Test: Lote de Monte Carlo igual a evaluar cada diseño
+# ------------------------
+def test_monte_carlo_batch():
+    rng = np.random.default_rng(0)
+    designs = [make_driver(SealedBox(30), Bl=bl, Mms=m) for bl, m in zip(18.1 * rng.normal(1, 0.05, 20), 0.065 * rng.normal(1, 0.05, 20))]
+    designs.append(make_driver(None))                                   # Estructura distinta en el mismo lote
+    batch = transient_response(designs, t, kind="impulse")
+    assert batch["v"].shape == (21, t.size)
+    for i in (0, 7, 20):
+        single = transient_response(designs[i], t, kind="impulse")
+        assert np.allclose(batch["v"][i], single["v"])
+
+# ------------------------
+# Test: Driver.step_response mantiene su interfaz (t ordenado, unidades en mm)
+# ------------------------
+def test_driver_step_response_interface():
+    driver = make_driver(None)
+    t_out, x, v, a = driver.step_response(list(t[::-1]))
+    assert np.all(np.diff(t_out) > 0)
+    r = transient_response(driver, t_out)
+    assert np.allclose(x, r["x"] * 1000) and np.allclose(a, r["a"] * 1000)
+    with pytest.raises(ValueError):
+        driver.step_response([])
@@ -0,0 +1,97 @@
+# tests/test_transmission_line.py
+
+from core.transmission_line import TransmissionLineBox
+from core import transfer_matrix as tm
+from core.driver import Driver
+from core.circuit import driver_netlist
+import numpy as np
+import pytest
+
+# ------------------------
+# Parámetros base comunes
+# ------------------------
+params = {
+    "Fs": 35,
+    "Mms": 0.065,
+    "Vas": 62,
+    "Qts": 0.35,
+    "Qes": 0.38,
+    "Qms": 4.5,
+    "Re": 5.3,
+    "Bl": 18.1,
+    "Sd": 0.055,
+    "Le": 1.5e-3,
+    "Reh": 0,
+    "Xmax": 7.5
+}
+
+f = np.logspace(1, 3.3, 2000)
+
+# ------------------------
+# Test: Cadena de segmentos de una línea recta = solución analítica del tubo uniforme
+# ------------------------
+def test_uniform_line_matches_analytic():
+    tl = TransmissionLineBox(2.0, 0.03, segments=200)
+    k = 2 * np.pi * f / tl.c
+    Zc = tl.rho0 * tl.c / 0.03
+    ZL = tl.mouth_impedance(f)
+    kL = k * 2.0
+    Z_ref = Zc * (ZL * np.cos(kL) + 1j * Zc * np.sin(kL)) / (Zc * np.cos(kL) + 1j * ZL * np.sin(kL))
+    assert np.allclose(tl.input_impedance(f), Z_ref, rtol=1e-8)
+
+# ------------------------
+# Test: Reducción en árbol = producto secuencial con np.matmul (también con N impar)
+# ------------------------
+@pytest.mark.parametrize("N", [1, 7, 64])
+def test_chain_matches_sequential_product(N):
+    rng = np.random.default_rng(N)
+    T = rng.normal(size=(50, N, 2, 2)) + 1j * rng.normal(size=(50, N, 2, 2))
+    ref = T[:, 0]
+    for i in range(1, N):
+        ref = np.matmul(ref, T[:, i])
+    assert np.allclose(tm.chain(T), ref)
+
+# ------------------------
+# Test: Cuarto de onda cónico converge con la discretización
+# ------------------------
+def test_tapered_line_converges():
+    coarse = TransmissionLineBox(1.8, 0.04, 0.01, segments=200).input_impedance(f)
+    fine = TransmissionLineBox(1.8, 0.04, 0.01, segments=800).input_impedance(f)
+    assert np.max(np.abs(coarse - fine) / np.abs(fine)) < 0.01
+
+# ------------------------
+# Test: El relleno atenúa la resonancia de cuarto de onda
+# ------------------------
+def test_stuffing_damps_resonance():
+    empty = TransmissionLineBox(2.0, 0.03, stuffing=0.0)
+    stuffed = TransmissionLineBox(2.0, 0.03, stuffing=2000.0)
+    band = (f > 30) & (f < 60)
+    assert np.max(np.abs(stuffed.input_impedance(f)[band])) < 0.5 * np.max(np.abs(empty.input_impedance(f)[band]))
+    Q_empty, _ = empty.secondary_output(f, 0.055, np.ones_like(f))
+    Q_stuffed, _ = stuffed.secondary_output(f, 0.055, np.ones_like(f))
+    assert np.abs(Q_stuffed[-1]) < 0.1 * np.abs(Q_empty[-1])
+
+# ------------------------
+# Test: Integración con Driver (impedancia, velocidad y presión con la boca) y con el netlist
+# ------------------------
+def test_driver_integration():
+    tl = TransmissionLineBox(2.0, 0.03, 0.02, stuffing=500.0)
+    driver = Driver(params, enclosure=tl)
+    Z = driver.impedance(f)
+    assert Z.shape == f.shape and np.all(np.isfinite(Z))
+    sol = driver_netlist(driver).solve(f)
+    assert np.allclose(sol.input_impedance("Vg"), Z, rtol=1e-6)
+    p = driver.pressure(f)
+    w = 2 * np.pi * f
+    p_cone = 1j * w * driver.rho0 * driver.velocity(f) * driver.Sd * driver._piston_directivity(w / driver.c * np.sqrt(driver.Sd / np.pi)) / (2 * np.pi)
+    assert not np.allclose(p, p_cone)                                   # La boca suma a la salida
+    assert np.allclose(driver.spl_total(f), 20 * np.log10(np.abs(p) / 20e-6))
+
+# ------------------------
+# Test: Geometría inválida
+# ------------------------
+def test_invalid_geometry():
+    with pytest.raises(ValueError):
+        TransmissionLineBox(0.0, 0.03)
+    with pytest.raises(ValueError):
+        TransmissionLineBox(1.0, 0.03, segments=0)
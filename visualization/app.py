@@ -11,7 +11,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 import sys
 from core.driver import Driver
-from visualization.plots import plot_all
+from core.simulation import progressive_sweep
+from core.history import SimulationStore
+from visualization.plots import plot_all, update_series, LineDecimator, HoverCursor, full_data
 
 
 class App:
@@ -24,7 +26,7 @@ class App:
         self.units = units
         self.user_params = params.copy()
         self.driver = None
-        self.simulated_params = set()
+        self.store = SimulationStore()                                  # Clave de parámetros → curvas calculadas
 
         self.check_vars = []
         self.checkboxes = []
@@ -233,6 +235,7 @@ class App:
         self.fig = None
         self.axs = None
         self.canvas = None
+        self.lod = None                                                 # Reducción LOD de las líneas del grid
 
         # Escalado dinámico de paneles al redimensionar
         self.root.bind("<Configure>", self.on_resize)
@@ -312,10 +315,9 @@ class App:
 
         # Crea una tupla ordenada de los parámetros para comparar
         param_tuple = tuple((k, self.user_params[k]) for k in sorted(self.user_params)) + (enclosure_type, vb_litros)
-        if param_tuple in self.simulated_params:
+        if param_tuple in self.store:
             messagebox.showerror("Error", "Ya existe una simulación con estos parámetros. Modifica algún valor para simular un driver diferente.")
             return
-        self.simulated_params.add(param_tuple)
 
         # Modelo de radiación (nuevo)
         radiation_model = self.radiation_model_var.get()
@@ -323,7 +325,17 @@ class App:
         # Crear driver con recinto
         self.driver = Driver(self.user_params, enclosure=enclosure, radiation_model=radiation_model)
         self.update_resumen()
-        self.update_plots()
+        self.run_simulation(param_tuple)
+
+    def run_simulation(self, sim_key):
+        # Única ruta que simula: guarda el resultado en el almacén y lo dibuja; el resto de acciones redibuja.
+        nombre_driver = self.name_var.get().strip() or f"Simulación {len(self.store)+1}"
+        # Barrido progresivo: el primer nivel (65 puntos) se dibuja de inmediato y se refina después
+        sweep = progressive_sweep(self.driver)
+        record = self.store.add(sim_key, nombre_driver, self.user_params, next(sweep), driver=self.driver)
+        self.sim_names.append(nombre_driver)
+        lines = self.update_plots(record)
+        self.refine_plots(sweep, record, lines)
 
 
     def update_resumen(self):
@@ -334,25 +346,24 @@ class App:
         self.resumen_text.config(state="disabled")
 
     def export_txt(self):
-        if self.driver is None:
+        # Exporta la última simulación desde el almacén: resumen (.txt) o curvas calculadas (.csv).
+        record = self.store.last()
+        if record is None:
             messagebox.showerror("Error", "Primero realiza una simulación antes de exportar.")
             return
-        nombre = self.name_var.get().strip() or "driver"
-        resumen = self.driver.resumen_parametros()
-        params_str = "Parámetros del driver:\n"
-        for k, v in self.user_params.items():
-            unidad = self.units.get(k, "")
-            params_str += f"{k}: {v} {unidad}\n"
-        contenido = f"Nombre: {nombre}\n\n{params_str}\nResumen:\n{resumen}"
+        nombre = record["name"] or "driver"
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
-            filetypes=[("Archivo de texto", "*.txt")],
+            filetypes=[("Archivo de texto", "*.txt"), ("Curvas CSV", "*.csv")],
             initialfile=f"{nombre}_resumen.txt"
         )
         if file_path:
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(contenido)
+                if file_path.lower().endswith(".csv"):
+                    self.store.write_csv(record["key"], file_path)
+                else:
+                    with open(file_path, "w", encoding="utf-8") as f:
+                        f.write(self.store.summary(record["key"], self.units))
                 messagebox.showinfo("Exportación exitosa", f"Archivo guardado en:\n{file_path}")
             except Exception as e:
                 messagebox.showerror("Error", f"No se pudo guardar el archivo:\n{e}")
@@ -374,70 +385,46 @@ class App:
         self.cursor_btn.config(
             text="Ocultar cursor grid" if self.enable_grid_cursor else "Mostrar cursor grid"
         )
-        self.update_plots()
-
-    def update_plots(self):
+        # Solo activa/desactiva el cursor sobre las líneas ya dibujadas (no vuelve a simular)
+        if self.fig is None:
+            return
+        if self.enable_grid_cursor and self.grid_cursor is None:
+            self.grid_cursor = HoverCursor(self.fig)
+        elif not self.enable_grid_cursor and self.grid_cursor is not None:
+            self.grid_cursor.remove()
+            self.grid_cursor = None
+
+    def update_plots(self, record):
+        # Dibuja una simulación guardada en el almacén (no simula).
         import matplotlib
         import matplotlib.pyplot as plt
 
         linestyles = ["-", "--", "-.", ":"]
-        if not hasattr(self, "plot_count"):
-            self.plot_count = 0
-
         linestyle = linestyles[self.plot_count % len(linestyles)]
-        nombre_driver = self.name_var.get().strip() or f"Simulación {self.plot_count+1}"
-        self.sim_names.append(nombre_driver)
+        nombre_driver = record["name"]
+        result = record["result"]
         self.plot_count += 1  # Incrementa solo cuando agregas una simulación
 
-        f_max = self.driver.f_max_ka(ka_max=1.0)  # Limitar a ka ≤ 1
-        frequencies = np.logspace(np.log10(5), np.log10(f_max), 1000)
-        Z_values = np.array([self.driver.impedance(f) for f in frequencies])
-        Z_magnitude = np.abs(Z_values)
-        Z_phase = np.angle(Z_values, deg=True)
-        SPL_total = np.array([self.driver.spl_total(f) for f in frequencies])
-        SPL_phase = np.array([self.driver.spl_phase(f) for f in frequencies])
-        displacements = np.array([self.driver.displacement(f) for f in frequencies])
-        displacements_mm = displacements * 1000
-        velocities = np.array([abs(self.driver.velocity(f)) for f in frequencies])
-        P_real = np.array([self.driver.power_real(f) for f in frequencies])
-        P_reactiva = np.array([self.driver.power_reactive(f) for f in frequencies])
-        P_aparente = np.array([self.driver.power_apparent(f) for f in frequencies])
-        P_ac = np.array([self.driver.power_ac(f) for f in frequencies])
-        group_delay_vals = -self.driver.group_delay_array(frequencies)
-        Fs = abs(self.driver.Fs) if self.driver.Fs != 0 else 1e-6                       # Evita división por cero
-        T0 = 1 / Fs
-        t_array = np.linspace(0, 5 * T0, 1000)                                         # 10 ciclos de la frecuencia fundamental
-        step_t, step_x, step_v, step_a = self.driver.step_response(t_array)
-        efficiency_val = self.driver.efficiency(frequencies)
-        excursion_mm, excursion_ratio, excursion_peak, cone_force_array, cone_force_peak = self.driver.excursion(frequencies)
-        xmax_mm = self.driver.Xmax
-
-        nombre_driver = self.name_var.get().strip() or f"Simulación {self.plot_count+1}"
-        self.sim_names.append(nombre_driver)
-
         # Solo crea la figura y canvas la primera vez
         if self.fig is None or self.axs is None or self.canvas is None:
             lines, cursor = plot_all(
-                self.driver, frequencies, Z_magnitude, Z_phase, SPL_total, SPL_phase,
-                displacements_mm, velocities, P_real, P_reactiva, P_aparente, P_ac, group_delay_vals, step_t, step_x, step_v, 
-                step_a, efficiency_val, excursion_mm, excursion_ratio, excursion_peak, cone_force_array, cone_force_peak, xmax_mm, f_max,
+                record["driver"], **result,
                 fig=None, axs=None, linestyle=linestyle, label=nombre_driver,
                 show_legend=self.show_legends,
                 enable_cursor=self.enable_grid_cursor,
                 grid_cursor=self.grid_cursor
             )
             self.fig = plt.gcf()
-            self.axs = np.array(self.fig.axes)
+            self.axs = np.array(self.fig.axes[:9])                             # Solo el grid 3x3 (los twins los maneja plot_all)
             self.canvas = FigureCanvasTkAgg(self.fig, master=self.right_frame)
             self.canvas.get_tk_widget().pack(fill="both", expand=True)
             self.fig.canvas.mpl_connect("button_press_event", self.on_subplot_click)
+            self.lod = LineDecimator(self.fig)
             self.grid_cursor = cursor
         else:
             # Agrega nuevas líneas a los ejes existentes
             lines, cursor = plot_all(
-                self.driver, frequencies, Z_magnitude, Z_phase, SPL_total, SPL_phase,
-                displacements_mm, velocities, P_real, P_reactiva, P_aparente, P_ac, group_delay_vals, step_t, step_x, step_v, 
-                step_a, efficiency_val, excursion_mm, excursion_ratio, excursion_peak, cone_force_array, cone_force_peak, xmax_mm, f_max,
+                record["driver"], **result,
                 fig=self.fig, axs=self.axs, linestyle=linestyle, label=nombre_driver,
                 show_legend=self.show_legends,
                 enable_cursor=self.enable_grid_cursor,
@@ -445,6 +432,7 @@ class App:
             )
             self.grid_cursor = cursor
 
+        self.lod.refresh()
         self.canvas.draw()
 
         # Asegura que las leyendas estén ocultas o visibles según el estado del botón,
@@ -481,6 +469,22 @@ class App:
         self.checkboxes_container.update_idletasks()
         self.checkbox_canvas.configure(scrollregion=self.checkbox_canvas.bbox("all"))
 
+        return lines
+
+    def refine_plots(self, sweep, record, lines):
+        # Un nivel de refinamiento por callback de Tk: la ventana procesa eventos entre niveles.
+        def step():
+            try:
+                result = next(sweep)
+            except StopIteration:
+                return
+            self.store.update(record["key"], result)
+            update_series(lines, result)
+            self.lod.refresh()
+            self.canvas.draw_idle()
+            self.root.after(1, step)
+        self.root.after(1, step)
+
     def toggle_lines(self, idx):
         visible = self.check_vars[idx].get()
         for line in self.plot_lines[idx]:
@@ -517,7 +521,7 @@ class App:
 
             for line in orig_ax.get_lines():
                 target_ax.plot(
-                    line.get_xdata(), line.get_ydata(),
+                    *full_data(line),                                   # Resolución completa aunque el grid esté reducido (LOD)
                     color=line.get_color(),
                     linestyle=line.get_linestyle(),
                     label=line.get_label(),
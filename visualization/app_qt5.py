@@ -1,15 +1,25 @@
 import sys
+import functools
 import numpy as np
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QPushButton, QLabel, QLineEdit, QComboBox, QFormLayout, QCheckBox, QTextEdit, QFileDialog, QScrollArea, QGroupBox, QMessageBox
+    QPushButton, QLabel, QLineEdit, QComboBox, QFormLayout, QCheckBox, QTextEdit, QFileDialog, QScrollArea, QGroupBox, QMessageBox,
+    QProgressBar, QSlider, QSpinBox, QMenu
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
 
-from core.driver import Driver
-from visualization.plots import plot_all
+from core.simulation import simulate_design, simulate_bandpass, progressive_design, simulate_family
+from core.history import SimulationHistory
+from visualization.plots import (plot_all, SubplotView, LivePreview, LineDecimator, HoverCursor, FamilyOverlay,
+                                 toggle_legends_on_figure, update_series, lines_nbytes)
+from visualization.worker import SimulationRunner
+
+def vb_to_m3(vb):
+    # Vb del formulario en m³ (escalar o columna de un barrido): > 1 se toma como litros, ≤ 1 como m³.
+    vb = np.asarray(vb, dtype=float)
+    return np.where(vb > 1, vb / 1000, vb)
 
 class AppQt(QMainWindow):
     def __init__(self, params, units):
@@ -95,6 +105,85 @@ class AppQt(QMainWindow):
 
         left_layout.addLayout(btn_layout)
 
+        # --- Progreso de la simulación en segundo plano ---
+        status_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        status_layout.addWidget(self.progress_bar, 1)
+        self.elapsed_label = QLabel("")
+        status_layout.addWidget(self.elapsed_label)
+        left_layout.addLayout(status_layout)
+
+        self.runner = SimulationRunner(self)
+        self.runner.progress.connect(self.progress_bar.setValue)
+        self.runner.elapsed.connect(lambda s: self.elapsed_label.setText(f"{s:.1f} s"))
+        self.runner.partial.connect(self.on_simulation_partial)
+        self.runner.result.connect(self.on_simulation_result)
+        self.runner.error.connect(self.on_simulation_error)
+        # Al quedar libre el runner se completan las corridas que quedaron a baja resolución (ver refine_pending)
+        self.runner.busy.connect(lambda busy: busy or QTimer.singleShot(0, self.refine_pending))
+        self.closing = False
+
+        # --- Ajuste en vivo: un control deslizante sobre cualquier campo del driver o del recinto ---
+        live_group = QGroupBox("Ajuste en vivo")
+        live_layout = QHBoxLayout(live_group)
+        self.live_fields = dict(self.entries)
+        self.live_fields.update({"Vb [L]": self.vb_entry, "Área ducto [m²]": self.area_port_entry,
+                                 "Largo ducto [m]": self.length_port_entry})
+        self.live_field_combo = QComboBox()
+        self.live_field_combo.addItems(list(self.live_fields))
+        live_layout.addWidget(self.live_field_combo)
+        self.live_slider = QSlider(Qt.Horizontal)
+        self.live_slider.setRange(-100, 100)                            # Factor 2^(valor/100): de ×0.5 a ×2
+        live_layout.addWidget(self.live_slider, 1)
+        self.live_value_label = QLabel("")
+        live_layout.addWidget(self.live_value_label)
+        left_layout.addWidget(live_group)
+
+        self.live = None
+        self.live_base = None
+        self.live_timer = QTimer(self)                                  # Rebote: una vista previa por ráfaga de movimientos
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(15)
+        self.live_timer.timeout.connect(self.live_preview)
+        self.live_field_combo.currentTextChanged.connect(self.on_live_field_changed)
+        self.live_slider.valueChanged.connect(self.on_live_slider)
+        self.live_slider.sliderReleased.connect(self.on_live_released)
+        self.on_live_field_changed(self.live_field_combo.currentText())
+
+        # --- Barrido de parámetro: familia de curvas en una sola evaluación vectorizada ---
+        family_group = QGroupBox("Barrido de parámetro")
+        family_layout = QHBoxLayout(family_group)
+        self.family_field_combo = QComboBox()
+        self.family_field_combo.addItems(["Vb [L]", "Área ducto [m²]", "Largo ducto [m]"])
+        family_layout.addWidget(self.family_field_combo)
+        self.family_from_entry = QLineEdit()
+        self.family_to_entry = QLineEdit()
+        family_layout.addWidget(QLabel("de"))
+        family_layout.addWidget(self.family_from_entry)
+        family_layout.addWidget(QLabel("a"))
+        family_layout.addWidget(self.family_to_entry)
+        self.family_steps_spin = QSpinBox()
+        self.family_steps_spin.setRange(2, 64)
+        self.family_steps_spin.setValue(8)
+        family_layout.addWidget(self.family_steps_spin)
+        family_btn = QPushButton("Generar")
+        family_btn.clicked.connect(self.on_family_submit)
+        family_layout.addWidget(family_btn)
+        clear_family_btn = QPushButton("Quitar")
+        clear_family_btn.clicked.connect(self.clear_family)
+        family_layout.addWidget(clear_family_btn)
+        left_layout.addWidget(family_group)
+
+        self.family = None
+        self.family_runner = SimulationRunner(self)
+        self.family_runner.progress.connect(self.progress_bar.setValue)
+        self.family_runner.result.connect(self.on_family_result)
+        self.family_runner.error.connect(self.on_simulation_error)
+        self.family_field_combo.currentTextChanged.connect(self.on_family_field_changed)
+        self.on_family_field_changed(self.family_field_combo.currentText())
+
         # --- Resumen ---
         self.resumen_text = QTextEdit()
         self.resumen_text.setReadOnly(True)
@@ -107,6 +196,20 @@ class AppQt(QMainWindow):
         self.checkboxes = []
         self.check_vars = []
 
+        # --- Memoria del historial: las corridas menos vistas se liberan y se recalculan al mostrarlas ---
+        memory_layout = QHBoxLayout()
+        self.memory_label = QLabel("")
+        memory_layout.addWidget(self.memory_label, 1)
+        memory_layout.addWidget(QLabel("Límite [MB]:"))
+        self.budget_spin = QSpinBox()
+        self.budget_spin.setRange(1, 4096)
+        self.budget_spin.setValue(64)
+        memory_layout.addWidget(self.budget_spin)
+        left_layout.addLayout(memory_layout)
+        self.store = SimulationHistory(budget_bytes=64 * 2**20, on_evict=self.on_run_evicted,   # sim_key → curvas calculadas
+                                       artist_nbytes=self.run_artist_nbytes)
+        self.budget_spin.valueChanged.connect(self.on_budget_changed)
+
         # --- Panel derecho: pestañas de gráficas ---
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs, 5)
@@ -129,11 +232,15 @@ class AppQt(QMainWindow):
             tab_name = tab_names[i] if i < len(tab_names) else f"Gráfica {i+1}"
             self.tabs.addTab(tab, tab_name)
             self.single_plot_tabs.append((tab, layout))
+        self.tab_views = {}                                             # índice de subplot → SubplotView
+        self.tabs.currentChanged.connect(self.refresh_tab)
+        self.tabs.currentChanged.connect(lambda index: self.update_memory_label())   # Una pestaña nueva copia sus líneas
 
         # --- Estado de la figura ---
         self.fig = None
         self.axs = None
         self.canvas = None
+        self.lod = None                                                 # Reducción LOD de las líneas del grid
 
         # --- Filas de los campos de recinto ---
         self.vb_row = form_layout.rowCount()
@@ -183,7 +290,6 @@ class AppQt(QMainWindow):
         # Conectar la función y habilitar la funcionalidad
         self.enclosure_type_combo.currentIndexChanged.connect(update_enclosure_fields)
 
-        self.simulation_history = []
 
         # --- Campos adicionales para Bandpass Isobárico ---
         # Volúmenes
@@ -211,7 +317,16 @@ class AppQt(QMainWindow):
         # Inicializar la visibilidad de los campos
         update_enclosure_fields()
 
-    def on_submit(self):
+    def read_form(self, notify=True):
+        """
+        Lee los parámetros del formulario (actualiza user_params) y construye el recinto.
+
+        Args:
+            notify: Mostrar el aviso informativo del bandpass isobárico
+
+        Returns:
+            (enclosure_type, enclosure, radiation_model)
+        """
         # Leer parámetros
         for key, entry in self.entries.items():
             try:
@@ -244,7 +359,7 @@ class AppQt(QMainWindow):
             zrad = RadiationImpedance()
 
             # Convertir volumen de litros a metros cúbicos si es necesario
-            vb_m3 = vb_litros / 1000 if vb_litros > 1 else vb_litros  # Asume litros si es > 1
+            vb_m3 = float(vb_to_m3(vb_litros))                              # Asume litros si es > 1
 
             # Crear la caja bass-reflex con todos los parámetros requeridos
             enclosure = BassReflexBox(
@@ -290,21 +405,21 @@ class AppQt(QMainWindow):
             enclosure = BandpassIsobaricBox(params_bandpass)
             
             # Mostrar mensaje informativo
-            QMessageBox.information(self, "Bandpass Isobárico", 
-                                  "Bandpass Isobárico configurado correctamente.\n"
-                                  "Volúmenes configurados:\n"
-                                  f"- Cámara frontal: {self.vb_front_entry.text()} L\n"
-                                  f"- Cámara trasera: {self.vab_entry.text()} L\n"
-                                  f"- Frecuencia de sintonía: {self.fp_entry.text()} Hz")
+            if notify:
+                QMessageBox.information(self, "Bandpass Isobárico", 
+                                      "Bandpass Isobárico configurado correctamente.\n"
+                                      "Volúmenes configurados:\n"
+                                      f"- Cámara frontal: {self.vb_front_entry.text()} L\n"
+                                      f"- Cámara trasera: {self.vab_entry.text()} L\n"
+                                      f"- Frecuencia de sintonía: {self.fp_entry.text()} Hz")
         else:
             enclosure = None
 
-        radiation_model = self.radiation_model_combo.currentText()
-        nombre_driver = self.name_entry.text().strip() or f"Simulación {self.plot_count+1}"
-        self.sim_names.append(nombre_driver)
+        return enclosure_type, enclosure, self.radiation_model_combo.currentText()
 
-        # Crear driver
-        sim_key = (
+    def current_sim_key(self):
+        # Clave de la simulación descrita por el formulario (parámetros + recinto), tras read_form.
+        return (
             tuple(sorted(self.user_params.items())),
             self.enclosure_type_combo.currentText(),
             self.vb_entry.text(),
@@ -312,16 +427,98 @@ class AppQt(QMainWindow):
             self.length_port_entry.text(),
             self.radiation_model_combo.currentText()
         )
-        if sim_key in self.simulation_history:
+
+    def on_submit(self):
+        enclosure_type, enclosure, radiation_model = self.read_form()
+        nombre_driver = self.name_entry.text().strip() or f"Simulación {self.plot_count+1}"
+
+        sim_key = self.current_sim_key()
+        pending = self.runner.pending_context()
+        if sim_key in self.store and self.store.get(sim_key)["evicted"]:
+            self.restore_simulation(self.store.get(sim_key)["index"])   # Ya simulada pero liberada: se recalcula
+            return
+        if sim_key in self.store and self.store.get(sim_key)["provisional"]:
+            if pending is None or pending["key"] != sim_key:
+                self.refine_simulation(self.store.get(sim_key))         # Quedó a baja resolución: se completa
+            return
+        if sim_key in self.store or (pending is not None and pending["key"] == sim_key):
             QMessageBox.warning(self, "Simulación duplicada", "Ya existe una simulación con estos parámetros.")
             return
-        self.simulation_history.append(sim_key)
 
-        # Crear driver o sistema bandpass
+        # El cálculo (construcción del Driver y todos los barridos) corre en segundo plano;
+        # un nuevo envío cancela el trabajo anterior que aún no terminó
+        context = {"key": sim_key, "name": nombre_driver, "params": dict(self.user_params), "bandpass": None,
+                   "recompute": functools.partial(simulate_design, dict(self.user_params), enclosure, radiation_model, n=1025)}
+        self.progress_bar.setValue(0)
         if enclosure_type == "Bandpass Isobárico":
+            context["bandpass"] = enclosure
+            context["recompute"] = lambda params=dict(self.user_params): (None, simulate_bandpass(enclosure, params))
+            self.runner.submit(simulate_bandpass, enclosure, dict(self.user_params), context=context)
+        else:
+            # Barrido progresivo: 65 puntos se dibujan de inmediato y se refinan a 257 y 1025
+            self.runner.submit(progressive_design, dict(self.user_params), enclosure, radiation_model, context=context)
+
+    def on_simulation_partial(self, context, value):
+        # Resultado parcial del barrido progresivo: el primero crea la simulación, los siguientes refinan sus líneas.
+        # Hasta el resultado final el registro queda provisional: si el trabajo se reemplaza, se cancela o falla,
+        # refine_pending lo completa después con record["recompute"].
+        if context.get("index") is None:
+            record = self.add_simulation(context, value)
+            record["provisional"] = True
+            context["index"] = record["index"]
+            self.checkboxes[record["index"]].setText(f"{record['name']} (parcial)")
+            return
+        self.apply_refinement(context, value)
+
+    def on_simulation_result(self, context, value):
+        # Resultado final del trabajo vigente (ya aplicado si llegó como parciales).
+        if context.get("refine"):
+            self.apply_refinement(context, value)
+        elif context.get("index") is None:
+            self.add_simulation(context, value)
+            return
+        record = self.store.get(context["key"])
+        record["provisional"] = False
+        if not record["evicted"]:
+            self.checkboxes[record["index"]].setText(record["name"])
+
+    def apply_refinement(self, context, value):
+        # Reemplaza las curvas de una corrida ya dibujada por las de mayor resolución.
+        if self.store.get(context["key"])["evicted"]:
+            return                                                      # Liberada mientras tanto: se recalcula al mostrarla
+        self.driver, result = value
+        self.store.update(context["key"], result, self.driver)
+        update_series(self.plot_lines[context["index"]], result)
+        self.lod.refresh()
+        self.canvas.draw_idle()
+        self.refresh_tab(self.tabs.currentIndex())
+        self.check_budget(keep=context["key"])
+
+    def refine_simulation(self, record):
+        # Recalcula a resolución completa una corrida provisional (sus líneas y checkbox se conservan).
+        record["refine_failed"] = False
+        context = {"key": record["key"], "name": record["name"], "index": record["index"], "refine": True}
+        self.runner.submit(record["recompute"], context=context)
+
+    def refine_pending(self):
+        # Con el runner libre, completa la primera corrida provisional (las liberadas se recalculan completas al mostrarse).
+        if self.closing or self.runner.is_busy():
+            return
+        for record in self.store:
+            if record["provisional"] and not record["evicted"] and not record.get("refine_failed"):
+                self.refine_simulation(record)
+                return
+
+    def add_simulation(self, context, value):
+        # Registra una simulación nueva y la dibuja, ya en el hilo principal.
+        self.sim_names.append(context["name"])
+
+        if context["bandpass"] is not None:
             # Para bandpass isobárico, usamos su propia simulación
-            self.bandpass_system = enclosure
+            self.bandpass_system = context["bandpass"]
             self.driver = None  # No usar Driver normal
+            result = value
+            params = context["params"]
             # Crear resumen personalizado para bandpass
             self.resumen_text.setPlainText(f"""Sistema Bandpass Isobárico configurado:
 
@@ -340,22 +537,36 @@ Inductancia de bobina: {self.lvc_entry.text()} mH
 Masa del diafragma: {self.mmd_entry.text()} kg
 
 === Parámetros del Driver (desde campos principales) ===
-Re = {self.user_params['Re']} Ω
-Qes = {self.user_params['Qes']}
-Qms = {self.user_params['Qms']}
-Fs = {self.user_params['Fs']} Hz
-Bl = {self.user_params['Bl']} N/A
-Sd = {self.user_params['Sd']} m²
+Re = {params['Re']} Ω
+Qes = {params['Qes']}
+Qms = {params['Qms']}
+Fs = {params['Fs']} Hz
+Bl = {params['Bl']} N/A
+Sd = {params['Sd']} m²
 
 Nota: Los parámetros del driver se toman de los campos principales,
 no hay duplicación de parámetros.""")
         else:
             # Para otros tipos, usar Driver normal
-            self.driver = Driver(self.user_params, enclosure=enclosure, radiation_model=radiation_model)
+            self.driver, result = value
             self.bandpass_system = None
             self.update_resumen()
-            
-        self.update_plots()
+
+        linestyles = ["-", "--", "-.", ":"]
+        record = self.store.add(context["key"], context["name"], context["params"], result,
+                                driver=self.driver, recompute=context["recompute"], bandpass=context["bandpass"],
+                                linestyle=linestyles[self.plot_count % len(linestyles)], provisional=False)
+        self.plot_count += 1
+        self.update_plots(record)
+        return record
+
+    def on_simulation_error(self, context, message):
+        self.progress_bar.setValue(0)
+        record = self.store.get(context["key"]) if context.get("index") is not None else None
+        if record is not None and record["provisional"]:
+            record["refine_failed"] = True                             # No se reintenta solo; volver a simular lo reintenta
+            self.checkboxes[record["index"]].setText(f"{record['name']} (incompleta)")
+        QMessageBox.critical(self, "Error de simulación", f"No se pudo simular '{context['name']}':\n{message.strip().splitlines()[-1]}")
 
     def update_resumen(self):
         if hasattr(self, 'driver') and self.driver is not None:
@@ -364,19 +575,21 @@ no hay duplicación de parámetros.""")
         # Para bandpass, el resumen ya se configuró en on_submit()
 
     def export_txt(self):
-        if not hasattr(self, "driver") or self.driver is None:
+        # Exporta la última simulación desde el almacén: resumen (.txt) o curvas calculadas (.csv).
+        record = self.store.last()
+        if record is None:
             return
-        nombre = self.name_entry.text().strip() or "driver"
-        resumen = self.driver.resumen_parametros()
-        params_str = "Parámetros del driver:\n"
-        for k, v in self.user_params.items():
-            unidad = self.units.get(k, "")
-            params_str += f"{k}: {v} {unidad}\n"
-        contenido = f"Nombre: {nombre}\n\n{params_str}\nResumen:\n{resumen}"
-        file_path, _ = QFileDialog.getSaveFileName(self, "Guardar resumen", f"{nombre}_resumen.txt", "Archivo de texto (*.txt)")
-        if file_path:
+        nombre = record["name"] or "driver"
+        file_path, selected = QFileDialog.getSaveFileName(
+            self, "Guardar resumen", f"{nombre}_resumen.txt",
+            "Archivo de texto (*.txt);;Curvas CSV (*.csv)")
+        if not file_path:
+            return
+        if file_path.lower().endswith(".csv") or selected.startswith("Curvas"):
+            self.store.write_csv(record["key"], file_path)
+        else:
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(contenido)
+                f.write(self.store.summary(record["key"], self.units))
 
     def toggle_legends(self):
         self.show_legends = not self.show_legends
@@ -387,162 +600,36 @@ no hay duplicación de parámetros.""")
                 if legend:
                     legend.set_visible(self.show_legends)
             if self.canvas is not None:
-                self.canvas.draw()
+                self.canvas.draw_idle()
         # También actualiza la ventana maximizada si existe
         import matplotlib._pylab_helpers
         try:
-            from visualization.plots import toggle_legends_on_figure
             for manager in matplotlib._pylab_helpers.Gcf.get_all_fig_managers():
                 fig = manager.canvas.figure
                 toggle_legends_on_figure(fig, self.show_legends)
         except Exception:
             pass
 
-        # También actualiza las leyendas en las pestañas individuales si quieres:
-        for i, (tab, layout) in enumerate(self.single_plot_tabs):
-            for j in range(layout.count()):
-                widget = layout.itemAt(j).widget()
-                if hasattr(widget, "figure"):
-                    for ax in widget.figure.axes:
-                        legend = ax.get_legend()
-                        if legend:
-                            legend.set_visible(self.show_legends)
-                    widget.draw()
+        # También actualiza las leyendas en las pestañas individuales ya creadas
+        for view in self.tab_views.values():
+            toggle_legends_on_figure(view.fig, self.show_legends)
 
     def toggle_grid_cursor(self):
         self.enable_grid_cursor = not self.enable_grid_cursor
         
-        # Actualizar cursor en grid principal
-        if self.fig is not None and self.axs is not None:
-            if self.enable_grid_cursor:
-                # Activa el cursor grid en la figura principal
-                import mplcursors
-                if hasattr(self, "grid_cursor") and self.grid_cursor is not None:
-                    try:
-                        self.grid_cursor.remove()
-                    except Exception:
-                        pass
-                all_lines = []
-                for ax in self.axs:
-                    all_lines.extend(ax.get_lines())
-                    for other in ax.figure.axes:
-                        if other is not ax and getattr(other, "_sharex", None) is ax:
-                            all_lines.extend(other.get_lines())
-                if all_lines:
-                    self.grid_cursor = mplcursors.cursor(all_lines, hover=True)
-                    from visualization.plots import cursor_fmt
-                    self.grid_cursor.connect("add", cursor_fmt)
-            else:
-                # Desactiva el cursor grid
-                if hasattr(self, "grid_cursor") and self.grid_cursor is not None:
-                    try:
-                        self.grid_cursor.remove()
-                    except Exception:
-                        pass
-                    self.grid_cursor = None
-        
-        # Actualizar cursores en pestañas individuales
-        # (Se maneja automáticamente en update_plots cuando se recrean las pestañas)
-
-    def update_plots(self):
-        linestyles = ["-", "--", "-.", ":"]
-        linestyle = linestyles[self.plot_count % len(linestyles)]
-        nombre_driver = self.sim_names[-1]
-        self.plot_count += 1
-
-        if hasattr(self, 'bandpass_system') and self.bandpass_system is not None:
-            # Simulación para Bandpass Isobárico
-            # Calcular f_max basado en ka ≤ 1 usando los parámetros del driver
-            temp_params = {
-                'Re': self.user_params['Re'],
-                'Qes': self.user_params['Qes'], 
-                'Qms': self.user_params['Qms'],
-                'Fs': self.user_params['Fs'],
-                'Bl': self.user_params['Bl'],
-                'Sd': self.user_params['Sd'],
-                'Vas': 0.05,  # valor temporal
-                'Xmax': 7.5   # valor temporal
-            }
-            # Calcular Cms desde Vas temporal
-            rho0, c = 1.2, 344
-            Vas_m3 = temp_params["Vas"] / 1000
-            temp_params["Cms"] = Vas_m3 / (rho0 * c**2 * temp_params["Sd"]**2)
-            temp_driver = Driver(temp_params)
-            f_max_bandpass = temp_driver.f_max_ka(ka_max=1.0)  # Limitar a ka ≤ 1
-            
-            frequencies = np.logspace(np.log10(5), np.log10(f_max_bandpass), 1000)
-            results = self.bandpass_system.simulate(frequencies)
-            
-            # Usar los resultados del sistema bandpass
-            Z_magnitude = results["Zt"]
-            Z_phase = results["ZtΦ"]
-            SPL_total = results["SPL"]
-            SPL_phase = np.zeros_like(SPL_total)  # Bandpass no calcula fase SPL
-            displacements_mm = results["DEZ"]  # DEZ está en mm
-            velocities = np.ones_like(frequencies)  # Placeholder
-            P_real = np.ones_like(frequencies)  # Placeholder
-            P_reactiva = np.ones_like(frequencies)  # Placeholder
-            P_aparente = np.ones_like(frequencies)  # Placeholder
-            P_ac = np.ones_like(frequencies)  # Placeholder
-            group_delay_vals = results["groupdelay"]
-            
-            # Datos para step response (placeholder)
-            t_array = np.linspace(0, 0.1, 1000)
-            step_t = t_array
-            step_x = np.zeros_like(t_array)
-            step_v = np.zeros_like(t_array)
-            step_a = np.zeros_like(t_array)
-            
-            efficiency_val = np.ones_like(frequencies)  # Placeholder
-            excursion_mm = displacements_mm
-            excursion_ratio = np.ones_like(frequencies)
-            excursion_peak = np.max(excursion_mm)
-            cone_force_array = np.ones_like(frequencies)
-            cone_force_peak = 1.0
-            xmax_mm = 7.5  # Usar valor por defecto
-            f_max = f_max_bandpass  # Usar el límite calculado con ka ≤ 1
-            
-            # Para bandpass no hay SPL separado
-            SPL_cone = None
-            SPL_port = None
-            
-        else:
-            # Simulación normal con Driver
-            if self.driver is None:
-                return
-                
-            f_max = self.driver.f_max_ka(ka_max=1.0)  # Limitar a ka ≤ 1
-            frequencies = np.logspace(np.log10(5), np.log10(f_max), 1000)
-            Z_values = np.array([self.driver.impedance(f) for f in frequencies])
-            Z_magnitude = np.abs(Z_values)
-            Z_phase = np.angle(Z_values, deg=True)
-            SPL_total = np.array([self.driver.spl_total(f) for f in frequencies])
-            SPL_phase = np.array([self.driver.spl_phase(f) for f in frequencies])
-            
-            # Calcular SPL separado solo para bass-reflex
-            SPL_cone = None
-            SPL_port = None
-            if (hasattr(self.driver, 'enclosure') and self.driver.enclosure is not None and
-                hasattr(self.driver.enclosure, '__class__') and 'BassReflex' in self.driver.enclosure.__class__.__name__):
-                SPL_cone = np.array([self.driver.spl_bassreflex_cone(f) for f in frequencies])
-                SPL_port = np.array([self.driver.spl_bassreflex_port(f) for f in frequencies])
-            
-            displacements = np.array([self.driver.displacement(f) for f in frequencies])
-            displacements_mm = displacements * 1000
-            velocities = np.array([abs(self.driver.velocity(f)) for f in frequencies])
-            P_real = np.array([self.driver.power_real(f) for f in frequencies])
-            P_reactiva = np.array([self.driver.power_reactive(f) for f in frequencies])
-            P_aparente = np.array([self.driver.power_apparent(f) for f in frequencies])
-            P_ac = np.array([self.driver.power_ac(f) for f in frequencies])
-            group_delay_vals = -self.driver.group_delay_array(frequencies)
-            Fs = abs(self.driver.Fs) if self.driver.Fs != 0 else 1e-6
-            T0 = 1 / Fs
-            t_array = np.linspace(0, 5 * T0, 1000)
-            step_t, step_x, step_v, step_a = self.driver.step_response(t_array)
-            efficiency_val = self.driver.efficiency(frequencies)
-            excursion_mm, excursion_ratio, excursion_peak, cone_force_array, cone_force_peak = self.driver.excursion(frequencies)
-            xmax_mm = self.driver.Xmax
-
+        # Actualizar cursor en grid principal (un solo HoverCursor indexa todas las líneas y twins)
+        if self.fig is not None:
+            if self.enable_grid_cursor and self.grid_cursor is None:
+                self.grid_cursor = HoverCursor(self.fig)
+            elif not self.enable_grid_cursor and self.grid_cursor is not None:
+                self.grid_cursor.remove()
+                self.grid_cursor = None
+
+        # Actualizar cursores en pestañas individuales (la visible ahora, el resto al mostrarse)
+        self.refresh_tab(self.tabs.currentIndex())
+
+    def draw_simulation(self, record):
+        # Dibuja en el grid una simulación del historial (dict de curvas de core.simulation) y devuelve sus líneas.
         # --- Grid 3x3 ---
         # Mantén la figura y ejes entre simulaciones
         if self.fig is None or self.axs is None:
@@ -553,178 +640,318 @@ no hay duplicación de parámetros.""")
             axs = self.axs
 
         # Determinar qué driver usar para plot_all
-        if hasattr(self, 'bandpass_system') and self.bandpass_system is not None:
+        if record["driver"] is None:
             # Para bandpass, crear un objeto pseudo-driver para plot_all
             class PseudoDriver:
                 def __init__(self):
                     pass
             plot_driver = PseudoDriver()
         else:
-            plot_driver = self.driver
+            plot_driver = record["driver"]
 
         lines, cursor = plot_all(
-            plot_driver, frequencies, Z_magnitude, Z_phase, SPL_total, SPL_phase,
-            displacements_mm, velocities, P_real, P_reactiva, P_aparente, P_ac, group_delay_vals, step_t, step_x, step_v,
-            step_a, efficiency_val, excursion_mm, excursion_ratio, excursion_peak, cone_force_array, cone_force_peak, xmax_mm, f_max,
-            fig=fig, axs=axs, linestyle=linestyle, label=nombre_driver,
+            plot_driver, **record["result"],
+            fig=fig, axs=axs, linestyle=record["linestyle"], label=record["name"],
             show_legend=self.show_legends,
             enable_cursor=self.enable_grid_cursor,
-            grid_cursor=self.grid_cursor,
-            SPL_cone=SPL_cone, SPL_port=SPL_port
+            grid_cursor=self.grid_cursor
         )
-        self.fig = plt.gcf()
-        self.axs = np.array(self.fig.axes)
-        if self.canvas is not None:
-            self.grid_layout.removeWidget(self.canvas)
-            self.canvas.setParent(None)
-        self.canvas = FigureCanvas(self.fig)
-        self.grid_layout.addWidget(self.canvas)
+        self.grid_cursor = cursor
+        if self.canvas is None:
+            # El canvas del grid se crea una sola vez; las simulaciones siguientes agregan líneas a los mismos ejes
+            self.fig = plt.gcf()
+            self.canvas = FigureCanvas(self.fig)
+            self.grid_layout.addWidget(self.canvas)
+            self.lod = LineDecimator(self.fig)
+        self.axs = np.array(self.fig.axes[:9])                                 # Solo el grid 3x3 (los twins los maneja plot_all)
+        self.lod.refresh()
+        self.canvas.draw_idle()
 
         # --- Pestañas individuales ---
-        for i, (tab, layout) in enumerate(self.single_plot_tabs):
-            # Verificar que el índice esté en rango
-            if not hasattr(self, 'fig') or self.fig is None or i >= len(self.fig.axes):
-                continue
-                
-            for j in reversed(range(layout.count())):
-                widget = layout.itemAt(j).widget()
-                if widget is not None:
-                    layout.removeWidget(widget)
-                    widget.setParent(None)
-            fig_single, ax_single = plt.subplots(figsize=(6, 4))
-            orig_ax = self.fig.axes[i]  # Ahora es seguro
-
-            # 1. Copia el eje principal
-            ax_single.set_xscale(orig_ax.get_xscale())
-            ax_single.set_yscale(orig_ax.get_yscale())
-            ax_single.set_xlim(orig_ax.get_xlim())
-            ax_single.set_ylim(orig_ax.get_ylim())
-            ax_single.set_ylabel(orig_ax.get_ylabel())
-            ax_single.set_xlabel(orig_ax.get_xlabel())
-            ax_single.set_title(orig_ax.get_title())
-            ax_single.tick_params(axis='y', labelcolor=orig_ax.yaxis.get_label().get_color())
-            # Copia formateadores y localizadores
-            ax_single.xaxis.set_major_formatter(orig_ax.xaxis.get_major_formatter())
-            ax_single.xaxis.set_major_locator(orig_ax.xaxis.get_major_locator())
-            ax_single.yaxis.set_major_formatter(orig_ax.yaxis.get_major_formatter())
-            ax_single.yaxis.set_major_locator(orig_ax.yaxis.get_major_locator())
-            for line in orig_ax.get_lines():
-                ax_single.plot(line.get_xdata(), line.get_ydata(),
-                               color=line.get_color(),
-                               linestyle=line.get_linestyle(),
-                               label=line.get_label(),
-                               visible=line.get_visible())
-            if len(orig_ax.get_lines()) > 0:
-                ax_single.legend(fontsize=8, loc="upper right")
-            ax_single.grid(True, which="both")
-
-            # 2. Copia SOLO los twins que son hijos de este subplot (por índice)
-            twins = []
-            for other_ax in self.fig.axes:
-                if other_ax is orig_ax:
-                    continue
-                if hasattr(other_ax, "spines") and "right" in other_ax.spines:
-                    if np.allclose(other_ax.get_position().bounds, orig_ax.get_position().bounds):
-                        twins.append(other_ax)
-            
-            # Lista para almacenar todas las líneas para la leyenda combinada
-            all_legend_lines = []
-            all_legend_labels = []
-            
-            # Agregar líneas del eje principal
-            for line in orig_ax.get_lines():
-                if line.get_label() and not line.get_label().startswith('_'):
-                    all_legend_lines.append(line)
-                    all_legend_labels.append(line.get_label())
-            
-            for idx, orig_twin in enumerate(twins):
-                twin = ax_single.twinx()
-                orig_pos = orig_twin.spines["right"].get_position()
-                if orig_pos != ('outward', 0.0):
-                    twin.spines["right"].set_position(orig_pos)
-                    twin.set_frame_on(True)
-                    twin.patch.set_visible(False)
-                twin.set_xscale(orig_twin.get_xscale())
-                twin.set_yscale(orig_twin.get_yscale())
-                twin.set_xlim(orig_twin.get_xlim())
-                twin.set_ylim(orig_twin.get_ylim())
-                twin.set_ylabel(orig_twin.get_ylabel())
-                twin.tick_params(axis='y', labelcolor=orig_twin.yaxis.get_label().get_color())
-                
-                # Copiar líneas del twin y agregarlas a la leyenda combinada
-                for line in orig_twin.get_lines():
-                    twin_line = twin.plot(line.get_xdata(), line.get_ydata(),
-                              color=line.get_color(),
-                              linestyle=line.get_linestyle(),
-                              label=line.get_label(),
-                              visible=line.get_visible())[0]
-                    
-                    # Agregar a la leyenda combinada si tiene etiqueta válida
-                    if line.get_label() and not line.get_label().startswith('_'):
-                        all_legend_lines.append(twin_line)
-                        all_legend_labels.append(line.get_label())
-                
-                # --- DESACTIVA la grilla en los twins ---
-                twin.grid(False)
-                twin.yaxis.grid(False, which='both')
-                twin.xaxis.grid(False, which='both')
-                for gridline in twin.get_ygridlines() + twin.get_xgridlines():
-                    gridline.set_visible(False)
-
-            # Crear leyenda combinada con todas las líneas
-            if all_legend_lines:
-                ax_single.legend(all_legend_lines, all_legend_labels, fontsize=8, loc="best")
-            elif len(orig_ax.get_lines()) > 0:
-                ax_single.legend(fontsize=8, loc="best")
-
-            canvas_single = FigureCanvas(fig_single)
-            layout.addWidget(canvas_single)
-            fig_single.tight_layout()
-            
-            # --- Cursor grid en pestañas individuales ---
-            if self.enable_grid_cursor:
-                import mplcursors
-                from visualization.plots import cursor_fmt
-                all_lines_tab = []
-                for ax_tab in fig_single.axes:
-                    all_lines_tab.extend(ax_tab.get_lines())
-                if all_lines_tab:  # Solo crear cursor si hay líneas
-                    cursor_tab = mplcursors.cursor(all_lines_tab, hover=True)
-                    cursor_tab.connect("add", cursor_fmt)
-                    # Almacenar referencia para evitar garbage collection
-                    canvas_single._cursor_tab = cursor_tab
-            
-            # --- Doble clic para maximizar ---
-            def on_double_click(event, orig_ax=orig_ax):
-                if event.dblclick:
-                    from visualization.plots import maximize_subplot
-                    maximize_subplot(orig_ax, event)
-            canvas_single.mpl_connect("button_press_event", on_double_click)
-            
-            canvas_single.draw()  # MOVER EL DRAW DESPUÉS DEL CURSOR
-            
-            # Asegurar que el cursor funcione después del draw
-            if self.enable_grid_cursor and hasattr(canvas_single, '_cursor_tab'):
-                canvas_single._cursor_tab.enabled = True
-            
-            plt.close(fig_single)
+        # Se sincronizan al mostrarse (render diferido): solo la visible se actualiza ahora
+        self.refresh_tab(self.tabs.currentIndex())
+        return lines
+
+    def update_plots(self, record):
+        # Agrega al grid y a los checkboxes una simulación recién guardada en el historial.
+        lines = self.draw_simulation(record)
 
         # --- Checkboxes ---
         # Solo agrega el nuevo checkbox, no borres los anteriores
         idx = len(self.plot_lines)
-        cb = QCheckBox(nombre_driver)
+        cb = QCheckBox(record["name"])
         cb.setChecked(True)
         cb.stateChanged.connect(lambda state, idx=idx: self.toggle_lines(idx))
+        cb.setContextMenuPolicy(Qt.CustomContextMenu)                   # Fijar / liberar / recalcular
+        cb.customContextMenuRequested.connect(lambda pos, idx=idx: self.show_run_menu(idx, pos))
         self.checkbox_layout.addWidget(cb)
         self.checkboxes.append(cb)
         self.check_vars.append(cb)
         self.plot_lines.append(lines)
+        self.check_budget(keep=record["key"])                          # Ahora también cuentan sus líneas
+
+    # -------------------------------
+    # Historial acotado en memoria
+    # -------------------------------
+
+    def on_run_evicted(self, record):
+        # El historial liberó los arreglos de una corrida: se sueltan sus líneas (y sus copias en las pestañas).
+        idx = record["index"]
+        if idx >= len(self.plot_lines):
+            return
+        for line in self.plot_lines[idx]:
+            line.remove()
+        self.plot_lines[idx] = []
+        for view in self.tab_views.values():
+            view.prune()                                                # También en las pestañas aún no visitadas
+        cb = self.checkboxes[idx]
+        cb.blockSignals(True)
+        cb.setChecked(False)
+        cb.blockSignals(False)
+        cb.setText(f"{record['name']} (liberada)")
+        self.canvas.draw_idle()
+        self.refresh_tab(self.tabs.currentIndex())
+
+    def restore_simulation(self, idx):
+        # Recalcula una corrida liberada desde sus parámetros y vuelve a dibujarla en su lugar.
+        record = self.store.at(idx)
+        if record["evicted"]:
+            self.store.recompute(record["key"])
+            record["provisional"] = False                               # recompute entrega la resolución completa
+        if not self.plot_lines[idx]:
+            self.plot_lines[idx] = self.draw_simulation(record)
+        cb = self.checkboxes[idx]
+        cb.blockSignals(True)
+        cb.setChecked(True)
+        cb.blockSignals(False)
+        cb.setText(record["name"])
+        self.check_budget(keep=record["key"])
+
+    def show_run_menu(self, idx, pos):
+        record = self.store.at(idx)
+        menu = QMenu(self)
+        pin_action = menu.addAction("Soltar" if record["pinned"] else "Fijar en memoria")
+        evict_action = menu.addAction("Liberar memoria")
+        evict_action.setEnabled(not record["evicted"] and not record["pinned"])
+        recompute_action = menu.addAction("Recalcular")
+        recompute_action.setEnabled(record["evicted"])
+        action = menu.exec_(self.checkboxes[idx].mapToGlobal(pos))
+        if action is pin_action:
+            self.store.pin(record["key"], not record["pinned"])        # Fijar una corrida liberada la recalcula
+            if record["pinned"]:
+                self.restore_simulation(idx)
+        elif action is evict_action:
+            self.store.evict(record["key"])
+        elif action is recompute_action:
+            self.restore_simulation(idx)
+        self.update_memory_label()
+
+    def on_budget_changed(self, megabytes):
+        self.store.set_budget(megabytes * 2**20)
+        self.update_memory_label()
+
+    def run_artist_nbytes(self, record):
+        # Bytes de las líneas de una corrida fuera del historial: grid (datos mostrados y caché LOD) y copias de las pestañas.
+        idx = record.get("index")
+        if idx is None or idx >= len(self.plot_lines) or not self.plot_lines[idx]:
+            return 0
+        lines = list(self.plot_lines[idx])
+        for view in self.tab_views.values():
+            lines += [view.lines[line] for line in self.plot_lines[idx] if line in view.lines]
+        stored = record["result"].values() if record["result"] is not None else ()
+        return lines_nbytes(lines, exclude=stored)                     # Los arreglos compartidos con el historial no se repiten
+
+    def check_budget(self, keep=None):
+        # Aplica el límite con las líneas ya dibujadas (recién entonces cuentan) y actualiza la etiqueta.
+        self.store.enforce_budget(keep=keep)
+        self.update_memory_label()
+
+    def update_memory_label(self):
+        # Memoria del historial: curvas guardadas + datos de sus líneas (grid, caché LOD y pestañas); por corrida en el tooltip.
+        report = self.store.memory_report()
+        for cb, (name, nbytes, pinned, evicted) in zip(self.checkboxes, report):
+            state = "liberada" if evicted else f"{nbytes / 1024:.0f} kB (curvas + líneas)"
+            cb.setToolTip(state + (" · fijada" if pinned else ""))
+        freed = sum(1 for *_, evicted in report if evicted)
+        self.memory_label.setText(f"Memoria (curvas + líneas): {self.store.total_nbytes() / 2**20:.2f} / "
+                                  f"{self.store.budget_bytes / 2**20:.3g} MB"
+                                  + (f" · {freed} liberadas" if freed else ""))
+
+    # -------------------------------
+    # Ajuste en vivo
+    # -------------------------------
+
+    def on_live_field_changed(self, name):
+        # El control parte del valor actual del campo elegido.
+        try:
+            self.live_base = float(self.live_fields[name].text())
+        except ValueError:
+            self.live_base = float(self.params.get(name, 1.0))
+        self.live_slider.blockSignals(True)
+        self.live_slider.setValue(0)
+        self.live_slider.blockSignals(False)
+        self.live_value_label.setText(f"{self.live_base:.4g}")
+
+    def on_live_slider(self, value):
+        new_value = self.live_base * 2 ** (value / 100)
+        self.live_fields[self.live_field_combo.currentText()].setText(f"{new_value:.4g}")
+        self.live_value_label.setText(f"{new_value:.4g}")
+        self.live_timer.start()                                         # Reinicia el rebote
+
+    def live_preview(self):
+        # Barrido grueso de 200 puntos en el hilo principal (pocos ms) y actualización por blitting.
+        if self.fig is None:
+            return
+        enclosure_type, enclosure, radiation_model = self.read_form(notify=False)
+        if enclosure_type == "Bandpass Isobárico":
+            return
+        try:
+            _, result = simulate_design(dict(self.user_params), enclosure, radiation_model, n=200, n_time=200)
+        except Exception:
+            return                                                      # Valores intermedios inválidos: se ignora el cuadro
+        if self.live is None:
+            self.live = LivePreview(self.fig, self.fig.axes[:9])
+        self.live.update(result)
+
+    def on_live_released(self):
+        # Al soltar el control la vista previa se descarta y el diseño elegido entra como corrida normal
+        # (historial, checkbox, exportación y recálculo), con el mismo barrido progresivo que "Simular".
+        self.live_timer.stop()
+        if self.live is not None:
+            self.live.remove()
+            self.live = None
+        if self.fig is None:
+            self.on_submit()
+            return
+        enclosure_type, _, _ = self.read_form(notify=False)
+        if enclosure_type == "Bandpass Isobárico":
+            return
+        record = self.store.get(self.current_sim_key())
+        if record is not None and not record["evicted"] and not record["provisional"]:
+            return                                                      # Ese diseño ya está en el grid
+        self.on_submit()
+
+    # -------------------------------
+    # Barrido de parámetro (familia de curvas)
+    # -------------------------------
+
+    def on_family_field_changed(self, name):
+        # Rango por defecto: ±30 % del valor actual del campo.
+        try:
+            base = float(self.live_fields[name].text())
+        except ValueError:
+            return
+        self.family_from_entry.setText(f"{base * 0.7:.4g}")
+        self.family_to_entry.setText(f"{base * 1.3:.4g}")
+
+    def family_enclosure(self, name, values):
+        """
+        Recinto del formulario con el parámetro name barrido como columna (m, 1) para simulate_family.
+
+        Returns:
+            (recinto, modelo de radiación) o None si el recinto actual no tiene ese parámetro
+        """
+        enclosure_type, enclosure, radiation_model = self.read_form(notify=False)
+        column = np.asarray(values, dtype=float)[:, None]
+        if enclosure_type == "Caja Sellada" and name == "Vb [L]":
+            from core.sealed import SealedBox
+            return SealedBox(column), radiation_model
+        if enclosure_type == "Bass-reflex":
+            from core.bassreflex import BassReflexBox
+            spec = {"Vb_m3": enclosure.Vb_m3, "area_port": enclosure.area_port, "length_port": enclosure.length_port}
+            key = {"Vb [L]": "Vb_m3", "Área ducto [m²]": "area_port", "Largo ducto [m]": "length_port"}[name]
+            spec[key] = vb_to_m3(column) if key == "Vb_m3" else column     # Misma conversión que read_form
+            return BassReflexBox(rho0=enclosure.rho0, c=enclosure.c, zrad=enclosure.zrad, **spec), radiation_model
+        return None
+
+    def on_family_submit(self):
+        if self.fig is None:
+            QMessageBox.information(self, "Barrido de parámetro", "Primero simula un diseño para crear el grid.")
+            return
+        name = self.family_field_combo.currentText()
+        try:
+            values = np.linspace(float(self.family_from_entry.text()), float(self.family_to_entry.text()),
+                                 self.family_steps_spin.value())
+        except ValueError:
+            QMessageBox.warning(self, "Barrido de parámetro", "El rango del barrido no es válido.")
+            return
+        spec = self.family_enclosure(name, values)
+        if spec is None:
+            QMessageBox.information(self, "Barrido de parámetro",
+                                    f"'{name}' no se puede barrer con el recinto {self.enclosure_type_combo.currentText()}.")
+            return
+        enclosure, radiation_model = spec
+        self.progress_bar.setValue(0)
+        self.family_runner.submit(simulate_family, dict(self.user_params), enclosure, values, radiation_model,
+                                  context={"name": name})
+
+    def on_family_result(self, context, family):
+        # Una familia a la vez: la nueva reemplaza a la anterior.
+        if self.family is not None:
+            self.family.remove()
+        self.family = FamilyOverlay(self.fig, self.fig.axes[:9], family, label=context["name"])
+
+    def clear_family(self):
+        if self.family is not None:
+            self.family.remove()
+            self.family = None
+
+    def closeEvent(self, event):
+        self.closing = True
+        self.runner.cancel()                                            # No entregar resultados a una ventana cerrada
+        self.family_runner.cancel()
+        super().closeEvent(event)
+
+    def refresh_tab(self, index):
+        """
+        Sincroniza la pestaña individual index (1..9) con su subplot del grid.
+
+        La figura de cada pestaña se crea la primera vez que se muestra (SubplotView) y luego solo
+        recibe las líneas nuevas; la pestaña 0 es el grid y no requiere trabajo.
+        """
+        if index <= 0 or self.fig is None or index - 1 >= len(self.fig.axes):
+            return
+        i = index - 1
+        view = self.tab_views.get(i)
+        if view is None:
+            tab, layout = self.single_plot_tabs[i]
+            view = SubplotView(self.fig.axes[i])
+            view.canvas = FigureCanvas(view.fig)
+            view.cursor = None
+            layout.addWidget(view.canvas)
+
+            # --- Doble clic para maximizar ---
+            def on_double_click(event, orig_ax=self.fig.axes[i]):
+                if event.dblclick:
+                    from visualization.plots import maximize_subplot
+                    maximize_subplot(orig_ax, event)
+            view.canvas.mpl_connect("button_press_event", on_double_click)
+            self.tab_views[i] = view
+
+        added = view.sync(self.show_legends)
+        if added:
+            view.fig.tight_layout()
+
+        # --- Cursor grid en pestañas individuales ---
+        if self.enable_grid_cursor and view.cursor is None:
+            view.cursor = HoverCursor(view.fig)                         # Se reindexa solo tras cada dibujo
+        elif not self.enable_grid_cursor and view.cursor is not None:
+            view.cursor.remove()
+            view.cursor = None
+        view.canvas.draw_idle()
 
     def toggle_lines(self, idx):
         visible = self.check_vars[idx].isChecked()
+        record = self.store.at(idx)
+        if visible and record["evicted"]:
+            self.restore_simulation(idx)                                # Corrida liberada: se recalcula al mostrarla
+            return
+        if visible:
+            self.store.touch(record["key"])
         for line in self.plot_lines[idx]:
             line.set_visible(visible)
-        self.canvas.draw()
+        self.canvas.draw_idle()
+        self.refresh_tab(self.tabs.currentIndex())
 
 # --- MAIN ---
 if __name__ == "__main__":
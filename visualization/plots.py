@@ -10,6 +10,7 @@ from matplotlib.ticker import ScalarFormatter
 from matplotlib.ticker import FuncFormatter
 import matplotlib
 import matplotlib.offsetbox
+import weakref                                                          # Importa weakref para la caché de datos completos (LOD)
 
 #====================================================================================================================================
 #====================================================================================================================================
@@ -385,47 +386,15 @@ def plot_all(
 
     if enable_cursor:
         clean_annotations(fig)
-        all_lines = []
-        for ax in axs:
-            all_lines.extend(ax.get_lines())
-            for other in ax.figure.axes:
-                if other is not ax and getattr(other, "_sharex", None) is ax:
-                    all_lines.extend(other.get_lines())
-        import mplcursors
-        if grid_cursor is not None:
-            try:
-                grid_cursor.remove()
-            except Exception:
-                pass
-
-        cursor = mplcursors.cursor(all_lines, hover=True)
-
-        def cursor_fmt(sel):
-            y_unit = ""
-            x_unit = "Hz"
-            label = sel.artist.get_label() if hasattr(sel.artist, "get_label") else ""
-            x_label = sel.target[0]
-            y = sel.target[1]
-            if "∠Z" in label or "Phase" in label or "Fase" in label:
-                y_unit = "°"
-            elif "|Z|" in label:
-                y_unit = "Ohm"
-            elif "SPL" in label:
-                y_unit = "dB"
-            elif "Desplazamiento" in label:
-                y_unit = "mm"
-            elif "Velocidad" in label:
-                y_unit = "m/s"
-            elif "Aceleración" in label:
-                y_unit = "m/s²"
-            elif "Excursión/Xmax" in label:
-                y_unit = "(ratio)"
-            elif "Excursión" in label:
-                y_unit = "mm"
-            elif "Potencia" in label or "P." in label:
-                y_unit = "W"
-            sel.annotation.set_text(f"X: {x_label:.2f} {x_unit}\nY: {y:.2f} {y_unit}")
-        cursor.connect("add", cursor_fmt)
+        if isinstance(grid_cursor, HoverCursor) and grid_cursor.fig is fig:
+            cursor = grid_cursor                                        # El índice se reconstruye solo en el próximo dibujo
+        else:
+            if grid_cursor is not None:
+                try:
+                    grid_cursor.remove()
+                except Exception:
+                    pass
+            cursor = HoverCursor(fig)
     else:
         if grid_cursor is not None:
             try:
@@ -557,7 +526,7 @@ def maximize_subplot(ax, event):
             
             # Copiar líneas del eje principal
             for line in ax_source.get_lines():
-                new_line = ax_max.plot(line.get_xdata(), line.get_ydata(),
+                new_line = ax_max.plot(*full_data(line),
                                       color=line.get_color(),
                                       linestyle=line.get_linestyle(),
                                       linewidth=line.get_linewidth(),
@@ -595,7 +564,7 @@ def maximize_subplot(ax, event):
                     twin_max.patch.set_visible(False)
                 
                 for line in twin_orig.get_lines():
-                    twin_line = twin_max.plot(line.get_xdata(), line.get_ydata(),
+                    twin_line = twin_max.plot(*full_data(line),
                                              color=line.get_color(),
                                              linestyle=line.get_linestyle(),
                                              linewidth=line.get_linewidth(),
@@ -632,31 +601,33 @@ def maximize_subplot(ax, event):
         maximize_subplot._windows = []
     maximize_subplot._windows.append(max_window)
 
-def cursor_fmt(sel):
-    y_unit = ""
-    x_unit = "Hz"
-    label = sel.artist.get_label() if hasattr(sel.artist, "get_label") else ""
-    x_label = sel.target[0]
-    y = sel.target[1]
+def cursor_units(label):
+    # Unidad del eje Y según la etiqueta de la línea (la usan cursor_fmt y HoverCursor).
     if "∠Z" in label or "Phase" in label or "Fase" in label:
-        y_unit = "°"
+        return "°"
     elif "|Z|" in label:
-        y_unit = "Ohm"
+        return "Ohm"
     elif "SPL" in label:
-        y_unit = "dB"
+        return "dB"
     elif "Desplazamiento" in label:
-        y_unit = "mm"
+        return "mm"
     elif "Velocidad" in label:
-        y_unit = "m/s"
+        return "m/s"
     elif "Aceleración" in label:
-        y_unit = "m/s²"
+        return "m/s²"
     elif "Excursión/Xmax" in label:
-        y_unit = "(ratio)"
+        return "(ratio)"
     elif "Excursión" in label:
-        y_unit = "mm"
+        return "mm"
     elif "Potencia" in label or "P." in label:
-        y_unit = "W"
-    sel.annotation.set_text(f"X: {x_label:.2f} {x_unit}\nY: {y:.2f} {y_unit}")
+        return "W"
+    return ""
+
+def cursor_fmt(sel):
+    label = sel.artist.get_label() if hasattr(sel.artist, "get_label") else ""
+    x_label = sel.target[0]
+    y = sel.target[1]
+    sel.annotation.set_text(f"X: {x_label:.2f} Hz\nY: {y:.2f} {cursor_units(label)}")
 
 def toggle_legends_on_figure(fig, show_legends):
     for ax in fig.axes:
@@ -665,6 +636,631 @@ def toggle_legends_on_figure(fig, show_legends):
             legend.set_visible(show_legends)
     fig.canvas.draw_idle()
 
+#====================================================================================================================================
+# -------------------------------
+# Vista individual de un subplot del grid (pestañas de la GUI)
+# -------------------------------
+
+def twin_axes_of(ax):
+    # Ejes gemelos de ax: los que ocupan exactamente la misma posición en la figura.
+    bounds = ax.get_position().bounds
+    return [other for other in ax.figure.axes
+            if other is not ax and "right" in other.spines and np.allclose(other.get_position().bounds, bounds)]
+
+class SubplotView:
+    """
+    Copia persistente de un subplot del grid (con sus twins) en una figura propia.
+
+    Las líneas se enlazan una vez con su línea de origen: sync() solo crea las de simulaciones nuevas
+    y actualiza las existentes con set_data / set_visible, sin reconstruir la figura.
+    """
+
+    def __init__(self, source_ax, fig=None):
+        from matplotlib.figure import Figure
+        self.source = source_ax
+        self.fig = fig or Figure(figsize=(6, 4))
+        self.ax = self.fig.add_subplot(111)
+        self.pairs = []                                                 # (eje origen, eje copia)
+        self.lines = {}                                                 # línea origen → línea copia
+        self._data = {}                                                 # línea origen → (x, y) ya copiados
+        self._copy_axes(source_ax, self.ax)
+        self.ax.grid(True, which="both")
+        self.ax.xaxis.set_major_formatter(source_ax.xaxis.get_major_formatter())
+        self.ax.xaxis.set_major_locator(source_ax.xaxis.get_major_locator())
+        self.ax.yaxis.set_major_formatter(source_ax.yaxis.get_major_formatter())
+        self.ax.yaxis.set_major_locator(source_ax.yaxis.get_major_locator())
+        self.pairs.append((source_ax, self.ax))
+
+    def _copy_axes(self, src, dst):
+        dst.set_xscale(src.get_xscale())
+        dst.set_yscale(src.get_yscale())
+        dst.set_ylabel(src.get_ylabel())
+        dst.set_xlabel(src.get_xlabel())
+        dst.set_title(src.get_title())
+        dst.tick_params(axis='y', labelcolor=src.yaxis.get_label().get_color())
+
+    def _add_twin(self, src):
+        twin = self.ax.twinx()
+        orig_pos = src.spines["right"].get_position()
+        if orig_pos != ('outward', 0.0):
+            twin.spines["right"].set_position(orig_pos)
+            twin.set_frame_on(True)
+            twin.patch.set_visible(False)
+        self._copy_axes(src, twin)
+        twin.set_xlabel("")
+        twin.set_title("")
+        # --- DESACTIVA la grilla en los twins ---
+        twin.grid(False)
+        for gridline in twin.get_ygridlines() + twin.get_xgridlines():
+            gridline.set_visible(False)
+        self.pairs.append((src, twin))
+
+    def sync(self, show_legend=True):
+        """
+        Lleva la vista al estado del subplot de origen.
+
+        Returns:
+            True si se agregaron líneas nuevas
+        """
+        known = {src for src, _ in self.pairs}
+        for twin in twin_axes_of(self.source):
+            if twin not in known:
+                self._add_twin(twin)
+
+        added = False
+        for src_ax, dst_ax in self.pairs:
+            for line in src_ax.get_lines():
+                copy = self.lines.get(line)
+                data = full_data(line)                                  # Resolución completa aunque el grid esté reducido
+                if copy is None:
+                    copy, = dst_ax.plot(*data,
+                                        color=line.get_color(),
+                                        linestyle=line.get_linestyle(),
+                                        linewidth=line.get_linewidth(),
+                                        label=line.get_label())
+                    self.lines[line] = copy
+                    added = True
+                elif data[0] is not self._data[line][0] or data[1] is not self._data[line][1]:
+                    copy.set_data(*data)                                # El origen cambió con set_data
+                self._data[line] = data
+                copy.set_visible(line.get_visible())
+            dst_ax.set_xlim(src_ax.get_xlim())
+            dst_ax.set_ylim(src_ax.get_ylim())
+
+        removed = self.prune()
+
+        # Leyenda combinada (eje principal + twins), solo cuando cambia el conjunto de líneas
+        if added or removed or self.ax.get_legend() is None:
+            handles = [copy for copy in self.lines.values()
+                       if copy.get_label() and not copy.get_label().startswith('_')]
+            if handles:
+                self.ax.legend(handles, [h.get_label() for h in handles], fontsize=8, loc="best")
+        legend = self.ax.get_legend()
+        if legend:
+            legend.set_visible(show_legend)
+        return added
+
+    def prune(self):
+        # Quita las copias de líneas eliminadas del origen (y sus datos) y devuelve las líneas de origen quitadas.
+        removed = [l for l in self.lines if l.axes is None]
+        for line in removed:
+            self.lines.pop(line).remove()
+            self._data.pop(line)
+        return removed
+
+#====================================================================================================================================
+# -------------------------------
+# Actualización de las líneas de una simulación (refinamiento progresivo)
+# -------------------------------
+
+def plot_series(result):
+    """
+    Datos (x, y) de cada línea en el mismo orden en que plot_all devuelve las líneas de una simulación:
+    primero los subplots 0..8 y luego los twins (Z, SPL, velocidad, aceleración, potencia acústica, fuerza).
+
+    Args:
+        result: dict con las claves de los argumentos de plot_all (core.simulation)
+    """
+    f = result["frequencies"]
+    t_ms = result["step_t"] * 1000
+    if result.get("SPL_cone") is not None and result.get("SPL_port") is not None:
+        spl = [(f, result["SPL_cone"]), (f, result["SPL_port"]), (f, result["SPL_total"])]
+    else:
+        spl = [(f, result["SPL_total"])]
+    return ([(f, result["Z_magnitude"])] + spl + [
+        (f, result["displacements_mm"]),
+        (f, result["velocities"]),
+        (f, result["P_real"]), (f, result["P_reactiva"]), (f, result["P_aparente"]),
+        (f, result["group_delay_vals"] * 1000),
+        (t_ms, result["step_x"]),
+        (f, result["efficiency_val"]),
+        (f, result["excursion_mm"]), (f, np.full_like(f, result["xmax_mm"])),
+        (f, result["Z_phase"]),
+        (f, result["SPL_phase"]),
+        (t_ms, result["step_v"]),
+        (t_ms, result["step_a"]),
+        (f, result["P_ac"]),
+        (f, result["cone_force_array"]),
+    ])
+
+def update_series(lines, result):
+    # Reemplaza con set_data los datos de las líneas de una simulación (sin crear artistas nuevos).
+    series = plot_series(result)
+    if len(series) != len(lines):
+        raise ValueError("Las líneas no corresponden a una simulación de plot_all.")
+    for line, (x, y) in zip(lines, series):
+        line.set_data(x, y)
+
+#====================================================================================================================================
+# -------------------------------
+# Reducción de nivel de detalle (LOD) de las líneas
+# -------------------------------
+
+_LOD_DATA = weakref.WeakKeyDictionary()                                 # línea → (x completo, y completo, x mostrado, y mostrado)
+
+def decimate_minmax(x, y, n_bins, xlim=None, log=False):
+    """
+    Índices a conservar de una curva para dibujarla en n_bins columnas (mín/máx por columna).
+
+    Cada columna conserva su mínimo y su máximo, así los picos y las muescas se mantienen exactos;
+    también se conservan los extremos del tramo y los puntos no finitos (cortes de la curva).
+
+    Args:
+        x: Abscisas ordenadas de forma creciente
+        y: Ordenadas
+        n_bins: Número de columnas (≈ ancho del eje en píxeles)
+        xlim: Rango visible (x0, x1); se conserva además un punto a cada lado para entrar al borde
+        log: Columnas de igual ancho en log10(x) (ejes de frecuencia)
+
+    Returns:
+        Índices crecientes de los puntos a dibujar
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.size
+    if n < 3 or np.any(np.diff(x) < 0):
+        return np.arange(n)                                             # Sin orden en x no hay columnas
+    i0, i1 = 0, n
+    if xlim is not None:
+        lo, hi = sorted(xlim)
+        i0 = max(np.searchsorted(x, lo, side="left") - 1, 0)
+        i1 = min(np.searchsorted(x, hi, side="right") + 1, n)
+    if i1 - i0 <= 2 * n_bins:
+        return np.arange(i0, i1)
+
+    xs, ys = x[i0:i1], y[i0:i1]
+    if log and xs[0] > 0:
+        xs = np.log10(xs)
+    span = xs[-1] - xs[0]
+    if span <= 0:
+        return np.arange(i0, i1)
+    bins = np.minimum(((xs - xs[0]) / span * n_bins).astype(int), n_bins - 1)
+
+    finite = np.flatnonzero(np.isfinite(ys))
+    order = finite[np.lexsort((ys[finite], bins[finite]))]              # Por columna y, dentro de ella, por y
+    b = bins[order]
+    change = b[1:] != b[:-1]
+    first = np.concatenate(([True], change))                            # Mínimo de cada columna
+    last = np.concatenate((change, [True]))                             # Máximo de cada columna
+    keep = np.concatenate((order[first], order[last], np.flatnonzero(~np.isfinite(ys)), [0, ys.size - 1]))
+    return np.unique(keep) + i0
+
+def full_data(line):
+    # Datos de resolución completa de una línea (los de la caché LOD si la línea está reducida).
+    x, y = line.get_xdata(orig=True), line.get_ydata(orig=True)
+    cached = _LOD_DATA.get(line)
+    if cached is not None and x is cached[2] and y is cached[3]:
+        return cached[0], cached[1]
+    return x, y
+
+def _root_buffer(array):
+    # Arreglo dueño de la memoria de array (las vistas comparten la de su base).
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+def lines_nbytes(lines, exclude=()):
+    """
+    Bytes de los arreglos que mantienen vivos unas líneas de matplotlib.
+
+    Cuenta los datos mostrados, los de resolución completa de la caché LOD y los vértices (N, 2)
+    que cada Line2D arma al dibujarse. Cada buffer se cuenta una vez aunque lo compartan varias
+    líneas (p. ej. una línea del grid y su copia en una pestaña).
+
+    Args:
+        lines: Iterable de Line2D
+        exclude: Arreglos ya contabilizados en otro lado (p. ej. las curvas del historial)
+    """
+    seen = {id(_root_buffer(a)) for a in exclude if isinstance(a, np.ndarray)}
+    total = 0
+    for line in lines:
+        arrays = (*full_data(line), line.get_xdata(orig=True), line.get_ydata(orig=True),
+                  line.get_xydata(), line.get_path().vertices)
+        for array in arrays:
+            if not isinstance(array, np.ndarray):
+                continue
+            root = _root_buffer(array)
+            if id(root) not in seen:
+                seen.add(id(root))
+                total += root.nbytes
+    return total
+
+class LineDecimator:
+    """
+    Mantiene las líneas de una figura reducidas a ~2 puntos por píxel de ancho de su eje.
+
+    Los arreglos completos quedan en caché: al hacer zoom o pan (xlim_changed) o al cambiar el tamaño
+    de la figura se vuelve a reducir desde ellos, así el detalle aparece al acercarse. Si otro código
+    cambia la línea con set_data, esos datos pasan a ser los nuevos datos completos.
+    Las líneas animadas (vista previa en vivo) no se tocan.
+    """
+
+    def __init__(self, fig, points_per_px=1.0):
+        self.fig = fig
+        self.points_per_px = points_per_px
+        self._axes = set()
+        self._keys = weakref.WeakKeyDictionary()                        # línea → estado de la última reducción
+        self._cid = fig.canvas.mpl_connect("resize_event", lambda event: self.refresh())
+
+    def _watch(self, ax):
+        if ax not in self._axes:
+            self._axes.add(ax)
+            ax.callbacks.connect("xlim_changed", self._on_xlim)
+
+    def _on_xlim(self, ax):
+        # Zoom/pan: se reducen los ejes que comparten x (el eje y sus twins).
+        self.refresh(ax.get_shared_x_axes().get_siblings(ax))
+
+    def decimate(self, line):
+        ax = line.axes
+        x, y = full_data(line)
+        xlim = ax.get_xlim()
+        n_bins = max(int(ax.bbox.width * self.points_per_px), 16)
+        key = (id(x), id(y), xlim, n_bins, ax.get_xscale())
+        if self._keys.get(line) == key:
+            return                                                      # Nada cambió desde la última reducción
+        idx = decimate_minmax(x, y, n_bins, xlim, log=ax.get_xscale() == "log")
+        x, y = np.asarray(x), np.asarray(y)
+        line.set_data(x[idx], y[idx])
+        _LOD_DATA[line] = (x, y, line.get_xdata(orig=True), line.get_ydata(orig=True))
+        self._keys[line] = key
+
+    def refresh(self, axes=None):
+        """
+        Reduce las líneas de los ejes dados (por defecto todos los de la figura).
+
+        Se llama después de agregar líneas o de actualizarlas con set_data, antes de dibujar.
+        """
+        for ax in (self.fig.axes if axes is None else axes):
+            self._watch(ax)
+            for line in ax.get_lines():
+                if not line.get_animated():
+                    self.decimate(line)
+
+#====================================================================================================================================
+# -------------------------------
+# Cursor de desplazamiento indexado (reemplaza a mplcursors en el grid y las pestañas)
+# -------------------------------
+
+class HoverCursor:
+    """
+    Cursor que marca el punto más cercano al mouse entre las líneas visibles de una figura.
+
+    Por cada eje se guarda un índice con las x ordenadas de todas sus líneas concatenadas
+    (clave = número de línea + x normalizada), así una sola búsqueda searchsorted ubica al mouse
+    en todas las líneas a la vez: O(log N) por línea, sin recorrer los puntos. Los candidatos
+    (vecino izquierdo y derecho de cada línea) se comparan en píxeles de forma vectorizada.
+    Una única anotación animada se dibuja con blitting sobre el fondo guardado de la figura.
+    El índice se reconstruye tras cada dibujo completo (líneas nuevas, set_data, LOD).
+    """
+
+    def __init__(self, fig):
+        from matplotlib.lines import Line2D
+        from matplotlib.transforms import IdentityTransform
+        self.fig = fig
+        self._index = None
+        self._background = None
+        self.annotation = fig.text(0, 0, "", fontsize=8, visible=False, animated=True,
+                                   transform=IdentityTransform(), zorder=10,
+                                   bbox=dict(boxstyle="round", fc="lightyellow", alpha=0.9))
+        self.marker = Line2D([0], [0], marker="o", markersize=6, markerfacecolor="none",
+                             color="black", visible=False, animated=True, transform=IdentityTransform())
+        fig.add_artist(self.marker)
+        self._cids = [fig.canvas.mpl_connect("draw_event", self._on_draw),
+                      fig.canvas.mpl_connect("motion_notify_event", self._on_move),
+                      fig.canvas.mpl_connect("figure_leave_event", lambda event: self._hide())]
+
+    # --- Índice ---
+
+    def _build_axes(self, ax):
+        log = ax.get_xscale() == "log"
+        lines, xs, us, ys, ids = [], [], [], [], []
+        for line in ax.get_lines():
+            if line.get_animated():
+                continue                                                # Vista previa en vivo
+            x, y = (np.asarray(a, dtype=float) for a in full_data(line))
+            ok = np.isfinite(x) & np.isfinite(y) & ((x > 0) if log else True)
+            x, y = x[ok], y[ok]
+            if x.size == 0:
+                continue
+            if np.any(np.diff(x) < 0):
+                order = np.argsort(x, kind="stable")
+                x, y = x[order], y[order]
+            xs.append(x)
+            us.append(np.log10(x) if log else x)
+            ys.append(y)
+            ids.append(np.full(x.size, len(lines)))
+            lines.append(line)
+        if not lines:
+            return None
+        u = np.concatenate(us)
+        u0, span = u.min(), max(np.ptp(u), 1e-12)
+        counts = np.array([a.size for a in us])
+        ends = np.cumsum(counts)
+        return {
+            "lines": lines, "log": log, "u0": u0, "span": span,
+            "keys": np.concatenate(ids) + (u - u0) / span * 0.5,       # Ordenada: línea y luego x
+            "x": np.concatenate(xs), "y": np.concatenate(ys),
+            "starts": ends - counts, "ends": ends,
+        }
+
+    def rebuild(self):
+        self._index = {}
+        for ax in self.fig.axes:
+            entry = self._build_axes(ax)
+            if entry is not None:
+                self._index[ax] = entry
+
+    def nearest(self, ax, entry, px, py):
+        """
+        Punto visible más cercano (en píxeles) a (px, py) entre las líneas del eje.
+
+        Returns:
+            (distancia, línea, x, y) o None si no hay líneas visibles
+        """
+        xm = ax.transData.inverted().transform((px, py))[0]
+        um = np.log10(xm) if entry["log"] else xm
+        if not np.isfinite(um):
+            return None
+        n = len(entry["lines"])
+        q = np.arange(n) + np.clip((um - entry["u0"]) / entry["span"] * 0.5, 0, 0.5)
+        pos = np.searchsorted(entry["keys"], q)                         # Una búsqueda por línea, vectorizada
+        lo, hi = entry["starts"], entry["ends"] - 1
+        cand = np.concatenate((np.clip(pos - 1, lo, hi), np.clip(pos, lo, hi)))
+        owner = np.tile(np.arange(n), 2)
+        visible = np.array([line.get_visible() for line in entry["lines"]])[owner]
+        if not visible.any():
+            return None
+        cand, owner = cand[visible], owner[visible]
+        pts = ax.transData.transform(np.column_stack((entry["x"][cand], entry["y"][cand])))
+        d = np.hypot(pts[:, 0] - px, pts[:, 1] - py)
+        k = np.argmin(d)
+        return d[k], entry["lines"][owner[k]], entry["x"][cand[k]], entry["y"][cand[k]]
+
+    # --- Eventos ---
+
+    def _on_draw(self, event):
+        self._index = None                                              # Los datos pudieron cambiar
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        if self.annotation.get_visible():
+            self.fig.draw_artist(self.marker)
+            self.fig.draw_artist(self.annotation)
+
+    def _blit(self):
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._draw_artists()
+        canvas.blit(self.fig.bbox)
+
+    def _hide(self):
+        if self.annotation.get_visible():
+            self.annotation.set_visible(False)
+            self.marker.set_visible(False)
+            self._blit()
+
+    def _on_move(self, event):
+        if event.inaxes is None or event.x is None:
+            self._hide()
+            return
+        if self._index is None:
+            self.rebuild()
+        best = None
+        for ax, entry in self._index.items():
+            if ax.get_visible() and ax.bbox.contains(event.x, event.y):  # El eje bajo el mouse y sus twins
+                hit = self.nearest(ax, entry, event.x, event.y)
+                if hit is not None and (best is None or hit[0] < best[1][0]):
+                    best = (ax, hit)
+        if best is None:
+            self._hide()
+            return
+        ax, (_, line, x, y) = best
+        px, py = ax.transData.transform((x, y))
+        x_unit = "Hz" if ax.get_xscale() == "log" else "ms"
+        self.marker.set_data([px], [py])
+        self.marker.set_color(line.get_color())
+        self.annotation.set_text(f"{line.get_label()}\nX: {x:.2f} {x_unit}\nY: {y:.2f} {cursor_units(line.get_label())}")
+        self.annotation.set_position((px + 10, py + 10))
+        self.annotation.set_horizontalalignment("right" if px > self.fig.bbox.width * 0.6 else "left")
+        self.annotation.set_visible(True)
+        self.marker.set_visible(True)
+        self._blit()
+
+    def remove(self):
+        for cid in self._cids:
+            self.fig.canvas.mpl_disconnect(cid)
+        self.annotation.remove()
+        self.marker.remove()
+        self.fig.canvas.draw_idle()
+
+#====================================================================================================================================
+# -------------------------------
+# Vista previa en vivo sobre el grid (blitting)
+# -------------------------------
+
+# (subplot, clave x, clave y, escala x, escala y) con las mismas unidades que plot_all
+LIVE_CURVES = (
+    (0, "frequencies", "Z_magnitude", 1, 1),
+    (1, "frequencies", "SPL_total", 1, 1),
+    (2, "frequencies", "displacements_mm", 1, 1),
+    (3, "frequencies", "velocities", 1, 1),
+    (4, "frequencies", "P_real", 1, 1),
+    (5, "frequencies", "group_delay_vals", 1, 1000),                   # s → ms
+    (6, "step_t", "step_x", 1000, 1),                                   # s → ms
+    (7, "frequencies", "efficiency_val", 1, 1),
+    (8, "frequencies", "excursion_mm", 1, 1),
+)
+
+class LivePreview:
+    """
+    Curvas de vista previa (una por subplot) que se actualizan con set_data y blitting.
+
+    Mientras se arrastra un control, solo se redibujan estas líneas sobre el fondo guardado del grid;
+    al soltarlo la GUI las quita con remove() y el diseño elegido se simula como una corrida normal.
+    """
+
+    def __init__(self, fig, axs, color="black", linewidth=1.2):
+        self.fig = fig
+        self.lines = [axs[i].plot([], [], color=color, linewidth=linewidth, label="_vista previa", animated=True)[0]
+                      for i, *_ in LIVE_CURVES]
+        self._background = None
+        self._cid = fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _set_data(self, result):
+        for line, (_, xkey, ykey, sx, sy) in zip(self.lines, LIVE_CURVES):
+            line.set_data(np.asarray(result[xkey]) * sx, np.asarray(result[ykey]) * sy)
+
+    def _on_draw(self, event):
+        # Tras cada dibujo completo se guarda el fondo (sin las líneas animadas) y se dibujan encima.
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for line in self.lines:
+            if line.get_animated():
+                line.axes.draw_artist(line)
+
+    def update(self, result):
+        # Vista previa rápida: restaura el fondo, dibuja solo las líneas y hace blit.
+        self._set_data(result)
+        canvas = self.fig.canvas
+        if not all(line.get_animated() for line in self.lines):
+            for line in self.lines:
+                line.set_animated(True)
+            self._background = None
+        if self._background is None:
+            canvas.draw()                                               # Primer cuadro: guarda el fondo en _on_draw
+            return
+        canvas.restore_region(self._background)
+        self._draw_lines()
+        canvas.blit(self.fig.bbox)
+
+    def remove(self):
+        self.fig.canvas.mpl_disconnect(self._cid)
+        for line in self.lines:
+            line.remove()
+        self.fig.canvas.draw_idle()
+
+#====================================================================================================================================
+# -------------------------------
+# Familias de curvas de un barrido de parámetro (core.simulation.simulate_family)
+# -------------------------------
+
+# Subplots en frecuencia que muestran la familia (mismas claves y escalas que la vista previa en vivo)
+FAMILY_CURVES = tuple(curve for curve in LIVE_CURVES if curve[1] == "frequencies")
+
+def _family_cax_box(parent):
+    # Caja (coordenadas de figura) de la barra de colores: franja sobre el borde superior izquierdo del subplot.
+    from matplotlib.transforms import Bbox
+    box = parent.get_position()
+    return Bbox.from_bounds(box.x0, box.y1 + 0.03 * box.height, 0.22 * box.width, 0.035 * box.height)
+
+class FamilyOverlay:
+    """
+    Familia de curvas dibujada como una LineCollection por subplot, coloreada por el valor del parámetro.
+
+    Cada subplot recibe un único artista con las m curvas (en vez de m Line2D con sus checkboxes) y el
+    primero una barra de colores con el parámetro barrido, en un eje propio sobre el subplot
+    (no le quita espacio al grid); remove() deja el grid como estaba.
+    """
+
+    def __init__(self, fig, axs, family, label="Parámetro", cmap="viridis", linewidth=1.0):
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import Normalize
+        self.fig = fig
+        values = np.asarray(family["values"], dtype=float)
+        self.norm = Normalize(vmin=values.min(), vmax=values.max())
+        f = np.asarray(family["frequencies"], dtype=float)
+        self.collections = []
+        for i, _, ykey, sx, sy in FAMILY_CURVES:
+            y = np.asarray(family[ykey], dtype=float) * sy
+            segments = np.stack(np.broadcast_arrays(f * sx, y), axis=-1)  # (m, n, 2)
+            lc = LineCollection(segments, cmap=cmap, norm=self.norm, linewidths=linewidth,
+                                label=f"_familia {label}")
+            lc.set_array(values)
+            axs[i].add_collection(lc, autolim=True)
+            axs[i].autoscale_view(scalex=False)                         # El eje x lo fija plot_all
+            self.collections.append(lc)
+        # Eje propio de la barra, ubicado sobre el primer subplot a la izquierda del título. Se agrega a la figura
+        # (no como inset) para no desplazar el título, y el localizador lo mantiene pegado al subplot.
+        parent = axs[FAMILY_CURVES[0][0]]
+        self.cax = fig.add_axes([0, 0, 1, 1], label="_familia barra")
+        self.cax.set_axes_locator(lambda cax, renderer: _family_cax_box(parent))
+        self.colorbar = fig.colorbar(self.collections[0], cax=self.cax, orientation="horizontal")
+        self.cax.xaxis.set_ticks_position("top")
+        self.cax.tick_params(labelsize=6, pad=1)
+        self.cax.set_ylabel(label, rotation=0, ha="right", va="center", fontsize=7)  # A la izquierda de la barra
+        fig.canvas.draw_idle()
+
+    def remove(self):
+        self.cax.remove()                                               # La barra vive en su propio eje
+        for lc in self.collections:
+            lc.remove()
+        self.fig.canvas.draw_idle()
+
+#====================================================================================================================================
+# -------------------------------
+# Cascada (CSD) y decaimiento de ráfagas (core.decay)
+# -------------------------------
+
+def plot_waterfall(result, fig=None, f_range=(20, 1000), floor_db=-40):
+    # Cascada 3D: una curva por rebanada (frecuencia log, tiempo en ms, nivel en dB recortado a floor_db).
+    fig = fig or plt.figure()
+    ax = fig.add_subplot(111, projection="3d")
+    mask = (result["f"] >= f_range[0]) & (result["f"] <= f_range[1])
+    logf = np.log10(result["f"][mask])
+    levels = np.maximum(result["level_db"][:, mask], floor_db)
+    cmap = plt.get_cmap("viridis")
+    for i in range(len(result["t"]) - 1, -1, -1):                      # De atrás hacia adelante
+        ax.plot(logf, np.full_like(logf, result["t"][i] * 1000), levels[i], color=cmap(i / max(len(result["t"]) - 1, 1)), linewidth=0.8)
+    ax.set_xlabel("Frecuencia [Hz]", fontsize=7)
+    ax.set_ylabel("Tiempo [ms]", fontsize=7)
+    ax.set_zlabel("Nivel [dB]", fontsize=7)
+    ax.set_zlim(floor_db, 0)
+    ticks = [f for f in (20, 50, 100, 200, 500, 1000, 2000, 5000) if f_range[0] <= f <= f_range[1]]
+    ax.set_xticks(np.log10(ticks))
+    ax.set_xticklabels([str(f) for f in ticks], fontsize=6)
+    ax.set_title("Decaimiento espectral acumulado", fontsize=8)
+    return fig, ax
+
+def plot_burst_decay(result, fig=None, floor_db=-40):
+    # Mapa de decaimiento de ráfagas: frecuencia vs. periodos después de la ráfaga, color = nivel en dB.
+    fig = fig or plt.figure()
+    ax = fig.add_subplot(111)
+    mesh = ax.pcolormesh(result["f"], result["periods"], np.maximum(result["level_db"], floor_db).T,
+                         shading="nearest", cmap="magma", vmin=floor_db, vmax=0)
+    ax.set_xscale("log")
+    ax.set_xlabel("Frecuencia [Hz]", fontsize=7)
+    ax.set_ylabel("Periodos tras la ráfaga", fontsize=7)
+    ax.set_title("Decaimiento de ráfagas", fontsize=8)
+    fig.colorbar(mesh, ax=ax, label="Nivel [dB]")
+    return fig, ax
+
 if __name__ == "__main__":
     # Ejemplo de datos ficticios para evitar error de variable no definida
     results = {
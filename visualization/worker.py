@@ -0,0 +1,168 @@
+# --------------------------------------------
+# worker.py
+# Ejecución de simulaciones en segundo plano para la GUI Qt5 (QThreadPool + QRunnable).
+# Cada trabajo lleva un identificador; al lanzar uno nuevo se cancela el anterior y los resultados
+# de trabajos reemplazados se descartan, así la ventana sigue respondiendo durante el barrido.
+# --------------------------------------------
+
+import time                                                             # Importa time para medir el tiempo transcurrido
+import threading                                                        # Importa threading para la bandera de cancelación
+import traceback                                                        # Importa traceback para reportar errores del hilo
+import inspect                                                          # Importa inspect para detectar generadores
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from core.simulation import SimulationCancelled
+
+#====================================================================================================================================
+#====================================================================================================================================
+#====================================================================================================================================
+
+class WorkerSignals(QObject):
+    # Señales del trabajo (se entregan en el hilo principal): id del trabajo + dato.
+    progress = pyqtSignal(int, float)                                   # Fracción completada 0..1
+    partial = pyqtSignal(int, object)                                   # Resultado parcial (barridos progresivos)
+    finished = pyqtSignal(int, object)                                  # Resultado de la función
+    failed = pyqtSignal(int, str)                                       # Traza del error
+    cancelled = pyqtSignal(int)
+
+class SimulationWorker(QRunnable):
+    """
+    Ejecuta fn(*args, progress=..., cancelled=..., **kwargs) en un hilo del QThreadPool.
+
+    fn debe llamar a progress(fracción) entre etapas y consultar cancelled() (ver core.simulation).
+    Si fn es un generador (core.simulation.progressive_sweep) cada valor se emite como parcial
+    y el último es el resultado final.
+    """
+
+    def __init__(self, job_id, fn, *args, **kwargs):
+        super().__init__()
+        self.job_id = job_id
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, progress=lambda x: self.signals.progress.emit(self.job_id, x),
+                             cancelled=self.is_cancelled, **self.kwargs)
+            if inspect.isgenerator(result):
+                stream, result = result, None
+                for result in stream:
+                    if self.is_cancelled():
+                        stream.close()
+                        break
+                    self.signals.partial.emit(self.job_id, result)
+        except SimulationCancelled:
+            self.signals.cancelled.emit(self.job_id)
+            return
+        except Exception:
+            self.signals.failed.emit(self.job_id, traceback.format_exc())
+            return
+        if self.is_cancelled():
+            self.signals.cancelled.emit(self.job_id)
+        else:
+            self.signals.finished.emit(self.job_id, result)
+
+#====================================================================================================================================
+
+class SimulationRunner(QObject):
+    """
+    Despacha trabajos al QThreadPool global, cancela los reemplazados y mide el tiempo transcurrido.
+
+    Solo el trabajo más reciente emite result/error; progress y elapsed alimentan la barra de estado.
+    """
+    progress = pyqtSignal(int)                                          # Porcentaje del trabajo vigente
+    partial = pyqtSignal(object, object)                                # (contexto, resultado parcial)
+    elapsed = pyqtSignal(float)                                         # Segundos desde que empezó el trabajo vigente
+    result = pyqtSignal(object, object)                                 # (contexto, resultado)
+    error = pyqtSignal(object, str)                                     # (contexto, traza)
+    busy = pyqtSignal(bool)
+
+    def __init__(self, parent=None, pool=None, interval_ms=100):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._job_id = 0
+        self._worker = None
+        self._context = None
+        self._started = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(lambda: self.elapsed.emit(time.perf_counter() - self._started))
+
+    def submit(self, fn, *args, context=None, **kwargs):
+        """
+        Lanza fn en segundo plano y cancela el trabajo anterior si sigue en curso.
+
+        Args:
+            fn: Función de cálculo (p. ej. core.simulation.simulate_driver)
+            context: Dato opaco que se devuelve junto al resultado (nombre, clave de simulación, ...)
+
+        Returns:
+            Identificador del trabajo
+        """
+        self.cancel()
+        self._job_id += 1
+        worker = SimulationWorker(self._job_id, fn, *args, **kwargs)
+        worker.signals.progress.connect(self._on_progress)
+        worker.signals.partial.connect(self._on_partial)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.failed.connect(self._on_failed)
+        worker.signals.cancelled.connect(self._on_cancelled)
+        self._worker, self._context = worker, context
+        self._started = time.perf_counter()
+        self._timer.start()
+        self.busy.emit(True)
+        self.pool.start(worker)
+        return self._job_id
+
+    def cancel(self):
+        # Cancela el trabajo vigente (sus señales posteriores se ignoran).
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            self._stop()
+
+    def is_busy(self):
+        return self._worker is not None
+
+    def pending_context(self):
+        return self._context if self._worker is not None else None
+
+    def _current(self, job_id):
+        return self._worker is not None and job_id == self._job_id
+
+    def _stop(self):
+        self._timer.stop()
+        self.busy.emit(False)
+
+    def _on_progress(self, job_id, fraction):
+        if self._current(job_id):
+            self.progress.emit(int(round(100 * fraction)))
+
+    def _on_partial(self, job_id, value):
+        if self._current(job_id):
+            self.partial.emit(self._context, value)
+
+    def _on_finished(self, job_id, value):
+        if self._current(job_id):
+            context, self._worker = self._context, None
+            self.elapsed.emit(time.perf_counter() - self._started)
+            self._stop()
+            self.result.emit(context, value)
+
+    def _on_failed(self, job_id, message):
+        if self._current(job_id):
+            context, self._worker = self._context, None
+            self._stop()
+            self.error.emit(context, message)
+
+    def _on_cancelled(self, job_id):
+        if self._current(job_id):                                       # Cancelado sin reemplazo
+            self._worker = None
+            self._stop()